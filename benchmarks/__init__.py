@@ -0,0 +1,18 @@
+"""
+Benchmarks for dictos, compatible with airspeed velocity (asv).
+"""
+
+import sys
+
+
+def clear_caches():
+    """
+    clear all caches of functions in dictos,
+    so that a benchmark measures derivation from scratch.
+    """
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("dictos") or module is None:
+            continue
+        for attribute in vars(module).values():
+            if callable(getattr(attribute, "cache_clear", None)):
+                attribute.cache_clear()
@@ -0,0 +1,176 @@
+"""
+Run benchmarks without asv, and record or compare baselines.
+
+Usage:
+    python -m benchmarks.baseline record [-b REGEX] [-o FILE]
+    python -m benchmarks.baseline compare [-b REGEX] [-i FILE] [--factor FACTOR]
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import re
+import sys
+import time
+
+import benchmarks
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+_REPEAT = 3
+_MIN_DURATION = 0.05  # seconds to determine the number of calls per sample.
+_NOISE_FLOOR = 1e-4  # seconds below which differences are ignored.
+
+
+def discover(pattern: str = None):
+    """
+    discover benchmarks in the same manner as asv.
+
+    Args:
+        pattern (str, optional): regular expression to select benchmarks
+            by name. Defaults to None, which selects all benchmarks.
+
+    Yields:
+        tuple: name, class, method name and parameters of each benchmark.
+    """
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+
+        for cls_name, cls in vars(module).items():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+
+            params = getattr(cls, "params", [])
+            if len(getattr(cls, "param_names", [])) <= 1:
+                params = [params] if params else []
+            # asv accepts a flat list of parameters for a single parameter.
+
+            for method in sorted(m for m in dir(cls) if m.startswith("time_")):
+                for p in itertools.product(*params):
+                    name = f"{info.name}.{cls_name}.{method}({', '.join(map(repr, p))})"
+                    if pattern is None or re.search(pattern, name):
+                        yield name, cls, method, p
+
+
+def measure(cls, method: str, params: tuple):
+    """
+    measure the minimum time per call of a benchmark.
+    `setup` is called before each sample as in asv.
+
+    Args:
+        cls (type): benchmark class.
+        method (str): name of the timing method.
+        params (tuple): parameters.
+
+    Returns:
+        float or None: seconds per call, or None if the benchmark is skipped.
+    """
+    number = getattr(cls, "number", 0)
+    samples = []
+    for _ in range(_REPEAT):
+        instance = cls()
+        try:
+            if hasattr(instance, "setup"):
+                instance.setup(*params)
+        except NotImplementedError:
+            return None
+            # skipped in the same manner as asv.
+        func = getattr(instance, method)
+
+        if number <= 0:
+            number = 1
+            while True:
+                start = time.perf_counter()
+                for _ in range(number):
+                    func(*params)
+                if time.perf_counter() - start >= _MIN_DURATION:
+                    break
+                number *= 10
+            # determine the number of calls like `timeit.Timer.autorange`.
+
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*params)
+        samples.append((time.perf_counter() - start) / number)
+
+    return min(samples)
+
+
+def run(pattern: str = None) -> dict:
+    """
+    run benchmarks.
+
+    Args:
+        pattern (str, optional): regular expression to select benchmarks.
+
+    Returns:
+        dict: seconds per call for each benchmark name.
+    """
+    results = {}
+    for name, cls, method, params in discover(pattern):
+        elapsed = measure(cls, method, params)
+        if elapsed is not None:
+            results[name] = elapsed
+            print(f"{name:<80} {elapsed:.3e} s", flush=True)
+
+    return results
+
+
+def compare(results: dict, baseline: dict, factor: float) -> list:
+    """
+    find benchmarks slower than the baseline by more than `factor`.
+
+    Args:
+        results (dict): seconds per call for each benchmark name.
+        baseline (dict): recorded seconds per call.
+        factor (float): allowed ratio of the time to the baseline.
+
+    Returns:
+        list of tuple: name, time, baseline time of regressed benchmarks.
+    """
+    return [
+        (name, elapsed, baseline[name])
+        for name, elapsed in results.items()
+        if name in baseline
+        and elapsed > factor * baseline[name]
+        and elapsed - baseline[name] > _NOISE_FLOOR
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.baseline")
+    parser.add_argument("command", choices=["record", "compare"])
+    parser.add_argument("-b", "--bench", help="regular expression to select")
+    parser.add_argument("-o", "--output", default=DEFAULT_BASELINE)
+    parser.add_argument("-i", "--input", default=DEFAULT_BASELINE)
+    parser.add_argument("--factor", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    results = run(args.bench)
+
+    if args.command == "record":
+        baseline = {}
+        if args.bench is not None and os.path.exists(args.output):
+            with open(args.output) as f:
+                baseline = json.load(f)
+            # update selected entries only.
+        baseline.update(results)
+        with open(args.output, "w") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=1)
+        return 0
+
+    with open(args.input) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.factor)
+    for name, elapsed, base in regressions:
+        print(f"REGRESSION {name}: {elapsed:.3e} s > {args.factor} x {base:.3e} s")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Benchmarks for functions applying coefficients to arrays
+"""
+
+import numpy as np
+
+from dictos.filter import filter as flt
+from dictos.poly import interpolation as intp
+from dictos.poly import multigrid as mg
+from dictos.poly.barycentric import BarycentricInterpolator
+from dictos.calculus import quadrature
+from dictos.reconstruction import weno
+
+
+class Application1D:
+    """
+    application to one-dimensional arrays.
+    Tables are derived in setup, so only the application is measured.
+    """
+
+    params = [10**3, 10**4, 10**5, 10**6]
+    param_names = ["size"]
+
+    def setup(self, size):
+        rng = np.random.default_rng(0)
+        self.array = rng.standard_normal(size)
+        self.odd = rng.standard_normal(size + 1)
+        self.out = np.empty_like(self.array)
+        self.interpolator = BarycentricInterpolator(np.linspace(-1, 1, 8))
+        self.values = rng.standard_normal(8)
+        self.targets = np.linspace(-1, 1, size)
+
+        for func in [
+            self.time_filter_apply,
+            self.time_filter_apply_compact,
+            self.time_to_cell_centers,
+            self.time_weno_js,
+            self.time_weno_z,
+            self.time_integrate,
+            self.time_prolong,
+            self.time_restrict,
+        ]:
+            func(size)
+        # derive and cache tables.
+
+    def time_filter_apply(self, size):
+        flt.apply(self.array, acc=8, out=self.out)
+
+    def time_filter_apply_compact(self, size):
+        flt.apply_compact(self.array, acc=4, alpha=0.45, out=self.out)
+
+    def time_to_cell_centers(self, size):
+        intp.to_cell_centers(self.array, acc=6)
+
+    def time_weno_js(self, size):
+        weno.reconstruct(self.array, order=5, variant="js")
+
+    def time_weno_z(self, size):
+        weno.reconstruct(self.array, order=5, variant="z")
+
+    def time_integrate(self, size):
+        quadrature.integrate(self.array, order=6)
+
+    def time_prolong(self, size):
+        mg.prolong(self.array, acc=4)
+
+    def time_restrict(self, size):
+        mg.restrict(self.odd, acc=4)
+
+    def time_barycentric(self, size):
+        self.interpolator(self.values, self.targets)
+
+
+class Application2D:
+    params = [64, 256, 1024]
+    param_names = ["size"]
+
+    def setup(self, size):
+        rng = np.random.default_rng(0)
+        self.array = rng.standard_normal((size, size))
+        self.time_filter_apply(size)
+        self.time_weno_js(size)
+
+    def time_filter_apply(self, size):
+        flt.apply(self.array, acc=8, axis=(0, 1))
+
+    def time_weno_js(self, size):
+        weno.reconstruct(self.array, order=5, axis=0)
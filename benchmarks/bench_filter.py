@@ -0,0 +1,33 @@
+"""Benchmarks for distos.filter.filter
+"""
+
+from dictos.filter import filter as flt
+
+from benchmarks import clear_caches
+
+
+class Generate:
+    params = [2, 4, 8, 16, 40]
+    param_names = ["acc"]
+    number = 1
+
+    def setup(self, acc):
+        clear_caches()
+
+    def time_generate(self, acc):
+        flt.generate(acc)
+
+    def time_generate_equation(self, acc):
+        flt.generate(acc, as_equation=True)
+
+
+class GenerateCompact:
+    params = [2, 4, 6, 8]
+    param_names = ["acc"]
+    number = 1
+
+    def setup(self, acc):
+        clear_caches()
+
+    def time_generate_compact(self, acc):
+        flt.generate_compact(acc, 0.45)
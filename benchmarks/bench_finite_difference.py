@@ -0,0 +1,95 @@
+"""Benchmarks for distos.calculus.finite_difference
+"""
+
+from dictos.calculus import finite_difference as fd
+from dictos.core.grid_type import GridType
+
+from benchmarks import clear_caches
+
+
+def _central_stencil(width: int) -> list:
+    half_width = width // 2
+    return list(range(-half_width, half_width + 1))
+
+
+def _staggered_stencil(width: int) -> list:
+    half_width = width // 2
+    return [s + 0.5 for s in range(-half_width, half_width)]
+
+
+class Coefficients:
+    """
+    derivation of coefficients on integer stencils.
+    """
+
+    params = ([3, 5, 9, 17, 41], [1, 2, 4, 8])
+    param_names = ["width", "deriv"]
+    number = 1
+
+    def setup(self, width, deriv):
+        if deriv >= width:
+            raise NotImplementedError
+            # skip derivatives vanishing on the stencil.
+        self.stencil = _central_stencil(width)
+        clear_caches()
+
+    def time_coefficients(self, width, deriv):
+        fd.coefficients(self.stencil, deriv)
+
+    def time_equation(self, width, deriv):
+        fd.equation(self.stencil, deriv)
+
+    def time_equation_lazy(self, width, deriv):
+        fd.equation(self.stencil, deriv, lazy=True)
+
+
+class CoefficientsOnStaggeredStencil:
+    """
+    derivation of coefficients on float stencils,
+    which goes through the symbolic Lagrangian polynomial.
+    """
+
+    params = ([2, 4, 8, 16], [1, 2, 4])
+    param_names = ["width", "deriv"]
+    number = 1
+
+    def setup(self, width, deriv):
+        if deriv >= width:
+            raise NotImplementedError
+        self.stencil = _staggered_stencil(width)
+        clear_caches()
+
+    def time_coefficients(self, width, deriv):
+        fd.coefficients(self.stencil, deriv)
+
+
+class TruncationError:
+    params = ([3, 5, 9, 17], [1, 2, 4])
+    param_names = ["width", "deriv"]
+    number = 1
+
+    def setup(self, width, deriv):
+        if deriv >= width:
+            raise NotImplementedError
+        self.stencil = _central_stencil(width)
+        clear_caches()
+
+    def time_truncation_error(self, width, deriv):
+        fd.truncation_error(self.stencil, deriv)
+
+
+class Generate:
+    params = (
+        ["regular", "cell-centered", "staggered"],
+        [1, 2, 4, 8],
+        [2, 4],
+    )
+    param_names = ["grid_type", "deriv", "acc"]
+    number = 1
+
+    def setup(self, grid_type, deriv, acc):
+        self.grid_type = GridType(grid_type)
+        clear_caches()
+
+    def time_generate(self, grid_type, deriv, acc):
+        fd.generate(deriv=deriv, acc=acc, grid_type=self.grid_type)
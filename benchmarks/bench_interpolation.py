@@ -0,0 +1,57 @@
+"""Benchmarks for distos.poly.interpolation
+"""
+
+from dictos.poly import interpolation as intp
+
+from benchmarks import clear_caches
+
+
+class Coefficients:
+    params = ([2, 4, 8, 16, 40], ["int", "float"])
+    param_names = ["width", "stencil"]
+    number = 1
+
+    def setup(self, width, stencil):
+        half_width = width // 2
+        if stencil == "int":
+            self.stencil = [s for s in range(-half_width, half_width + 1) if s != 0]
+        else:
+            if width > 16:
+                raise NotImplementedError
+                # the symbolic path is too slow for wide stencils.
+            self.stencil = [s + 0.5 for s in range(-half_width, half_width)]
+        clear_caches()
+
+    def time_coefficients(self, width, stencil):
+        intp.coefficients(self.stencil)
+
+    def time_equation(self, width, stencil):
+        intp.equation(self.stencil)
+
+
+class TruncationError:
+    params = [2, 4, 8]
+    param_names = ["width"]
+    number = 1
+
+    def setup(self, width):
+        half_width = width // 2
+        self.stencil = [s + 0.5 for s in range(-half_width, half_width)]
+        clear_caches()
+
+    def time_truncation_error(self, width):
+        intp.truncation_error(self.stencil)
+
+
+class CoefficientsAt:
+    params = ([4, 8, 16], [10, 1000])
+    param_names = ["width", "num_targets"]
+
+    def setup(self, width, num_targets):
+        import numpy as np
+
+        self.stencil = list(range(width))
+        self.targets = np.linspace(0, width - 1, num_targets)
+
+    def time_coefficients_at(self, width, num_targets):
+        intp.coefficients_at(self.stencil, self.targets)
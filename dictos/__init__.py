@@ -1,8 +1,40 @@
+from importlib import import_module
+
 from dictos.__version__ import __version__
-from dictos.core.expr import Expr
-from dictos.core.grid_type import GridType
-from dictos.poly import lagrangian_polynomial
-from dictos.series.taylor_expansion import taylor_series
-from dictos.calculus import finite_difference
-from dictos.poly import interpolation
-from dictos.filter import filter
+
+_LAZY_ATTRIBUTES = {
+    "Expr": ("dictos.core.expr", "Expr"),
+    "GridType": ("dictos.core.grid_type", "GridType"),
+    "StencilResult": ("dictos.core.result", "StencilResult"),
+    "lagrangian_polynomial": ("dictos.poly.lagrangian_polynomial", None),
+    "taylor_series": ("dictos.series.taylor_expansion", "taylor_series"),
+    "finite_difference": ("dictos.calculus.finite_difference", None),
+    "interpolation": ("dictos.poly.interpolation", None),
+    "filter": ("dictos.filter", None),
+    "reconstruction": ("dictos.reconstruction", None),
+    "profile": ("dictos.utilities.profiling", "profile"),
+    "verify": ("dictos.verify", None),
+}
+# modules and attributes imported on the first access,
+# so that `import dictos` does not import sympy.
+
+__all__ = ["__version__"] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module 'dictos' has no attribute '{name}'")
+
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+    # cache the value so that `__getattr__` is not called again.
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
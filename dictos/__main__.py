@@ -0,0 +1,5 @@
+import sys
+
+from dictos.cli import main
+
+sys.exit(main())
@@ -1,5 +1,6 @@
 import sympy as sp
 
+from dictos.utilities.profiling import profiled
 from dictos.defaults import (
     DEFAULT_DIFFERENTIAND,
     DEFAULT_INTERVAL,
@@ -10,8 +11,11 @@ from dictos.utilities.spec import (
     is_valid_accuracy_order_for_generating_central_form,
 )
 from dictos.discrete.stencil import (
+    Stencil,
     create_coordinate_symbols,
     create_differentiand_symbols,
+    has_exact_points,
+    exact_points,
 )
 from dictos.utilities.utils import (
     simplify_coefficients,
@@ -22,22 +26,31 @@ from dictos.utilities.utils import (
     is_even,
 )
 from dictos.linalg.linalg import dot_product, div
-from dictos.poly.lagrangian_polynomial import lagrangian_poly, derivative
-from dictos.series.taylor_expansion import taylor_series, derivative_symbol
+from dictos.poly.lagrangian_polynomial import (
+    lagrangian_poly,
+    derivative,
+    fornberg_weights,
+)
+from dictos.poly import hermite
+from dictos.series.taylor_expansion import derivative_symbol
+from dictos.series.power_series import PowerSeries, to_rational
 from dictos.calculus.exceptions import (
     UnsupportedOrderOfDerivativeError,
     InvalidOrderOfAccuracyForCentralFormError,
 )
 from dictos.core.expr import Expr
+from dictos.core.result import StencilResult
 from dictos.core.grid_type import GridType
 
 
+@profiled("finite_difference.equation", "stencil")
 def equation(
     stencil: list,
     deriv: int = 1,
     interval: str = DEFAULT_INTERVAL,
     sort: bool = True,
     keep_zero: bool = False,
+    lazy: bool = False,
 ) -> Expr:
     """
     derive finite difference equation based on given stencil.
@@ -51,9 +64,15 @@ def equation(
         keep_zero (bool, optional):
             flag to keep terms multiplied by 0 in the result.
             Defaults to False.
+        lazy (bool, optional): flag to return a StencilResult
+            holding numerators and denominator, whose sympy expression
+            is built on demand. `sort` and `keep_zero` are not used.
+            Defaults to False.
 
     Returns:
         dictos Expr: derived finite difference equation.
+            or
+        StencilResult: result holding coefficients if `lazy` is set.
 
     Examples:
         >>> from dictos import finite_difference as fd
@@ -62,6 +81,10 @@ def equation(
         >>> fd.equation([-1.5, -0.5, 0, 0.5, 1.5], deriv=1)
         (f_{-1.5} - 27*f_{-0.5} + 27*f_{0.5} - f_{1.5})/(24*h)
     """
+    if lazy:
+        numer, denom = coefficients(stencil, deriv, as_numer_denom=True)
+        # symbolic rendering is deferred until `.expr` is requested.
+        return StencilResult(sorted(stencil), numer, denom, deriv, interval)
 
     x_set = create_coordinate_symbols(stencil, interval)
     f_set = create_differentiand_symbols(x_set, DEFAULT_DIFFERENTIAND)
@@ -100,6 +123,7 @@ def equation(
     return Expr(eq)
 
 
+@profiled("finite_difference.coefficients", "stencil")
 def coefficients(stencil: list, deriv: int = 1, as_numer_denom: bool = False):
     """
     derive finite difference coefficients based on given stencil.
@@ -138,6 +162,12 @@ def coefficients(stencil: list, deriv: int = 1, as_numer_denom: bool = False):
         # raise error
         # - if unsupported order of derivative (deriv < 1)
 
+    if has_exact_points(stencil):
+        coef = fornberg_weights(Stencil(stencil).offsets, deriv)
+        return simplify_coefficients(coef, as_numer_denom)
+        # a stencil of int or Fraction is processed in exact rational arithmetic
+        # without constructing the Lagrangian polynomial symbolically.
+
     x_set = create_coordinate_symbols(stencil, DEFAULT_INTERVAL)
     f_set = create_differentiand_symbols(x_set, DEFAULT_DIFFERENTIAND)
     # create set of coordinate and differentiand symbols from stencil.
@@ -158,6 +188,55 @@ def coefficients(stencil: list, deriv: int = 1, as_numer_denom: bool = False):
     # simplify floating-point number coefficients to ratioanl numbers
 
 
+def hermite_coefficients(
+    stencil: list, known: list = None, deriv: int = 1, as_numer_denom: bool = False
+):
+    """
+    derive finite difference coefficients based on given stencil
+    using function values and derivatives known at each point.
+    The coefficients c_{s,k} approximate the derivative as
+    f^(deriv)(0) = sum c_{s,k} h**(k-deriv) f^(k)(s*h).
+
+    Args:
+        stencil (list of int): relative point numbers
+            used for discretization.
+        known (list of list of int, optional): orders of derivatives
+            known at each point in the stencil. 0 means the function value.
+            Defaults to None, which means the function value and
+            the first derivative are known at every point.
+        deriv (int, optional): order of derivative. Defaults to 1.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        UnsupportedOrderOfDerivativeError: if
+            unsupported order of derivative (deriv < 1) is passed.
+        SingularMatrixError: if the coefficients are not determined uniquely.
+
+    Returns:
+        dict of (point, order) and sympy Rational: coefficients
+            keyed by the point in the stencil and the order of known derivative.
+            or
+        dict of (point, order) and sympy numbers, int:
+            numerators and the denominator of coefficients.
+
+    Examples:
+        >>> from dictos import finite_difference as fd
+        >>> fd.hermite_coefficients([-1, 1], deriv=1)
+        {(-1, 0): -3/4, (-1, 1): -1/4, (1, 0): 3/4, (1, 1): -1/4}
+        >>> fd.hermite_coefficients([-1, 0, 1], [[1], [0], [1]], deriv=2)
+        {(-1, 1): -1/2, (0, 0): 0, (1, 1): 1/2}
+    """
+    if is_not_natural_number(deriv):
+        raise UnsupportedOrderOfDerivativeError(deriv)
+        # raise error
+        # - if unsupported order of derivative (deriv < 1)
+
+    return hermite.coefficients(stencil, known, deriv, as_numer_denom)
+
+
+@profiled("finite_difference.truncation_error", "stencil")
 def truncation_error(stencil: list, deriv: int, interval: str = DEFAULT_INTERVAL):
     """
     derive the leading-order of error term
@@ -188,40 +267,46 @@ def truncation_error(stencil: list, deriv: int, interval: str = DEFAULT_INTERVAL
     coef = coefficients(stencil, deriv)
     # derive finite difference coefficients based on given stencil
 
-    x_set = create_coordinate_symbols(stencil, interval=interval)
-    # create set of coordinate symbols from stencil.
-    # [-2, -1, 0, 1, 2] -> [-2*h, -h, 0, h, 2*h]
+    sorted_stencil = exact_points(stencil)
+    # coefficients are arranged in the order of the sorted stencil.
+    # points are converted to rational numbers consistently with coefficients.
 
-    num_term = len(x_set) + deriv
-    f_ts = [taylor_series(x, num_term) for x in x_set]
-    # calculate Taylor series around points in x_set.
+    num_term = len(sorted_stencil) + deriv
+    f_ts = [PowerSeries.taylor(s, num_term) for s in sorted_stencil]
+    # calculate Taylor series around points in the stencil.
 
-    fd_eq = dot_product(coef, f_ts)
+    fd_eq = PowerSeries.dot(coef, f_ts)
     # calculate weighted sum of Taylor series.
     # for instance, 2nd-order 3-point central finite difference
     # for 1st derivative is
     # fd_eq [= f(h)/2 - f(-h)/2)] = f^(1)*h + f^(3)*h**3/6 + ...
 
+    order, error = (PowerSeries.unit(deriv) - fd_eq).leading_term()
+    if order is None:
+        return sp.Integer(0)
+
     h = sp.symbols(interval)
-    return sp.expand(
-        sp.simplify(
-            derivative_symbol(DEFAULT_DIFFERENTIAND, deriv)
-            - sp.nsimplify(fd_eq / h**deriv, rational=True, tolerance=1e-10)
-        )
-    ).as_leading_term(h)
+    return (
+        to_rational(error)
+        * derivative_symbol(DEFAULT_DIFFERENTIAND, order)
+        * h ** (order - deriv)
+    )
     # extract the leading-order of errer term.
     # A finite difference formulation with error term is, for instance,
     # f^(1) = (f(h) - f(-h))/(2*h) - f^(3)*h**3/6 - ...
     # to extract error terms, reformulate fd_eq as
     # f^(1) - fd_eq/h**1 = - f^(3)*h**3/6 - ...
+    # fd_eq is a series of f^(i)*h**i, so the error term is divided by h**deriv.
 
 
+@profiled("finite_difference.generate")
 def generate(
     deriv: int = 1,
     acc: int = 2,
     grid_type: GridType = GridType.REGULAR,
     as_equation: bool = False,
     consistent: bool = False,  # Reserved for future extension
+    lazy: bool = False,
 ):
     """
     generate a finite difference equation or a coefficient
@@ -240,10 +325,15 @@ def generate(
             Defaults to False.
         consistent (bool, optional): Reserved for futuer extension.
             Defaults to False.
+        lazy (bool, optional): If True, returns a StencilResult
+            whose equation is built on demand.
+            It takes precedence over `as_equation`.
+            Defaults to False.
 
     Returns:
-        Union[dictos.Expr, Tuple[sympy.Expr]]: generated finite difference equation
-        or generated coefficinets depending on `as_equation`.
+        Union[dictos.Expr, Tuple[sympy.Expr], StencilResult]:
+        generated finite difference equation or generated coefficinets
+        depending on `as_equation` and `lazy`.
 
     Raises:
         UnsupportedOrderOfDerivativeError: If deriv < 1
@@ -267,13 +357,13 @@ def generate(
         # - if acc is not positive and even
 
     if grid_type == GridType.REGULAR:
-        return _generate_on_regular_grid(deriv, acc, as_equation)
+        return _generate_on_regular_grid(deriv, acc, as_equation, lazy)
 
     elif grid_type == GridType.CELL_CENTERED:
-        return _generate_on_cell_centered_grid(deriv, acc, as_equation)
+        return _generate_on_cell_centered_grid(deriv, acc, as_equation, lazy)
 
     elif grid_type == GridType.STAGGERED:
-        return _generate_on_staggered_grid(deriv, acc, as_equation, consistent)
+        return _generate_on_staggered_grid(deriv, acc, as_equation, consistent, lazy)
 
     else:
         raise ValueError(
@@ -282,7 +372,9 @@ def generate(
         )
 
 
-def _generate_on_regular_grid(deriv: int, acc: int, as_equation: bool = False):
+def _generate_on_regular_grid(
+    deriv: int, acc: int, as_equation: bool = False, lazy: bool = False
+):
     """
     generate a finite difference equation or coefficients for regular grid system.
 
@@ -292,10 +384,13 @@ def _generate_on_regular_grid(deriv: int, acc: int, as_equation: bool = False):
         as_equation (bool, optional): If True, returns equation in dictos Expr
             instead of coefficients in Tuple of sympy.Expr.
             Defaults to False.
+        lazy (bool, optional): If True, returns a StencilResult.
+            Defaults to False.
 
     Returns:
-        Union[dictos.Expr, Tuple[sympy.Expr]]: generated finite difference equation
-            or generated coefficinets depending on `as_equation`.
+        Union[dictos.Expr, Tuple[sympy.Expr], StencilResult]:
+            generated finite difference equation or generated coefficinets
+            depending on `as_equation` and `lazy`.
 
     Note:
         - Half width of the stencil is (deriv + acc - 1)//2 accoding to the table below:
@@ -322,13 +417,15 @@ def _generate_on_regular_grid(deriv: int, acc: int, as_equation: bool = False):
     # stencil width is `stencil_half_width * 2 + 1`
     # where +1 is for point 0
 
-    if as_equation:
-        return equation(stencil, deriv)
+    if as_equation or lazy:
+        return equation(stencil, deriv, lazy=lazy)
     else:
         return coefficients(stencil, deriv)
 
 
-def _generate_on_cell_centered_grid(deriv: int, acc: int, as_equation: bool = False):
+def _generate_on_cell_centered_grid(
+    deriv: int, acc: int, as_equation: bool = False, lazy: bool = False
+):
     """
     generate a finite difference equation or coefficients for cell-centered grid system.
 
@@ -338,10 +435,13 @@ def _generate_on_cell_centered_grid(deriv: int, acc: int, as_equation: bool = Fa
         as_equation (bool, optional): If True, returns equation in dictos Expr
             instead of coefficients in Tuple of sympy.Expr.
             Defaults to False.
+        lazy (bool, optional): If True, returns a StencilResult.
+            Defaults to False.
 
     Returns:
-        Union[dictos.Expr, Tuple[sympy.Expr]]: generated finite difference equation
-            or generated coefficinets depending on `as_equation`.
+        Union[dictos.Expr, Tuple[sympy.Expr], StencilResult]:
+            generated finite difference equation or generated coefficinets
+            depending on `as_equation` and `lazy`.
 
     Note:
         - Half width of the stencil  is (deriv + acc)//2 accoding to the table below:
@@ -367,14 +467,18 @@ def _generate_on_cell_centered_grid(deriv: int, acc: int, as_equation: bool = Fa
     # generate stencil [-half_width+0.5, ..., -0.5, 0.5, ..., half_width-0.5]
     # stencil width is `stencil_half_width * 2`
 
-    if as_equation:
-        return equation(stencil, deriv)
+    if as_equation or lazy:
+        return equation(stencil, deriv, lazy=lazy)
     else:
         return coefficients(stencil, deriv)
 
 
 def _generate_on_staggered_grid(
-    deriv, acc, as_equation: bool = False, consistent: bool = False
+    deriv,
+    acc,
+    as_equation: bool = False,
+    consistent: bool = False,
+    lazy: bool = False,
 ):
     """
     generate a finite difference equation or coefficients for staggered grid system.
@@ -386,6 +490,8 @@ def _generate_on_staggered_grid(
             instead of coefficients in Tuple of sympy.Expr.
             Defaults to False.
         consistent (bool, optional): Reserved for future extension. Defaults to False.
+        lazy (bool, optional): If True, returns a StencilResult.
+            Defaults to False.
 
     Returns:
         Union[dictos.Expr, Tuple[sympy.Expr]]: generated finite difference equation
@@ -410,6 +516,6 @@ def _generate_on_staggered_grid(
     """
 
     if is_even(deriv):
-        return _generate_on_regular_grid(deriv, acc, as_equation)
+        return _generate_on_regular_grid(deriv, acc, as_equation, lazy)
     else:
-        return _generate_on_cell_centered_grid(deriv, acc, as_equation)
+        return _generate_on_cell_centered_grid(deriv, acc, as_equation, lazy)
@@ -0,0 +1,221 @@
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
+
+from dictos.utilities.spec import has_duplicated_points, is_natural_number
+from dictos.utilities.array import normalize_axes
+from dictos.linalg.linalg import solve_fraction
+from dictos.discrete.exceptions import DuplicatedPointError
+
+# quadrature weights are derived in exact rational arithmetic
+# using Fraction, so that `integrate` runs without importing sympy.
+
+
+def coefficients(stencil: list, a=0, b=1, as_numer_denom: bool = False):
+    """
+    derive quadrature coefficients based on given stencil.
+    The coefficients w_i approximate the integral as
+    int_{a*h}^{b*h} f(x) dx = h * sum w_i f(stencil[i]*h),
+    which is exact for polynomials of degree up to len(stencil)-1.
+
+    Args:
+        stencil (list of int or float): relative point numbers
+            used for discretization.
+        a (int, float, or sympy Rational, optional): lower limit
+            in units of the interval. Defaults to 0.
+        b (int, float, or sympy Rational, optional): upper limit
+            in units of the interval. Defaults to 1.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        list of sympy Rational: simplified coefficients.
+            or
+        list of sympy numbers, int:
+            numerator and denominator of coefficients.
+            coefficients are commutative
+            with the least common multiple of the denominator.
+            Coefficients are arranged in the order of the sorted stencil.
+
+    Examples:
+        >>> from dictos.calculus import quadrature
+        >>> quadrature.coefficients([0, 1, 2], 0, 2)
+        [1/3, 4/3, 1/3]
+        >>> quadrature.coefficients([0, 1, 2, 3], 0, 3, as_numer_denom=True)
+        ([3, 9, 9, 3], 8)
+        >>> quadrature.coefficients([-1, 0, 1], 0, 1)
+        [-1/12, 2/3, 5/12]
+    """
+    import sympy as sp
+    from dictos.utilities.utils import simplify_coefficients
+    from dictos.series.power_series import to_fraction, to_rational
+
+    if has_duplicated_points(stencil):
+        raise DuplicatedPointError(stencil)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+
+    coef = _quadrature_coefficients(
+        tuple(sorted(to_fraction(sp.nsimplify(s, rational=True)) for s in stencil)),
+        to_fraction(sp.nsimplify(a, rational=True)),
+        to_fraction(sp.nsimplify(b, rational=True)),
+    )
+
+    return simplify_coefficients([to_rational(c) for c in coef], as_numer_denom)
+
+
+def integrate(array, h: float = 1.0, order: int = 4, axis: int = -1):
+    """
+    integrate values sampled at equally spaced points along an axis
+    by the trapezoidal rule with Gregory end corrections.
+    The end corrections are obtained from the Euler-Maclaurin formula
+    so that the composite rule is of the given order of accuracy.
+    If the number of points is too small to place the corrections,
+    the Newton-Cotes rule using all points is used instead.
+
+    Args:
+        array (ndarray): values at equally spaced points.
+        h (float, optional): interval between points. Defaults to 1.0.
+        order (int, optional): order of accuracy, 2 or greater.
+            2 corresponds to the trapezoidal rule. Defaults to 4.
+        axis (int, optional): axis along which values are integrated.
+            Defaults to -1.
+
+    Raises:
+        ValueError: if `order` is less than 2,
+            if `axis` is out of range,
+            or if the number of points along `axis` is less than 2.
+
+    Returns:
+        ndarray or float: integrated values with `axis` removed.
+
+    Examples:
+        >>> from dictos.calculus import quadrature
+        >>> import numpy as np
+        >>> x = np.linspace(0, 1, 11)
+        >>> float(quadrature.integrate(x**3, h=0.1, order=4))
+        0.25
+    """
+    if not is_natural_number(order) or order < 2:
+        raise ValueError(f"order of accuracy ({order}) must be 2 or greater.")
+
+    array = np.asarray(array)
+    (axis,) = normalize_axes(axis, array.ndim)
+
+    values = np.moveaxis(array, axis, -1)
+    n = values.shape[-1]
+    if n < 2:
+        raise ValueError(f"integration requires 2 or more points, got {n}.")
+
+    num_corr = order - 1
+    if n < 2 * num_corr:
+        return h * (values @ _newton_cotes_weights(n))
+        # corrections at both ends overlap each other.
+
+    corr = _gregory_corrections(order)
+    return h * (
+        values.sum(axis=-1)
+        + values[..., :num_corr] @ corr
+        + values[..., : n - num_corr - 1 : -1] @ corr
+    )
+    # the weights are 1 except near the ends,
+    # and the corrections are added symmetrically to both ends.
+
+
+@lru_cache(maxsize=None)
+def _quadrature_coefficients(stencil: tuple, a, b) -> tuple:
+    """
+    solve the moment system for quadrature coefficients.
+    Results are cached for each set of stencil and limits.
+
+    Args:
+        stencil (tuple of Fraction): sorted relative point numbers.
+        a (Fraction): lower limit.
+        b (Fraction): upper limit.
+
+    Returns:
+        tuple of Fraction: coefficients.
+    """
+    num_coef = len(stencil)
+
+    matrix = [[s**m for s in stencil] for m in range(num_coef)]
+    rhs = [(b ** (m + 1) - a ** (m + 1)) / (m + 1) for m in range(num_coef)]
+    # the rule is exact for monomials x**m, m = 0, 1, ..., num_coef-1:
+    # sum w_i s_i**m = int_a^b x**m dx
+
+    return tuple(solve_fraction(matrix, rhs))
+
+
+@lru_cache(maxsize=None)
+def _gregory_corrections(order: int):
+    """
+    calculate Gregory end corrections d_j added to the unit weights
+    at the points j = 0, 1, ..., order-2 from an end.
+
+    Args:
+        order (int): order of accuracy.
+
+    Returns:
+        ndarray: corrections.
+    """
+    num_corr = order - 1
+
+    bernoulli = _bernoulli_numbers(num_corr)
+    matrix = [[j**q for j in range(num_corr)] for q in range(num_corr)]
+    rhs = [
+        (Fraction(-1, 2) if q == 0 else 0)
+        + (bernoulli[q + 1] / (q + 1) if q % 2 == 1 else 0)
+        for q in range(num_corr)
+    ]
+    # from the Euler-Maclaurin formula, corrections satisfy
+    # sum_j d_j j**q = -delta_{q0}/2 + B_{q+1}/(q+1) for odd q,
+    # where B_k is the Bernoulli number.
+
+    corr = np.array([float(d) for d in solve_fraction(matrix, rhs)])
+    corr.flags.writeable = False
+
+    return corr
+
+
+@lru_cache(maxsize=None)
+def _newton_cotes_weights(n: int):
+    """
+    calculate float Newton-Cotes weights using n points 0, 1, ..., n-1.
+
+    Args:
+        n (int): number of points.
+
+    Returns:
+        ndarray: weights.
+    """
+    stencil = tuple(Fraction(s) for s in range(n))
+    coef = _quadrature_coefficients(stencil, Fraction(0), Fraction(n - 1))
+    weights = np.array([float(c) for c in coef])
+    weights.flags.writeable = False
+
+    return weights
+
+
+def _bernoulli_numbers(n: int) -> list:
+    """
+    calculate Bernoulli numbers B_0, B_1, ..., B_n by the recurrence
+    sum_{k=0}^{m} C(m+1, k) B_k = 0 (m >= 1) with B_0 = 1.
+    Only B_k of even k are used, which do not depend on the sign convention of B_1.
+
+    Args:
+        n (int): largest index.
+
+    Returns:
+        list of Fraction: Bernoulli numbers.
+    """
+    b = [Fraction(1)]
+    for m in range(1, n + 1):
+        b.append(-sum(comb(m + 1, k) * b[k] for k in range(m)) / (m + 1))
+
+    return b
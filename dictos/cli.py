@@ -0,0 +1,559 @@
+"""
+Provide the command-line interface of dictos.
+
+Examples:
+    $ dictos table --deriv 1:6 --acc 2:12 --grid all --format fortran -j 8 -o fd.f90
+    $ dictos table --kind filter,interpolation --acc 2:8 --format csv
+"""
+
+import io
+import os
+import sys
+import json
+import zipfile
+import argparse
+import itertools
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+from dictos.__version__ import __version__
+
+KINDS = ("fd", "filter", "interpolation")
+# kinds of tables.
+# fd: finite difference by `finite_difference.generate`
+# filter: linear filter by `filter.generate`
+# interpolation: mid-point interpolation by `interpolation.coefficients`
+
+GRIDS = ("regular", "cell-centered", "staggered")
+# values of GridType
+
+FORMATS = ("json", "csv", "npz", "fortran")
+
+
+def main(argv=None) -> int:
+    """
+    run the command-line interface.
+
+    Args:
+        argv (list of str, optional): command-line arguments.
+            Defaults to None, in which case `sys.argv[1:]` is used.
+
+    Returns:
+        int: exit status.
+    """
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+
+    try:
+        status = args.handler(args)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        # the reader of the standard output has exited, e.g. `dictos table | head`.
+        # the rest of the output is discarded,
+        # so that flushing at exit does not raise the error again.
+        return 1
+
+    return status
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    """
+    create the parser of command-line arguments.
+
+    Returns:
+        argparse.ArgumentParser: parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="dictos",
+        description="Symbolic discretization tools for the finite difference method.",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    table = subparsers.add_parser(
+        "table",
+        help="generate tables of coefficients",
+        description="generate tables of coefficients of central schemes. "
+        + "Ranges are given as `start:stop[:step]` including `stop`, "
+        + "or comma-separated values like `1:3,6`. "
+        + "Combinations with an odd order of accuracy are skipped, "
+        + "since central schemes have only even orders of accuracy.",
+    )
+    table.add_argument(
+        "--kind",
+        type=lambda arg: _parse_choices(arg, KINDS),
+        default=["fd"],
+        help="kinds of tables, comma-separated values of "
+        + f"{', '.join(KINDS)} or all. Defaults to fd.",
+    )
+    table.add_argument(
+        "--deriv",
+        type=_parse_range,
+        default=[1],
+        help="orders of derivative for fd. Defaults to 1.",
+    )
+    table.add_argument(
+        "--acc",
+        type=_parse_range,
+        default=[2],
+        help="orders of accuracy. Defaults to 2.",
+    )
+    table.add_argument(
+        "--grid",
+        type=lambda arg: _parse_choices(arg, GRIDS),
+        default=["regular"],
+        help="grid types for fd, comma-separated values of "
+        + f"{', '.join(GRIDS)} or all. Defaults to regular.",
+    )
+    table.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="json",
+        help="output format. Defaults to json.",
+    )
+    table.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="output file. Defaults to the standard output. Required for npz.",
+    )
+    table.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes. Defaults to 1.",
+    )
+    table.set_defaults(handler=partial(_table, table))
+
+    return parser
+
+
+def _parse_range(arg: str) -> list:
+    """
+    parse a range of integers like `1:6`, `2:12:2`, or `1:3,6`.
+    The stop value is included in the range.
+
+    Args:
+        arg (str): range.
+
+    Raises:
+        argparse.ArgumentTypeError: if `arg` is not a range of integers.
+
+    Returns:
+        list of int: integers in the range.
+    """
+    values = []
+    try:
+        for item in arg.split(","):
+            bounds = [int(b) for b in item.split(":")]
+            if len(bounds) == 1:
+                values.append(bounds[0])
+            elif len(bounds) in (2, 3) and (len(bounds) == 2 or bounds[2] > 0):
+                step = bounds[2] if len(bounds) == 3 else 1
+                values.extend(range(bounds[0], bounds[1] + 1, step))
+            else:
+                raise ValueError
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range: '{arg}'")
+
+    return list(dict.fromkeys(values))
+    # remove duplicates keeping the order
+
+
+def _parse_choices(arg: str, choices: tuple) -> list:
+    """
+    parse comma-separated values selected from choices.
+
+    Args:
+        arg (str): comma-separated values or `all`.
+        choices (tuple of str): valid values.
+
+    Raises:
+        argparse.ArgumentTypeError: if `arg` contains an invalid value.
+
+    Returns:
+        list of str: selected values.
+    """
+    if arg == "all":
+        return list(choices)
+
+    values = arg.split(",")
+    for value in values:
+        if value not in choices:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: '{value}' (choose from {', '.join(choices)}, all)"
+            )
+
+    return list(dict.fromkeys(values))
+
+
+def _table(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """
+    generate tables and write them to the output.
+
+    Args:
+        parser (argparse.ArgumentParser): parser of the command to report errors.
+        args (argparse.Namespace): parsed arguments.
+
+    Returns:
+        int: exit status.
+    """
+    if args.format == "npz" and args.output is None:
+        parser.error("an output file must be specified by -o for npz")
+    if "fd" in args.kind and min(args.deriv) < 1:
+        parser.error("orders of derivative must be 1 or more")
+    if args.jobs < 1:
+        parser.error("the number of worker processes must be 1 or more")
+
+    tasks = list(_tasks(args.kind, args.deriv, args.acc, args.grid))
+    rows = _rows(tasks, args.jobs)
+
+    try:
+        if args.output is None:
+            _WRITERS[args.format](sys.stdout, rows)
+        elif args.format == "npz":
+            with _replace_on_success(args.output) as path:
+                _write_npz(path, rows)
+        else:
+            with _replace_on_success(args.output) as path:
+                with open(path, "w", newline="") as f:
+                    _WRITERS[args.format](f, rows)
+    except OverflowError as e:
+        parser.error(str(e))
+
+    return 0
+
+
+@contextmanager
+def _replace_on_success(path: str):
+    """
+    provide a temporary file next to the output,
+    which replaces the output only when writing succeeds,
+    so that an error does not leave a truncated table.
+
+    Args:
+        path (str): output file.
+
+    Yields:
+        str: temporary file to be written.
+    """
+    temporary = f"{path}.{os.getpid()}.part"
+    try:
+        yield temporary
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _tasks(kinds: list, derivs: list, accs: list, grids: list):
+    """
+    enumerate combinations of arguments of tables.
+
+    Args:
+        kinds (list of str): kinds of tables.
+        derivs (list of int): orders of derivative.
+        accs (list of int): orders of accuracy.
+        grids (list of str): grid types.
+
+    Yields:
+        tuple of str, int, int, str: kind, order of derivative,
+            order of accuracy, and grid type.
+            The order of derivative is 0 for filter and interpolation.
+    """
+    for kind in kinds:
+        for acc in accs:
+            if acc < 2 or acc % 2 == 1:
+                continue
+                # skip orders of accuracy invalid for central schemes
+
+            if kind == "fd":
+                for deriv, grid in itertools.product(derivs, grids):
+                    yield kind, deriv, acc, grid
+            elif kind == "filter":
+                yield kind, 0, acc, "regular"
+            else:
+                yield kind, 0, acc, "cell-centered"
+
+
+def _rows(tasks: list, jobs: int):
+    """
+    generate rows of tables in worker processes.
+
+    Args:
+        tasks (list of tuple): arguments of rows.
+        jobs (int): number of worker processes.
+            Rows are generated in the current process if 1.
+
+    Yields:
+        dict: rows in the order of tasks.
+    """
+    if jobs == 1:
+        yield from map(_row, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        try:
+            for task in tasks:
+                if len(pending) == 2 * jobs:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_row, task))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+        # at most 2*jobs tasks are in flight,
+        # so that completed rows do not pile up behind a slow row
+        # and the whole table is not kept in memory.
+        # each worker keeps its own caches of coefficients,
+        # which are shared by tasks running in the same worker.
+
+
+def _row(task: tuple) -> dict:
+    """
+    generate a row of a table.
+    This function is called in worker processes.
+
+    Args:
+        task (tuple of str, int, int, str): kind, order of derivative,
+            order of accuracy, and grid type.
+
+    Returns:
+        dict: row like {"kind": "fd", "grid": "regular", "deriv": 1, "acc": 2,
+            "stencil": [-1, 0, 1], "numerators": [-1, 0, 1], "denominator": 2}.
+    """
+    # import sympy-dependent modules here,
+    # so that the interface starts without importing them.
+    from dictos.core.grid_type import GridType
+    from dictos.core.result import StencilResult
+    from dictos.discrete.stencil import Stencil
+    from dictos.calculus import finite_difference as fd
+    from dictos.filter import filter as flt
+    from dictos.poly import interpolation as intp
+
+    kind, deriv, acc, grid = task
+    if kind == "fd":
+        result = fd.generate(deriv, acc, GridType(grid), lazy=True)
+    elif kind == "filter":
+        result = flt.generate(acc, lazy=True)
+    else:
+        stencil = Stencil([i + 0.5 for i in range(-acc // 2, acc // 2)])
+        numer, denom = intp.coefficients(stencil, as_numer_denom=True)
+        result = StencilResult(list(stencil), numer, denom)
+        # interpolation from `acc` grid points to the mid point
+
+    return {
+        "kind": kind,
+        "grid": grid,
+        "deriv": deriv,
+        "acc": acc,
+        "stencil": result.stencil,
+        "numerators": result.numerators,
+        "denominator": result.denominator,
+    }
+
+
+def _name(row: dict) -> str:
+    """
+    create an identifier of a row like `fd_regular_d1_a2`.
+
+    Args:
+        row (dict): row of a table.
+
+    Returns:
+        str: identifier.
+    """
+    grid = row["grid"].replace("-", "_")
+    return f"{row['kind']}_{grid}_d{row['deriv']}_a{row['acc']}"
+
+
+def _write_json(f, rows):
+    """
+    write rows as a JSON array, one row per line.
+
+    Args:
+        f (file object): output.
+        rows (iterable of dict): rows of a table.
+    """
+    f.write("[")
+    for i, row in enumerate(rows):
+        f.write(("\n" if i == 0 else ",\n") + json.dumps(row))
+    f.write("\n]\n")
+
+
+def _write_csv(f, rows):
+    """
+    write rows as CSV.
+    Stencils and numerators are written as space-separated values.
+
+    Args:
+        f (file object): output.
+        rows (iterable of dict): rows of a table.
+    """
+    f.write("kind,grid,deriv,acc,stencil,numerators,denominator\n")
+    for row in rows:
+        f.write(
+            f"{row['kind']},{row['grid']},{row['deriv']},{row['acc']},"
+            + " ".join(str(s) for s in row["stencil"])
+            + ","
+            + " ".join(str(n) for n in row["numerators"])
+            + f",{row['denominator']}\n"
+        )
+
+
+def _write_fortran(f, rows):
+    """
+    write rows as a Fortran module holding named constants.
+
+    Args:
+        f (file object): output.
+        rows (iterable of dict): rows of a table.
+
+    Raises:
+        OverflowError: if numerators or a denominator
+            exceed the range of int64.
+    """
+    f.write(
+        f"! generated by dictos {__version__}\n"
+        + "module dictos_coefficients\n"
+        + "    use, intrinsic :: iso_fortran_env\n"
+        + "    implicit none\n"
+        + "    private\n"
+    )
+    for row in rows:
+        name = _name(row)
+        n = len(row["stencil"])
+        if not _fits_int64(row["numerators"] + [row["denominator"]]):
+            raise OverflowError(
+                f"coefficients of {name} exceed the range of int64 "
+                + "and cannot be written in fortran; use json, csv or npz."
+            )
+            # raise error if
+            # - integer literals are rejected by Fortran compilers.
+
+        f.write(
+            f"\n    ! {row['kind']} on {row['grid']} grid, "
+            + f"deriv={row['deriv']}, acc={row['acc']}\n"
+            + _fortran_array(
+                f"real(real64), parameter, public :: {name}_stencil({n})",
+                [f"{float(s)}_real64" for s in row["stencil"]],
+            )
+            + _fortran_array(
+                f"integer(int64), parameter, public :: {name}_numerators({n})",
+                [f"{num}_int64" for num in row["numerators"]],
+            )
+            + f"    integer(int64), parameter, public :: {name}_denominator"
+            + f" = {row['denominator']}_int64\n"
+        )
+    f.write("end module dictos_coefficients\n")
+
+
+def _fortran_array(declaration: str, values: list, width: int = 120) -> str:
+    """
+    format a declaration of a constant array with continuation lines,
+    so that each line does not exceed the maximum length in free form.
+
+    Args:
+        declaration (str): declaration without the initializer.
+        values (list of str): elements.
+        width (int, optional): maximum length of lines. Defaults to 120.
+
+    Returns:
+        str: declaration.
+    """
+    lines = [f"    {declaration} = ["]
+    for i, value in enumerate(values):
+        item = value + (", " if i < len(values) - 1 else "]")
+        if len(lines[-1]) + len(item) + 2 > width:
+            lines[-1] = lines[-1].rstrip() + " &"
+            lines.append("        " + item)
+        else:
+            lines[-1] += item
+
+    return "\n".join(lines) + "\n"
+
+
+def _write_npz(path: str, rows):
+    """
+    write rows to an npz file, one array per row and field
+    like `fd_regular_d1_a2_stencil`.
+    Arrays are appended to the archive row by row.
+    Numerators and denominators exceeding the range of int64
+    are stored as object arrays, which require `allow_pickle=True` to load.
+
+    Args:
+        path (str): output file.
+        rows (iterable of dict): rows of a table.
+    """
+    import numpy as np
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for row in rows:
+            name = _name(row)
+            arrays = {
+                "stencil": np.array(row["stencil"], dtype=float),
+                "numerators": _int_array(row["numerators"]),
+                "denominator": _int_array(row["denominator"]),
+            }
+            for field, array in arrays.items():
+                buffer = io.BytesIO()
+                np.lib.format.write_array(buffer, array, allow_pickle=True)
+                archive.writestr(f"{name}_{field}.npy", buffer.getvalue())
+
+
+def _int_array(values):
+    """
+    convert integers to an int64 array,
+    or to an object array if they exceed the range of int64.
+
+    Args:
+        values (int or list of int): integers.
+
+    Returns:
+        ndarray: array of integers.
+    """
+    import numpy as np
+
+    if _fits_int64(np.ravel(np.array(values, dtype=object))):
+        return np.array(values, dtype=np.int64)
+    return np.array(values, dtype=object)
+
+
+def _fits_int64(values) -> bool:
+    """
+    check whether all integers are in the range of int64.
+    The minimum -2**63 is excluded, since its literal is out of range
+    in languages applying the unary minus to a positive literal.
+
+    Args:
+        values (iterable of int): integers.
+
+    Returns:
+        bool: True if all integers are in the range.
+    """
+    return all(abs(v) < 2**63 for v in values)
+
+
+_WRITERS = {
+    "json": _write_json,
+    "csv": _write_csv,
+    "fortran": _write_fortran,
+}
+# writers of text formats
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,4 @@
 import sympy as sp
-from sympy.printing.str import StrPrinter
-from sympy.printing.latex import LatexPrinter
-from sympy.printing.repr import ReprPrinter
 
 
 class Expr(sp.Expr):
@@ -70,6 +67,8 @@ class Expr(sp.Expr):
             >>> str(f)
             'x + 2*y'
         """
+        from sympy.printing.str import StrPrinter
+
         return StrPrinter({"order": "none"}).doprint(self.arg)
 
     def __repr__(self) -> str:
@@ -90,6 +89,8 @@ class Expr(sp.Expr):
             >>> repr(f)
             "Expression(Add(Symbol('x'), Mul(Integer(2), Symbol('y'))))"
         """
+        from sympy.printing.repr import ReprPrinter
+
         sympy_repr = ReprPrinter({"order": "none"}).doprint(self.arg)
         return f"Expression({sympy_repr})"
 
@@ -115,6 +116,8 @@ class Expr(sp.Expr):
             >>> f._latex()
             'x + 2y'
         """
+        from sympy.printing.latex import LatexPrinter
+
         return LatexPrinter({"order": "none"}).doprint(self.arg)
 
     def toSympyExpr(self) -> sp.Expr:
@@ -0,0 +1,152 @@
+import sympy as sp
+import numpy as np
+from fractions import Fraction
+
+from dictos.defaults import DEFAULT_INTERVAL, DEFAULT_DIFFERENTIAND
+from dictos.discrete.stencil import (
+    create_coordinate_symbols,
+    create_differentiand_symbols,
+)
+from dictos.utilities.utils import sort_by_subscript
+from dictos.linalg.linalg import dot_product
+from dictos.core.expr import Expr
+
+
+class StencilResult:
+    """
+    A lightweight result of a discretization holding
+    the stencil, integer numerators, the denominator and the order of derivative.
+
+    The result represents the equation
+    sum_i numerators[i] * f_{stencil[i]} / (denominator * h**deriv).
+    The sympy expression and other representations are built lazily
+    and cached, so that the cost of symbolic rendering is paid
+    only when they are requested.
+
+    Attributes:
+        stencil (list of int or float): sorted relative point numbers.
+        numerators (list of int): numerators of coefficients.
+        denominator (int): common denominator of coefficients.
+        deriv (int): order of derivative. 0 for interpolation and filters.
+        interval (str): an interval symbol like `dx`.
+
+    Examples:
+        >>> from dictos import finite_difference as fd
+        >>> result = fd.equation([-1, 0, 1], deriv=2, lazy=True)
+        >>> result.numerators, result.denominator
+        ([1, -2, 1], 1)
+        >>> result.as_floats()
+        [1.0, -2.0, 1.0]
+        >>> print(result.expr)
+        (f_{-1} - 2*f_{0} + f_{1})/h**2
+    """
+
+    __slots__ = (
+        "stencil",
+        "numerators",
+        "denominator",
+        "deriv",
+        "interval",
+        "_expr",
+        "_array",
+    )
+
+    def __init__(
+        self,
+        stencil,
+        numerators,
+        denominator,
+        deriv: int = 0,
+        interval: str = DEFAULT_INTERVAL,
+    ):
+        """
+        Create a new StencilResult instance.
+
+        Args:
+            stencil (list of int or float): sorted relative point numbers.
+            numerators (list of int or sympy Integer): numerators of coefficients.
+            denominator (int or sympy Integer): common denominator of coefficients.
+            deriv (int, optional): order of derivative. Defaults to 0.
+            interval (str, optional): an interval symbol like `dx`.
+                Defaults to DEFAULT_INTERVAL.
+        """
+        self.stencil = list(stencil)
+        self.numerators = [int(n) for n in numerators]
+        self.denominator = int(denominator)
+        self.deriv = deriv
+        self.interval = interval
+        self._expr = None
+        self._array = None
+
+    @property
+    def coefficients(self) -> list:
+        """
+        coefficients as sympy Rational.
+
+        Returns:
+            list of sympy Rational: coefficients.
+        """
+        return [sp.Rational(n, self.denominator) for n in self.numerators]
+
+    @property
+    def expr(self) -> Expr:
+        """
+        equation as dictos Expr, built on the first access.
+        Terms are sorted by subscript and terms multiplied by 0 are eliminated.
+
+        Returns:
+            dictos Expr: equation.
+        """
+        if self._expr is None:
+            x_set = create_coordinate_symbols(self.stencil, self.interval)
+            f_set = create_differentiand_symbols(x_set, DEFAULT_DIFFERENTIAND)
+            eq = sp.simplify(
+                dot_product(self.coefficients, f_set)
+                / sp.symbols(self.interval) ** self.deriv
+            )
+            self._expr = Expr(sort_by_subscript(eq))
+
+        return self._expr
+
+    @property
+    def latex(self) -> str:
+        """
+        LaTeX representation of the equation.
+
+        Returns:
+            str: LaTeX string.
+        """
+        return sp.latex(self.expr)
+
+    def as_floats(self) -> list:
+        """
+        coefficients as float numbers, excluding the interval.
+
+        Returns:
+            list of float: coefficients.
+        """
+        return self.as_numpy().tolist()
+
+    def as_numpy(self):
+        """
+        coefficients as a read-only NumPy array, excluding the interval.
+
+        Returns:
+            ndarray: coefficients.
+        """
+        if self._array is None:
+            self._array = np.array(
+                [float(Fraction(n, self.denominator)) for n in self.numerators]
+            )
+            self._array.flags.writeable = False
+
+        return self._array
+
+    def __len__(self) -> int:
+        return len(self.stencil)
+
+    def __repr__(self) -> str:
+        return (
+            f"StencilResult(stencil={self.stencil}, numerators={self.numerators}, "
+            + f"denominator={self.denominator}, deriv={self.deriv})"
+        )
@@ -0,0 +1,283 @@
+from fractions import Fraction
+
+from dictos.utilities.spec import are_different_length
+from dictos.utilities.utils import simplify_coefficients
+from dictos.linalg.exceptions import InconsistentDataSetError
+from dictos.series.power_series import to_fraction, to_rational
+
+
+class Operator:
+    """
+    A linear discrete operator sum_i c_i f(x + s_i*h) / h**deriv
+    represented by exact rational offsets s_i, coefficients c_i
+    and the order of derivative, i.e. the power of h in the denominator.
+
+    Operators are composed by the discrete convolution of
+    offsets and coefficients, so that a composite operator
+    is obtained by O(n*m) rational arithmetic
+    without deriving it symbolically again.
+
+    Attributes:
+        terms (tuple of tuple of Fraction): pairs of offset and coefficient
+            sorted by offset.
+        deriv (int): order of derivative. 0 for interpolation and filters.
+
+    Examples:
+        >>> from dictos.discrete.operator import Operator
+        >>> d2 = Operator.from_finite_difference([-1, 0, 1], deriv=2)
+        >>> d4 = d2 @ d2
+        >>> d4.stencil
+        [-2, -1, 0, 1, 2]
+        >>> d4.coefficients()
+        [1, -4, 6, -4, 1]
+        >>> d4.deriv
+        4
+    """
+
+    __slots__ = ("terms", "deriv")
+
+    def __init__(self, stencil, coefficients, deriv: int = 0):
+        """
+        Create a new Operator instance.
+        Coefficients at the same offset are summed.
+
+        Args:
+            stencil (list of int, float, Fraction, or sympy Rational):
+                relative point numbers.
+            coefficients (list of int, Fraction, or sympy Rational):
+                coefficients at each point.
+            deriv (int, optional): order of derivative,
+                i.e. the power of h in the denominator.
+                Defaults to 0.
+
+        Raises:
+            InconsistentDataSetError: if stencil and coefficients
+                are inconsistent.
+        """
+        if are_different_length(stencil, coefficients):
+            raise InconsistentDataSetError(stencil, coefficients)
+            # raise error if
+            # stencil and coefficients are inconsistent.
+
+        terms = {}
+        for s, c in zip(stencil, coefficients):
+            s = to_fraction(s)
+            terms[s] = terms.get(s, Fraction(0)) + to_fraction(c)
+
+        self.terms = tuple(sorted(terms.items()))
+        self.deriv = deriv
+
+    @classmethod
+    def from_result(cls, result):
+        """
+        create an operator from a StencilResult.
+
+        Args:
+            result (StencilResult): a result returned with `lazy=True`,
+                e.g. by `finite_difference.generate` or `filter.generate`.
+
+        Returns:
+            Operator: the operator having the order of derivative of the result.
+        """
+        return cls(
+            result.stencil,
+            [Fraction(n, result.denominator) for n in result.numerators],
+            result.deriv,
+        )
+
+    @classmethod
+    def from_finite_difference(cls, stencil, deriv: int = 1):
+        """
+        create a finite difference operator
+        from coefficients given by `finite_difference.coefficients`.
+
+        Args:
+            stencil (list of int or float): relative point numbers
+                used for discretization.
+            deriv (int, optional): order of derivative. Defaults to 1.
+
+        Returns:
+            Operator: the finite difference operator.
+        """
+        from dictos.calculus.finite_difference import coefficients
+
+        return cls(stencil, coefficients(stencil, deriv), deriv)
+
+    @classmethod
+    def from_filter(cls, acc: int):
+        """
+        create a linear filter operator
+        from coefficients given by `filter.generate`.
+
+        Args:
+            acc (int): order of accuracy (must be even and positive).
+
+        Returns:
+            Operator: the filter operator.
+        """
+        from dictos.filter.filter import generate
+
+        coef = generate(acc)
+        half_width = len(coef) // 2
+        return cls(range(-half_width, half_width + 1), coef)
+
+    @classmethod
+    def identity(cls):
+        """
+        create the identity operator f(x).
+
+        Returns:
+            Operator: the identity operator.
+        """
+        return cls([0], [1])
+
+    @classmethod
+    def shift(cls, offset):
+        """
+        create the shift operator f(x + offset*h).
+
+        Args:
+            offset (int, float, Fraction, or sympy Rational): relative point.
+
+        Returns:
+            Operator: the shift operator.
+        """
+        return cls([offset], [1])
+
+    @property
+    def stencil(self) -> list:
+        """
+        relative point numbers of the operator.
+        Integral offsets are returned as int, and others as float.
+
+        Returns:
+            list of int or float: stencil.
+        """
+        return [int(s) if s.denominator == 1 else float(s) for s, _ in self.terms]
+
+    def coefficients(self, as_numer_denom: bool = False):
+        """
+        coefficients of the operator.
+
+        Args:
+            as_numer_denom (bool, optional): flag to return the numerator
+                and denominator separately.
+                Defaults to False.
+
+        Returns:
+            list of sympy Rational: coefficients.
+                or
+            list of sympy numbers, int:
+                numerator and denominator of coefficients.
+        """
+        return simplify_coefficients(
+            [to_rational(c) for _, c in self.terms], as_numer_denom
+        )
+
+    def simplify(self):
+        """
+        remove terms having zero coefficients.
+
+        Returns:
+            Operator: simplified operator.
+        """
+        terms = [(s, c) for s, c in self.terms if c != 0]
+        return Operator([s for s, _ in terms], [c for _, c in terms], self.deriv)
+
+    def scale(self, factor):
+        """
+        multiply each coefficient by a scalar value.
+
+        Args:
+            factor (int, Fraction, or sympy Rational): scalar multiplier.
+
+        Returns:
+            Operator: scaled operator.
+        """
+        factor = to_fraction(factor)
+        return Operator(
+            [s for s, _ in self.terms], [c * factor for _, c in self.terms], self.deriv
+        )
+
+    def compose(self, other):
+        """
+        compose two operators, i.e. apply `other` and then `self`.
+        Composition of linear shift-invariant operators is commutative
+        and equals the discrete convolution of coefficients.
+        The orders of derivative, i.e. the powers of h, are added.
+
+        Args:
+            other (Operator): operator applied first.
+
+        Returns:
+            Operator: composite operator.
+        """
+        terms = {}
+        for s, a in self.terms:
+            for t, b in other.terms:
+                terms[s + t] = terms.get(s + t, Fraction(0)) + a * b
+        # (A o B) f(x) = sum_s a_s sum_t b_t f(x + (s+t)h)
+
+        return Operator(
+            list(terms.keys()), list(terms.values()), self.deriv + other.deriv
+        )
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __matmul__(self, other):
+        return self.compose(other)
+
+    def __pow__(self, n: int):
+        if not isinstance(n, int) or n < 0:
+            raise ValueError(f"exponent must be a non-negative integer, got {n}.")
+            # raise error if
+            # - the power is not the repeated composition.
+
+        result = Operator.identity()
+        for _ in range(n):
+            result = result @ self
+        return result
+
+    def __add__(self, other):
+        if self.deriv != other.deriv:
+            raise ValueError(
+                "operators of different orders of derivative cannot be added, "
+                f"got {self.deriv} and {other.deriv}."
+            )
+            # raise error if
+            # - the powers of h in the denominators are different.
+
+        return Operator(
+            [s for s, _ in self.terms] + [s for s, _ in other.terms],
+            [c for _, c in self.terms] + [c for _, c in other.terms],
+            self.deriv,
+        )
+
+    def __neg__(self):
+        return self.scale(-1)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __mul__(self, factor):
+        return self.scale(factor)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Operator):
+            return NotImplemented
+        return (
+            self.deriv == other.deriv
+            and self.simplify().terms == other.simplify().terms
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.simplify().terms, self.deriv))
+
+    def __repr__(self) -> str:
+        return (
+            f"Operator({self.stencil}, {[str(c) for _, c in self.terms]}, "
+            f"deriv={self.deriv})"
+        )
@@ -1,5 +1,9 @@
 import sympy as sp
+from fractions import Fraction
+from decimal import Decimal
+from numbers import Rational
 
+from dictos.utilities.profiling import profiled
 from dictos.defaults import (
     DEFAULT_INTERVAL,
     DEFAULT_DIFFERENTIAND,
@@ -9,8 +13,223 @@ from dictos.utilities.spec import (
     narrower_than_minimum_width,
 )
 from dictos.discrete.exceptions import TooNarrowError, DuplicatedPointError
+from dictos.series.power_series import to_fraction, to_rational
 
 
+class Stencil:
+    """
+    An immutable stencil on regular or staggered grid
+    represented by sorted exact rational offsets.
+
+    The stencil is validated, converted to rational numbers,
+    and sorted only once when the instance is created.
+    Since the instance is hashable, it can be used as a key of caches
+    without converting floats to rational numbers on every call.
+    The instance behaves as a sequence of int or float,
+    so that it is accepted everywhere a list is accepted.
+
+    Attributes:
+        offsets (tuple of Fraction): sorted relative point numbers.
+
+    Examples:
+        >>> from dictos.discrete.stencil import Stencil
+        >>> stencil = Stencil([1.5, -0.5, 0.5, -1.5])
+        >>> list(stencil)
+        [-1.5, -0.5, 0.5, 1.5]
+        >>> stencil.rationals
+        (-3/2, -1/2, 1/2, 3/2)
+    """
+
+    __slots__ = ("_offsets", "_hash")
+
+    def __init__(self, stencil):
+        """
+        Create a new Stencil instance.
+
+        Args:
+            stencil (list of int, float, Fraction, or sympy Rational):
+                relative point numbers. It is not allowed that a number
+                in the list appears more than once.
+
+        Raises:
+            TooNarrowError: if stencil is too narrow.
+            DuplicatedPointError: if at least a number in the stencil
+                appears more than once.
+        """
+        if isinstance(stencil, Stencil):
+            offsets = stencil.offsets
+        else:
+            offsets = tuple(sorted(to_fraction(s) for s in stencil))
+
+        if narrower_than_minimum_width(offsets):
+            raise TooNarrowError(list(stencil))
+            # raise error if
+            # - stencil is too narrow to coompute finite difference or interpolation
+        if has_duplicated_points(offsets):
+            raise DuplicatedPointError(list(stencil))
+            # raise error if
+            # - at least a number in the stencil appears more than once.
+
+        self._offsets = offsets
+        self._hash = hash(offsets)
+
+    @property
+    def offsets(self) -> tuple:
+        """
+        exact offsets, which are read-only to keep the cached hash valid.
+
+        Returns:
+            tuple of Fraction: sorted relative point numbers.
+        """
+        return self._offsets
+
+    @property
+    def rationals(self) -> tuple:
+        """
+        offsets as sympy Rational.
+
+        Returns:
+            tuple of sympy Rational: sorted relative point numbers.
+        """
+        return tuple(to_rational(s) for s in self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self):
+        return (_to_number(s) for s in self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_to_number(s) for s in self.offsets[index]]
+        return _to_number(self.offsets[index])
+
+    def __contains__(self, number) -> bool:
+        return to_fraction(number) in self.offsets
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Stencil):
+            return self.offsets == other.offsets
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Stencil({list(self)})"
+
+
+class DifferentiandSymbol(sp.Symbol):
+    """
+    A differentiand symbol like `f_{-1}` carrying its exact offset,
+    so that terms are ordered by the offset without parsing the subscript.
+
+    The symbol is equal to, hashed, sorted, and substituted as
+    the sympy Symbol of the same name, so that equations compare equal
+    to those written with `sympy.Symbol("f_{-1}")`.
+
+    Attributes:
+        offset (Fraction): relative point number of the symbol.
+
+    Examples:
+        >>> import sympy as sp
+        >>> from dictos.discrete.stencil import DifferentiandSymbol
+        >>> f = DifferentiandSymbol("f_{-1.5}", -1.5)
+        >>> f.offset
+        Fraction(-3, 2)
+        >>> f == sp.Symbol("f_{-1.5}")
+        True
+    """
+
+    __slots__ = ("offset",)
+
+    def __new__(cls, name: str, offset, **assumptions):
+        """
+        Create a new DifferentiandSymbol instance.
+
+        Args:
+            name (str): name of the symbol like `f_{-1}`.
+            offset (int, float, Fraction, or sympy Rational): relative point number.
+            assumptions: assumptions of sympy Symbol.
+        """
+        cls._sanitize(assumptions, cls)
+        obj = sp.Symbol.__xnew__(cls, name, **assumptions)
+        obj.offset = to_fraction(offset)
+        return obj
+        # the cache of sympy Symbol is bypassed as `sympy.Dummy` does,
+        # since symbols of the same name may carry different offsets,
+        # e.g. 1/3 and its float approximation.
+
+    def __getnewargs_ex__(self):
+        return ((self.name, self.offset), self._assumptions_orig)
+
+    def __eq__(self, other) -> bool:
+        if type(other) in (sp.Symbol, DifferentiandSymbol):
+            return self._hashable_content() == other._hashable_content()
+        return super().__eq__(other)
+
+    __hash__ = sp.Symbol.__hash__
+
+    def _eval_subs(self, old, new):
+        if old == self:
+            return new
+        return None
+        # substitute the sympy Symbol of the same name.
+
+
+DifferentiandSymbol.__name__ = sp.Symbol.__name__
+# sympy orders, hashes, and prints expressions by the class name,
+# so the name is the same as sympy Symbol
+# to arrange terms in the same order as the sympy Symbol of the same name.
+
+
+def has_exact_points(stencil) -> bool:
+    """
+    Returns True if the stencil consists of exact rational numbers,
+    i.e. it is a Stencil or a list of int, Fraction, sympy Rational,
+    or float equal to its decimal representation like 0.5 and 1.25.
+    Floats like 0.1 are not exact, since they differ from 1/10.
+
+    Args:
+        stencil (list of numbers, or Stencil): stencil to be checked.
+
+    Returns:
+        bool: True if the stencil consists of exact rational numbers.
+    """
+    return isinstance(stencil, Stencil) or all(
+        isinstance(s, Rational)
+        or (isinstance(s, float) and Fraction(s) == Fraction(repr(s)))
+        for s in stencil
+    )
+
+
+def exact_points(stencil) -> list:
+    """
+    convert points of a stencil to sorted Fractions
+    in the same way as the derivation of coefficients.
+    Exact points are converted exactly, and others like 1/3 in float
+    are simplified to rational numbers by nsimplify.
+
+    Args:
+        stencil (list of numbers, or Stencil): stencil to be converted.
+
+    Returns:
+        list of Fraction: sorted points.
+
+    Examples:
+        >>> from dictos.discrete.stencil import exact_points
+        >>> exact_points([1/3, -1/3])
+        [Fraction(-1, 3), Fraction(1, 3)]
+    """
+    if has_exact_points(stencil):
+        return list(Stencil(stencil).offsets)
+
+    return sorted(to_fraction(sp.nsimplify(s)) for s in stencil)
+    # coefficients for inexact points are simplified by nsimplify,
+    # so the points are simplified in the same way to be consistent.
+
+
+@profiled("create_coordinate_symbols", "stencil")
 def create_coordinate_symbols(stencil: list, interval: str = DEFAULT_INTERVAL) -> list:
     """
     create set of coordinate symbols from stencil.
@@ -18,7 +237,7 @@ def create_coordinate_symbols(stencil: list, interval: str = DEFAULT_INTERVAL) -
     this returns a list of coordinates like `[-h, 0, h]`.
 
     Args:
-        stencil (list of int or float): stencil on regular or
+        stencil (list of int or float, or Stencil): stencil on regular or
             staggered grid. It is not allowed that a number
             in the list appears more than once.
         interval (str, optional): an interval symbol like `dx`.
@@ -33,6 +252,10 @@ def create_coordinate_symbols(stencil: list, interval: str = DEFAULT_INTERVAL) -
         list of sympy symbols: list of coordinates
             corresponding to the stencil.
     """
+    if isinstance(stencil, Stencil):
+        h = sp.symbols(interval)
+        return [s * h for s in stencil.rationals]
+        # Stencil is already validated and sorted.
 
     if narrower_than_minimum_width(stencil):
         raise TooNarrowError(stencil)
@@ -69,32 +292,52 @@ def create_differentiand_symbols(
             Defaults to DEFAULT_DIFFERENTIAND.
 
     Returns:
-        tuple of sympy symbols: tuple of differentiands at passed coordinates.
+        tuple of DifferentiandSymbol: tuple of differentiands at passed coordinates.
             Subscripts are enclused in curly braces like `f_{0}`.
     """
     # make differentiand subscripts the same as the stencil
 
-    stencil = [x if x.is_number else sp.poly(x).coeffs()[0] for x in x_set]
+    stencil = [x.as_coeff_Mul()[0] for x in x_set]
     # extract numbers from list of coordinates.
     # coordinate consists of a number and a symbol,
     # such as -2*h and 1.5*h, extract the number as coefficint.
     # coordinate is 0, that is a number, use 0 as the stencil
 
-    subscript = [to_subscript(i) for i in stencil]
-    str = "".join([differentiand + "_{" + s + "}" + " " for s in subscript])
-    # make string "f_{-1} f_{-0.5} ..." to pass `sympy.symbols`.
-    # tail space is ignored in `sympy.symbols`
+    f_set = [
+        DifferentiandSymbol(differentiand + "_{" + to_subscript(s) + "}", s)
+        for s in stencil
+    ]
+    # construct symbols "f_{-1}", "f_{-0.5}", ... directly
+    # without parsing a string by `sympy.symbols`.
+    # each symbol carries its exact offset.
 
-    f_set = sp.symbols(str)
-    if type(f_set) == sp.Symbol:
-        f_set = (f_set,)
-    # make the return value's type a tuple.
-    # sp.symbols(str) returns sp.Symbol
-    # when str does not contain space
-    # althought sp.symbols(f"_0:{n}") returns tuple
-    # when n==1.
+    return tuple(f_set)
 
-    return f_set
+
+def get_offset(a_term) -> Fraction:
+    """
+    get the offset from a differentiand symbol.
+    The offset carried by DifferentiandSymbol is returned as is.
+    For other symbols, e.g. created by `sympy.Symbol`,
+    the offset is parsed from the subscript as Fraction.
+
+    Args:
+        a_term (sympy Symbol or Mul):
+            a differentiand symbol with subscript like `27*f_{-1}`
+
+    Raises:
+        TypeError: if `a_term` is not sympy Symbol or Mul.
+
+    Returns:
+        Fraction: offset of the symbol, like -1.
+    """
+    f = _get_symbol(a_term)
+    if isinstance(f, DifferentiandSymbol):
+        return f.offset
+
+    return Fraction(get_subscript(f))
+    # parsing the subscript as Fraction, not float,
+    # keeps subscripts having many decimal places distinct.
 
 
 def to_subscript(number):
@@ -107,11 +350,18 @@ def to_subscript(number):
     Returns:
         str: converted subscript.
     """
-    n = sp.Rational(number)
-    return f"{n}" if n.is_integer else f"{float(n):2.1f}"
-    # if n is a float number, converted to "xx.x"
-    # 2-digit means the maximum stencil width is 99.
-    # 1 digimal place is enough because equidistance grid is supported.
+    n = to_fraction(number)
+    if n.denominator == 1:
+        return f"{n.numerator}"
+
+    if _is_terminating(n.denominator):
+        decimal = Decimal(n.numerator) / Decimal(n.denominator)
+        return f"{decimal:f}"
+    # if n is a terminating decimal, converted to the exact string like
+    # "1.5" or "0.25", so that different points have different subscripts.
+
+    return repr(float(n))
+    # otherwise, converted to the shortest float representation.
 
 
 def get_subscript(a_term):
@@ -128,21 +378,7 @@ def get_subscript(a_term):
     Returns:
         str: string of subscript in a differentiand symbol, like "-1"
     """
-
-    if type(a_term) is sp.Symbol:
-        # if `a_term` is a symbol with subscript and without coefficient
-        # like `f_{-1}`, `f = f_{-1}`.
-        f = a_term
-    elif type(a_term) is sp.Mul:
-        # if `a_term` is a symbol with subscript and coefficient
-        # like `27*f_{-1}`, `f = f_{-1}`.
-        i = 1 if type(a_term.args[1]) is sp.Symbol else 0
-        f = a_term.args[i]
-        # if `a_term.args` is (27, f_{-1}), chose `f_{-1}`.
-    else:
-        raise TypeError(a_term, type(a_term))
-        # raise error if
-        # - `a_term` is not sympy Symbol or Mul.
+    f = _get_symbol(a_term)
 
     f_str = str(f)
     start = f_str.find("{") + 1
@@ -153,3 +389,63 @@ def get_subscript(a_term):
     # between "{" and "}".
 
     return subscript
+
+
+def _get_symbol(a_term):
+    """
+    get a differentiand symbol from a term.
+
+    Args:
+        a_term (sympy Symbol or Mul):
+            a differentiand symbol with subscript like `27*f_{-1}`
+
+    Raises:
+        TypeError: if `a_term` is not sympy Symbol or Mul.
+
+    Returns:
+        sympy Symbol: the differentiand symbol like `f_{-1}`.
+    """
+    if isinstance(a_term, sp.Symbol):
+        # if `a_term` is a symbol with subscript and without coefficient
+        # like `f_{-1}`, `f = f_{-1}`.
+        return a_term
+
+    if type(a_term) is sp.Mul:
+        # if `a_term` is a symbol with subscript and coefficient
+        # like `27*f_{-1}`, `f = f_{-1}`.
+        i = 1 if isinstance(a_term.args[1], sp.Symbol) else 0
+        return a_term.args[i]
+        # if `a_term.args` is (27, f_{-1}), chose `f_{-1}`.
+
+    raise TypeError(a_term, type(a_term))
+    # raise error if
+    # - `a_term` is not sympy Symbol or Mul.
+
+
+def _to_number(offset: Fraction):
+    """
+    convert an offset to int if it is integral, otherwise to float.
+
+    Args:
+        offset (Fraction): an offset.
+
+    Returns:
+        int or float: converted offset.
+    """
+    return offset.numerator if offset.denominator == 1 else float(offset)
+
+
+def _is_terminating(denominator: int) -> bool:
+    """
+    Returns True if 1/denominator is a terminating decimal.
+
+    Args:
+        denominator (int): a positive integer.
+
+    Returns:
+        bool: True if the denominator has no prime factors other than 2 and 5.
+    """
+    for p in (2, 5):
+        while denominator % p == 0:
+            denominator //= p
+    return denominator == 1
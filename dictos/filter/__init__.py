@@ -0,0 +1,8 @@
+from dictos.filter.filter import (
+    generate,
+    design,
+    generate_compact,
+    generate_boundary,
+    apply,
+    apply_compact,
+)
@@ -0,0 +1,78 @@
+"""
+Custom exceptions for errors related to Filter.
+"""
+
+
+class FilterError(Exception):
+    """
+    Base class for error related to Filter.
+    """
+
+    pass
+
+
+class InvalidFilterParameterError(FilterError):
+    """
+    Exception raised for errors
+    that the parameter of the compact filter is out of range.
+
+    Attributes:
+        alpha (int, float, or sympy Number): parameter which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, alpha) -> None:
+        self.alpha = alpha
+        self.message = (
+            f"The filter parameter {alpha} is out of range. "
+            + "Specify the parameter in the range -1/2 < alpha <= 1/2."
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class InconsistentNumberOfConstraintsError(FilterError):
+    """
+    Exception raised for errors
+    that the number of constraints imposed on the filter
+    is inconsistent with the number of independent coefficients.
+
+    Attributes:
+        width (int): stencil width which caused the error.
+        num_constraints (int): number of constraints which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, width: int, num_constraints: int) -> None:
+        self.width = width
+        self.num_constraints = num_constraints
+        self.message = (
+            f"The number of constraints {num_constraints} must be "
+            + f"the number of independent coefficients {width // 2 + 1} "
+            + f"of the symmetric filter with the stencil width {width}."
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class InvalidStencilWidthError(FilterError):
+    """
+    Exception raised for errors
+    that the stencil width of the symmetric filter is not odd.
+
+    Attributes:
+        width (int): stencil width which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.message = (
+            f"The stencil width {width} must be an odd number >= 3 "
+            + "for the symmetric filter."
+        )
+
+    def __str__(self) -> str:
+        return self.message
@@ -1,20 +1,32 @@
-import sympy as sp
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
 from typing import List
 
+from dictos.utilities.profiling import profiled
 from dictos.utilities.spec import is_valid_accuracy_order_for_generating_central_form
-from dictos.utilities.utils import simplify_coefficients, sort_by_subscript
-from dictos.calculus import finite_difference as fd
+from dictos.utilities.array import normalize_axes
 from dictos.calculus.exceptions import InvalidOrderOfAccuracyForCentralFormError
-from dictos.core.grid_type import GridType
-from dictos.discrete.stencil import (
-    create_coordinate_symbols,
-    create_differentiand_symbols,
+from dictos.linalg.linalg import solve_fraction, solve_tridiagonal
+from dictos.filter.exceptions import (
+    InvalidFilterParameterError,
+    InconsistentNumberOfConstraintsError,
+    InvalidStencilWidthError,
 )
-from dictos.linalg.linalg import dot_product, add, scale
-from dictos.core.expr import Expr
 
+# filter coefficients are derived in exact rational arithmetic
+# using Fraction, so that `apply` and `apply_compact` run without importing sympy.
+# sympy is imported by the functions returning sympy objects.
 
-def generate(acc: int, as_numer_denom: bool = False, as_equation: bool = False):
+
+@profiled("filter.generate")
+def generate(
+    acc: int,
+    as_numer_denom: bool = False,
+    as_equation: bool = False,
+    lazy: bool = False,
+):
     """
     generate the equation or coefficients
     for the linear filter on the regular grid
@@ -23,10 +35,14 @@ def generate(acc: int, as_numer_denom: bool = False, as_equation: bool = False):
         acc (int): Order of accuracy (must be even and positive)
         as_numer_denom (bool): If True, return coefficients as numerator/denominator
         as_equation (bool): If True, return as symbolic equation
+        lazy (bool): If True, return a StencilResult whose equation is built
+            on demand. It takes precedence over the other flags.
 
     Returns:
-        Union[sp.Expr, Expr]: equation or coefficient for linear filter
+        Union[sp.Expr, Expr, StencilResult]: equation or coefficient for linear filter
     """
+    from dictos.utilities.utils import simplify_coefficients
+    from dictos.core.result import StencilResult
 
     # validate order of accuracy
     if not is_valid_accuracy_order_for_generating_central_form(acc):
@@ -38,23 +54,14 @@ def generate(acc: int, as_numer_denom: bool = False, as_equation: bool = False):
     if as_numer_denom and as_equation:
         as_equation = False
 
-    # generate finite difference coefficients and calculate damping coefficients
-    denom = 2**acc
-    exponenet = (acc - 2) // 2
-
-    damp = fd.generate(deriv=acc, acc=2, grid_type=GridType.REGULAR)
-    damp = scale(scale(damp, sp.Pow(denom, -1)), (-1) ** exponenet)
-    # generate 2nd-order *acc-th* derivative finite difference in central form
-    # and then calculate (-1)**((acc-2)//2)*(h/2)**acc * ∂**acc f/∂h**acc |_i=0
-    # h is cancelled by with finite difference form of ∂**acc f/∂h**acc
-
-    stencil_width = len(damp)
-    main_component = [0] * stencil_width  # create zero list [0, 0, 0, 0, 0]
-    main_component[stencil_width // 2] = 1  # update list to [0, 0, 1, 0, 0] for f
+    coef = list(_filter_coefficients(acc))
+    stencil_width = len(coef)
 
-    # combine components to construct filter
-    coef = add(damp, main_component)
-    # f_filtered = f + (-1)**((acc-2)//2)*(h/2)**acc * ∂**acc f/∂h**acc
+    if lazy:
+        half_width = stencil_width // 2
+        numer, denom = simplify_coefficients(coef, as_numer_denom=True)
+        # symbolic rendering is deferred until `.expr` is requested.
+        return StencilResult(range(-half_width, half_width + 1), numer, denom)
 
     if as_equation:
         return _generate_equation(coef, stencil_width)
@@ -62,7 +69,7 @@ def generate(acc: int, as_numer_denom: bool = False, as_equation: bool = False):
         return simplify_coefficients(coef, as_numer_denom=as_numer_denom)
 
 
-def _generate_equation(coefficients: List[sp.Expr], stencil_width: int) -> Expr:
+def _generate_equation(coefficients: List, stencil_width: int):
     """
     generate symbolic equation from coefficients
 
@@ -73,6 +80,15 @@ def _generate_equation(coefficients: List[sp.Expr], stencil_width: int) -> Expr:
     Returns:
         Expr: Symbolic equation
     """
+    import sympy as sp
+    from dictos.utilities.utils import sort_by_subscript
+    from dictos.discrete.stencil import (
+        create_coordinate_symbols,
+        create_differentiand_symbols,
+    )
+    from dictos.linalg.linalg import dot_product
+    from dictos.core.expr import Expr
+
     half_width = stencil_width // 2
     stencil_range = range(-half_width, half_width + 1)
     x_set = create_coordinate_symbols(list(stencil_range))
@@ -81,3 +97,792 @@ def _generate_equation(coefficients: List[sp.Expr], stencil_width: int) -> Expr:
     eq = sort_by_subscript(eq)
 
     return Expr(eq)
+
+
+@lru_cache(maxsize=None)
+def _filter_coefficients(acc: int) -> tuple:
+    """
+    derive the coefficients of the linear filter in exact rational arithmetic.
+
+    The filter is
+    f_filtered = f + (-1)**((acc-2)//2)*(h/2)**acc * ∂**acc f/∂h**acc,
+    where ∂**acc f/∂h**acc is discretized by the 2nd-order central difference
+    (-1)**(n+acc/2) C(acc, acc/2+n) f_n / h**acc, n = -acc/2, ..., acc/2.
+    h is cancelled by the finite difference form of ∂**acc f/∂h**acc.
+
+    Args:
+        acc (int): Order of accuracy.
+
+    Returns:
+        tuple of Fraction: filter coefficients at points -acc/2, ..., acc/2.
+    """
+    half_width = acc // 2
+    sign = (-1) ** ((acc - 2) // 2)
+
+    coef = [
+        Fraction(sign * (-1) ** (n + half_width) * comb(acc, half_width + n), 2**acc)
+        for n in range(-half_width, half_width + 1)
+    ]
+    coef[half_width] += 1
+    # add f to the damping term.
+
+    return tuple(coef)
+
+
+@profiled("filter.design")
+def design(
+    width: int,
+    acc: int,
+    cutoff: int = None,
+    response: dict = None,
+    as_numer_denom: bool = False,
+    as_equation: bool = False,
+):
+    """
+    design the equation or coefficients for the symmetric linear filter
+    on the regular grid by solving the moment system exactly.
+
+    The transfer function of the filter T(k) = c_0 + 2 sum_{n=1}^{N} c_n cos(nk),
+    N = (width-1)/2, is constrained by
+    - T(k) = 1 + O(k**acc) at k = 0,
+    - T(k) = O((k-pi)**(2*cutoff)) at k = pi,
+    - T(k) = response[k] at specified wavenumbers,
+    and the total number of constraints must be N+1.
+
+    Args:
+        width (int): Stencil width (must be odd and >= 3)
+        acc (int): Order of accuracy (must be even and positive)
+        cutoff (int, optional): Number of constraints imposed at k = pi.
+            A larger number gives a flatter response around k = pi.
+            If None, all remaining degrees of freedom are used.
+            Defaults to None.
+        response (dict, optional): Values of the transfer function
+            at specified wavenumbers, like `{sp.pi/2: sp.Rational(1, 2)}`.
+            Defaults to None.
+        as_numer_denom (bool): If True, return coefficients as numerator/denominator
+        as_equation (bool): If True, return as symbolic equation
+
+    Raises:
+        InvalidStencilWidthError: if width is not odd or less than 3.
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not even and positive.
+        InconsistentNumberOfConstraintsError: if the number of constraints
+            is different from the number of independent coefficients.
+
+    Returns:
+        Union[sp.Expr, Expr]: equation or coefficient for linear filter
+
+    Examples:
+        >>> from dictos.filter import filter as flt
+        >>> flt.design(width=5, acc=4)
+        [-1/16, 1/4, 5/8, 1/4, -1/16]
+        >>> flt.design(width=5, acc=2, as_numer_denom=True)
+        ([1, 4, 6, 4, 1], 16)
+    """
+    from dictos.utilities.utils import simplify_coefficients
+
+    if width < 3 or width % 2 == 0:
+        raise InvalidStencilWidthError(width)
+        # raise error
+        # - if width is not odd or less than 3
+
+    # validate order of accuracy
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    # Handle conflict flags
+    if as_numer_denom and as_equation:
+        as_equation = False
+
+    response = tuple((response or {}).items())
+    num_unknowns = width // 2 + 1
+    if cutoff is None:
+        cutoff = num_unknowns - acc // 2 - len(response)
+
+    num_constraints = acc // 2 + cutoff + len(response)
+    if cutoff < 0 or num_constraints != num_unknowns:
+        raise InconsistentNumberOfConstraintsError(width, num_constraints)
+        # raise error
+        # - if the system is under- or over-determined
+
+    coef = _design_coefficients(width, acc, cutoff, response)
+
+    if as_equation:
+        return _generate_equation(coef, width)
+    else:
+        return simplify_coefficients(coef, as_numer_denom=as_numer_denom)
+
+
+@lru_cache(maxsize=None)
+def _design_coefficients(width: int, acc: int, cutoff: int, response: tuple):
+    """
+    solve the moment system for the symmetric filter.
+
+    Args:
+        width (int): Stencil width.
+        acc (int): Order of accuracy.
+        cutoff (int): Number of constraints imposed at k = pi.
+        response (tuple): pairs of wavenumber and value of the transfer function.
+
+    Returns:
+        List[sp.Expr]: filter coefficients [c_N, ..., c_1, c_0, c_1, ..., c_N].
+    """
+    import sympy as sp
+    from dictos.linalg.linalg import solve
+
+    n = range(width // 2 + 1)
+    # unknowns are c_0, c_1, ..., c_N
+
+    matrix = []
+    rhs = []
+    for m in range(acc // 2):
+        matrix.append([(1 if i == 0 else 2) * sp.Integer(i) ** (2 * m) for i in n])
+        rhs.append(sp.Integer(1) if m == 0 else sp.Integer(0))
+        # d**(2m)T/dk**(2m) at k = 0.
+        # c_0 + 2 sum_n c_n = 1, sum_n n**(2m) c_n = 0 (m >= 1)
+
+    for m in range(cutoff):
+        matrix.append(
+            [(1 if i == 0 else 2) * sp.Integer(i) ** (2 * m) * (-1) ** i for i in n]
+        )
+        rhs.append(sp.Integer(0))
+        # d**(2m)T/dk**(2m) at k = pi.
+        # c_0 + 2 sum_n (-1)**n c_n = 0, sum_n (-1)**n n**(2m) c_n = 0 (m >= 1)
+
+    for k, value in response:
+        matrix.append([(1 if i == 0 else 2) * sp.cos(i * k) for i in n])
+        rhs.append(sp.sympify(value))
+        # T(k) = value
+
+    c = solve(matrix, rhs)
+    return c[:0:-1] + c
+
+
+@profiled("filter.generate_compact")
+def generate_compact(acc: int, alpha, as_numer_denom: bool = False):
+    """
+    generate the coefficients for the implicit (compact) filter
+    on the regular grid.
+    The filter is formulated as
+
+    alpha*f_filtered_{i-1} + f_filtered_{i} + alpha*f_filtered_{i+1}
+        = sum_n a_n/2 (f_{i+n} + f_{i-n}),
+
+    where the coefficients a_n are determined so that the filter has
+    the order of accuracy `acc` and eliminates the highest wavenumber mode.
+
+    Args:
+        acc (int): Order of accuracy (must be even and positive)
+        alpha (int, float, or sympy Expr): filter parameter
+            in the range -1/2 < alpha <= 1/2.
+            A larger value gives a less dissipative filter.
+            A sympy symbol is also accepted.
+        as_numer_denom (bool): If True, return coefficients as numerator/denominator.
+            Only available when `alpha` is a number.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not even and positive.
+        InvalidFilterParameterError: if alpha is out of range.
+
+    Returns:
+        Tuple[List[sp.Expr], List[sp.Expr]]: coefficients of the left-hand side
+            [alpha, 1, alpha] and the right-hand side [a_N/2, ..., a_0, ..., a_N/2].
+
+    Examples:
+        >>> from dictos.filter import filter as flt
+        >>> flt.generate_compact(acc=2, alpha=0.45)
+        ([9/20, 1, 9/20], [19/40, 19/20, 19/40])
+        >>> flt.generate_compact(acc=2, alpha=0.45, as_numer_denom=True)
+        (([9, 20, 9], 20), ([19, 38, 19], 40))
+    """
+    import sympy as sp
+    from dictos.utilities.utils import simplify_coefficients
+    from dictos.series.power_series import to_rational
+
+    # validate order of accuracy
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    alpha = sp.nsimplify(alpha, rational=True)
+    if alpha.is_number and not (-sp.Rational(1, 2) < alpha <= sp.Rational(1, 2)):
+        raise InvalidFilterParameterError(alpha)
+        # raise error
+        # - if alpha is out of range
+
+    base, slope = _compact_filter_coefficients(acc)
+    rhs = [
+        sp.expand(to_rational(b) + to_rational(c) * alpha) for b, c in zip(base, slope)
+    ]
+    lhs = [alpha, sp.Integer(1), alpha]
+
+    if as_numer_denom:
+        return (
+            simplify_coefficients(lhs, as_numer_denom=True),
+            simplify_coefficients(rhs, as_numer_denom=True),
+        )
+    else:
+        return lhs, rhs
+
+
+@lru_cache(maxsize=None)
+def _compact_filter_coefficients(acc: int):
+    """
+    derive the right-hand side coefficients of the compact filter
+    as linear functions of the filter parameter.
+
+    The transfer function of the compact filter is
+    T(k) = (a_0 + sum_{n=1}^{N} a_n cos(nk))/(1 + 2 alpha cos(k)).
+    The coefficients a_0, ..., a_N (N = acc/2) are determined by
+    - T(k) = 1 + O(k**acc), i.e.,
+        sum_n a_n n**(2m) = 1 + 2 alpha (m = 0), 2 alpha (m = 1, ..., N-1)
+    - T(pi) = 0, i.e.,
+        sum_n (-1)**n a_n = 0
+
+    Args:
+        acc (int): Order of accuracy.
+
+    Returns:
+        Tuple[tuple of Fraction, tuple of Fraction]: the constant part and
+            the part proportional to alpha of the right-hand side coefficients
+            [a_N/2, ..., a_1/2, a_0, a_1/2, ..., a_N/2].
+    """
+    half_width = acc // 2
+
+    matrix = [[n ** (2 * m) for n in range(half_width + 1)] for m in range(half_width)]
+    # conditions for the order of accuracy. 0**0 is 1 in Python.
+
+    matrix.append([(-1) ** n for n in range(half_width + 1)])
+    # condition to eliminate the highest wavenumber mode.
+
+    base = solve_fraction(matrix, [1] + [0] * half_width)
+    slope = solve_fraction(matrix, [2] * half_width + [0])
+    # the right-hand side 1 + 2 alpha, 2 alpha, ..., 2 alpha, 0
+    # is linear in alpha, and so is the solution.
+
+    return _unfold(base), _unfold(slope)
+
+
+def _unfold(a: list) -> tuple:
+    """
+    arrange the coefficients a_0, a_1, ..., a_N of cosines
+    as the symmetric stencil [a_N/2, ..., a_1/2, a_0, a_1/2, ..., a_N/2].
+
+    Args:
+        a (list of Fraction): coefficients of cosines.
+
+    Returns:
+        tuple of Fraction: coefficients of the stencil.
+    """
+    side = [a[n] / 2 for n in range(len(a) - 1, 0, -1)]
+    return tuple(side + [a[0]] + side[::-1])
+
+
+@profiled("filter.generate_boundary")
+def generate_boundary(acc: int, one_sided: bool = False, as_numer_denom: bool = False):
+    """
+    generate the coefficients of the filters applied near the lower edge
+    of a non-periodic line, where the central filter of order `acc`
+    can not be applied.
+    The filters near the upper edge are obtained by reversing
+    both rows and columns of the returned coefficients.
+
+    Args:
+        acc (int): Order of accuracy of the interior filter
+            (must be even and positive)
+        one_sided (bool): If True, generate one-sided filters
+            having the order of accuracy `acc`.
+            Otherwise, generate lower-order central filters,
+            and the filter is not applied to the point on the edge.
+            Defaults to False.
+        as_numer_denom (bool): If True, return coefficients of each row
+            as numerator/denominator.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not even and positive.
+
+    Returns:
+        List[List[sp.Expr]]: a block of coefficients with acc/2 rows
+            and acc+1 columns. The row i gives the filter at the point i
+            from the values at points 0, 1, ..., acc.
+
+    Examples:
+        >>> from dictos.filter import filter as flt
+        >>> flt.generate_boundary(acc=4)
+        [[1, 0, 0, 0, 0], [1/4, 1/2, 1/4, 0, 0]]
+        >>> flt.generate_boundary(acc=2, one_sided=True)
+        [[3/4, 1/2, -1/4]]
+    """
+    from dictos.utilities.utils import simplify_coefficients
+
+    # validate order of accuracy
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    return [
+        simplify_coefficients(list(row), as_numer_denom=as_numer_denom)
+        for row in _boundary_coefficients(acc, one_sided)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _boundary_coefficients(acc: int, one_sided: bool) -> tuple:
+    """
+    derive the coefficients of the boundary filters
+    in exact rational arithmetic.
+
+    Args:
+        acc (int): Order of accuracy of the interior filter.
+        one_sided (bool): If True, derive one-sided filters.
+
+    Returns:
+        tuple of tuple of Fraction: a block of coefficients
+            with acc/2 rows and acc+1 columns.
+    """
+    half_width = acc // 2
+    block = []
+    for i in range(half_width):
+        if one_sided:
+            stencil = tuple(j - i for j in range(acc + 1))
+            row = _filter_coefficients_on_stencil(stencil, acc)
+            # one-sided filter on points 0, 1, ..., acc, defined at the point i
+        else:
+            row = [Fraction(0)] * (acc + 1)
+            row[: 2 * i + 1] = _filter_coefficients(2 * i) if i > 0 else [Fraction(1)]
+            # central filter of order 2i on points 0, 1, ..., 2i.
+            # the point on the edge is not filtered.
+
+        block.append(tuple(row))
+
+    return tuple(block)
+
+
+@lru_cache(maxsize=None)
+def _filter_coefficients_on_stencil(stencil: tuple, acc: int):
+    """
+    derive the filter coefficients on the given stencil
+    by solving the moment system.
+    The filter has the order of accuracy `acc`, i.e.,
+    the transfer function is 1 + O(k**acc),
+    and eliminates the highest wavenumber mode.
+
+    Args:
+        stencil (tuple of int): relative point numbers. Its length must be acc+1.
+        acc (int): Order of accuracy.
+
+    Returns:
+        List[Fraction]: filter coefficients.
+    """
+    matrix = [[s**m for s in stencil] for m in range(acc)]
+    rhs = [1] + [0] * (acc - 1)
+    # sum_j c_j s_j**m = 1 (m = 0), 0 (m = 1, ..., acc-1)
+
+    matrix.append([(-1) ** (s % 2) for s in stencil])
+    rhs.append(0)
+    # sum_j c_j (-1)**s_j = 0
+    # the exponent is taken modulo 2 to keep int for negative s_j.
+
+    return solve_fraction(matrix, rhs)
+
+
+def apply(
+    array,
+    acc: int,
+    axis=-1,
+    out=None,
+    inplace: bool = False,
+    periodic: bool = False,
+    one_sided: bool = False,
+):
+    """
+    apply the linear filter on the regular grid to an ndarray.
+
+    Args:
+        array (numpy.ndarray): data to be filtered.
+        acc (int): Order of accuracy (must be even and positive)
+        axis (int or tuple of int, optional): axis along which the filter is applied.
+            When a tuple is passed, the filter is applied sequentially
+            along each axis. Defaults to -1.
+        out (numpy.ndarray, optional): array to store the result.
+            Must have the same shape as `array`. Defaults to None.
+        inplace (bool, optional): If True, overwrite `array` with the result.
+            Defaults to False.
+        periodic (bool, optional): If True, `array` is treated as periodic.
+            Otherwise, the boundary filters generated by `generate_boundary`
+            are applied near the edges. Defaults to False.
+        one_sided (bool, optional): If True, one-sided filters are applied
+            near the edges instead of lower-order central filters.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not even and positive.
+        ValueError: if both `out` and `inplace` are specified,
+            if the shape of `out` is different from `array`,
+            if `axis` is out of range,
+            or if `one_sided` and the length of `array` along `axis`
+            is shorter than acc+1.
+
+    Returns:
+        numpy.ndarray: filtered array.
+
+    Examples:
+        >>> import numpy as np
+        >>> from dictos.filter import filter as flt
+        >>> flt.apply(np.array([0.0, 0.0, 4.0, 0.0, 0.0]), acc=2)
+        array([0., 1., 2., 1., 0.])
+    """
+
+    # validate order of accuracy
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    if inplace and out is not None:
+        raise ValueError("`out` and `inplace=True` can not be specified together.")
+
+    array = np.asarray(array)
+    axes = normalize_axes(axis, array.ndim)
+
+    if inplace:
+        out = array
+    elif out is None:
+        out = np.empty(array.shape, dtype=np.result_type(array.dtype, np.float64))
+    elif out.shape != array.shape:
+        raise ValueError(
+            f"shape of `out` {out.shape} must be the same as `array` {array.shape}."
+        )
+
+    if one_sided and not periodic:
+        for ax in axes:
+            if array.shape[ax] < acc + 1:
+                raise ValueError(
+                    f"one-sided filters of order {acc} require {acc + 1} or more "
+                    + f"points along axis {ax}, got {array.shape[ax]}."
+                )
+        # raise error if
+        # - the line is too short to apply one-sided filters
+
+    block = _boundary_block(acc, one_sided)
+    return _apply_sequentially(
+        array,
+        axes,
+        out,
+        lambda src, dst, ax: _apply_along_axis(
+            src, dst, acc // 2, _folded_weights, ax, periodic, block
+        ),
+    )
+
+
+def apply_compact(
+    array,
+    acc: int,
+    alpha,
+    axis=-1,
+    out=None,
+    inplace: bool = False,
+    periodic: bool = False,
+):
+    """
+    apply the compact filter on the regular grid to an ndarray.
+    The right-hand side is computed with the explicit stencil, and then
+    the tridiagonal systems along the axis are solved simultaneously.
+
+    Args:
+        array (numpy.ndarray): data to be filtered.
+        acc (int): Order of accuracy (must be even and positive)
+        alpha (int or float): filter parameter in the range -1/2 < alpha <= 1/2.
+        axis (int or tuple of int, optional): axis along which the filter is applied.
+            When a tuple is passed, the filter is applied sequentially
+            along each axis. Defaults to -1.
+        out (numpy.ndarray, optional): array to store the result.
+            Must have the same shape as `array`. Defaults to None.
+        inplace (bool, optional): If True, overwrite `array` with the result.
+            Defaults to False.
+        periodic (bool, optional): If True, `array` is treated as periodic.
+            Otherwise, lower-order compact filters are applied near the edges.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not even and positive.
+        InvalidFilterParameterError: if alpha is out of range.
+        ValueError: if both `out` and `inplace` are specified,
+            if the shape of `out` is different from `array`,
+            or if `axis` is out of range.
+
+    Returns:
+        numpy.ndarray: filtered array.
+    """
+
+    # validate order of accuracy
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    if not -0.5 < alpha <= 0.5:
+        raise InvalidFilterParameterError(alpha)
+        # raise error
+        # - if alpha is out of range
+
+    if inplace and out is not None:
+        raise ValueError("`out` and `inplace=True` can not be specified together.")
+
+    array = np.asarray(array)
+    axes = normalize_axes(axis, array.ndim)
+
+    if inplace:
+        out = array
+    elif out is None:
+        out = np.empty(array.shape, dtype=np.result_type(array.dtype, np.float64))
+    elif out.shape != array.shape:
+        raise ValueError(
+            f"shape of `out` {out.shape} must be the same as `array` {array.shape}."
+        )
+
+    alpha = float(alpha)
+    return _apply_sequentially(
+        array,
+        axes,
+        out,
+        lambda src, dst, ax: _apply_compact_along_axis(
+            src, dst, acc, alpha, ax, periodic
+        ),
+    )
+
+
+def _apply_sequentially(array, axes: tuple, out, kernel):
+    """
+    apply a filter sequentially along axes.
+
+    Args:
+        array (numpy.ndarray): data to be filtered.
+        axes (tuple of int): axes along which the filter is applied.
+        out (numpy.ndarray): array to store the result. It may be `array` itself.
+        kernel (Callable): function `kernel(src, dst, axis)` applying the filter
+            along an axis. `src` and `dst` never share memory.
+
+    Returns:
+        numpy.ndarray: `out`.
+    """
+    aliased = np.may_share_memory(array, out)
+    scratch = np.empty_like(out) if len(axes) > 1 or aliased else None
+    # a single scratch buffer is shared among all passes.
+    # the buffers are swapped after each pass
+    # so that the last pass writes the result to `out`.
+
+    src = array
+    num_passes = len(axes)
+    for p, ax in enumerate(axes):
+        dst = out if (num_passes - 1 - p) % 2 == 0 else scratch
+        if p == 0 and aliased and dst is out:
+            np.copyto(scratch, array)
+            src = scratch
+            # the first pass can not read from and write to the same memory.
+
+        kernel(src, dst, ax)
+        src = dst
+
+    return out
+
+
+def _apply_along_axis(
+    src,
+    dst,
+    half_width: int,
+    folded_weights,
+    axis: int,
+    periodic: bool,
+    boundary_block=None,
+):
+    """
+    apply a symmetric stencil along an axis.
+    `src` and `dst` must not share memory.
+
+    Args:
+        src (numpy.ndarray): data to be filtered.
+        dst (numpy.ndarray): array to store the result.
+        half_width (int): half width of the stencil.
+        folded_weights (Callable): function returning the coefficients
+            at points 0, 1, ..., hw of the stencil with half width hw.
+        axis (int): axis along which the stencil is applied.
+        periodic (bool): If True, `src` is treated as periodic.
+        boundary_block (numpy.ndarray, optional): coefficients applied to
+            the points near the lower edge when not periodic.
+            The mirrored block is applied near the upper edge.
+            If None, lower-order central stencils are applied point by point.
+            Defaults to None.
+    """
+    src = np.moveaxis(src, axis, 0)
+    dst = np.moveaxis(dst, axis, 0)
+    # views whose first axis is the filtering axis
+
+    n = src.shape[0]
+    weight = folded_weights(half_width)
+
+    if n > 2 * half_width:
+        inner = dst[half_width : n - half_width]
+        np.multiply(src[half_width : n - half_width], weight[0], out=inner)
+
+        tmp = np.empty_like(inner)
+        for k in range(1, half_width + 1):
+            np.add(
+                src[half_width - k : n - half_width - k],
+                src[half_width + k : n - half_width + k],
+                out=tmp,
+            )
+            tmp *= weight[k]
+            inner += tmp
+        # the filter is symmetric, so the values at +k and -k are summed
+        # before multiplying the coefficient.
+        # f_filtered_i = c_0 f_i + sum_k c_k (f_{i-k} + f_{i+k})
+
+    if not periodic and boundary_block is not None:
+        rows, cols = boundary_block.shape
+        if n >= cols:
+            dst[:rows] = np.tensordot(boundary_block, src[:cols], axes=1)
+            dst[n - rows :] = np.tensordot(
+                boundary_block[::-1, ::-1], src[n - cols :], axes=1
+            )
+            return
+        # filter the points near both edges at once
+        # when the line is long enough to hold the block.
+
+    edges = sorted(
+        set(range(min(half_width, n))) | set(range(max(n - half_width, 0), n))
+    )
+    # points where the central filter of order `acc` does not fit in `src`
+
+    for i in edges:
+        if periodic:
+            w, hw = weight, half_width
+        else:
+            hw = min(i, n - 1 - i, half_width)
+            w = folded_weights(hw)
+            # reduce the order of accuracy near the edges.
+            # the filter is not applied to the points on the edges.
+
+        value = w[0] * src[i]
+        for k in range(1, hw + 1):
+            value = value + w[k] * (src[(i - k) % n] + src[(i + k) % n])
+        dst[i] = value
+
+
+def _apply_compact_along_axis(
+    src, dst, acc: int, alpha: float, axis: int, periodic: bool
+):
+    """
+    apply the compact filter along an axis.
+    `src` and `dst` must not share memory.
+
+    Args:
+        src (numpy.ndarray): data to be filtered.
+        dst (numpy.ndarray): array to store the result.
+        acc (int): Order of accuracy.
+        alpha (float): filter parameter.
+        axis (int): axis along which the filter is applied.
+        periodic (bool): If True, `src` is treated as periodic.
+    """
+    _apply_along_axis(
+        src,
+        dst,
+        acc // 2,
+        lambda hw: _compact_folded_weights(hw, alpha),
+        axis,
+        periodic,
+    )
+    # compute the right-hand side
+
+    n = src.shape[axis]
+    if periodic:
+        off_diag = np.full(n, alpha)
+    else:
+        off_diag = np.array([alpha if 0 < i < n - 1 else 0.0 for i in range(n)])
+        # the filter is not applied to the points on the edges.
+
+    solve_tridiagonal(
+        off_diag, np.ones(n), off_diag, np.moveaxis(dst, axis, 0), periodic
+    )
+
+
+@lru_cache(maxsize=None)
+def _folded_weights(half_width: int):
+    """
+    return the filter coefficients at points 0, 1, 2, ..., half_width
+    as float array, making use of the symmetry of the filter.
+
+    Args:
+        half_width (int): half width of the filter, i.e. acc/2.
+            `0` means no filtering.
+
+    Returns:
+        numpy.ndarray: the coefficients [c_0, c_1, ..., c_{half_width}].
+    """
+    if half_width == 0:
+        weights = np.array([1.0])
+    else:
+        coef = _filter_coefficients(2 * half_width)
+        weights = np.array([float(c) for c in coef[half_width:]])
+    weights.flags.writeable = False
+    # the cached array is shared by all calls.
+
+    return weights
+
+
+@lru_cache(maxsize=None)
+def _boundary_block(acc: int, one_sided: bool):
+    """
+    return the coefficients of the boundary filters as float array.
+
+    Args:
+        acc (int): Order of accuracy of the interior filter.
+        one_sided (bool): If True, return one-sided filters.
+
+    Returns:
+        numpy.ndarray: coefficients with acc/2 rows and acc+1 columns.
+    """
+    block = np.array(
+        [[float(c) for c in row] for row in _boundary_coefficients(acc, one_sided)]
+    )
+    block.flags.writeable = False
+    # the cached array is shared by all calls.
+
+    return block
+
+
+@lru_cache(maxsize=None)
+def _compact_folded_weights(half_width: int, alpha: float):
+    """
+    return the right-hand side coefficients of the compact filter
+    at points 0, 1, 2, ..., half_width as float array.
+
+    Args:
+        half_width (int): half width of the filter, i.e. acc/2.
+            `0` means no filtering.
+        alpha (float): filter parameter.
+
+    Returns:
+        numpy.ndarray: the coefficients [a_0, a_1/2, ..., a_{half_width}/2].
+    """
+    if half_width == 0:
+        weights = np.array([1.0])
+    else:
+        base, slope = _compact_filter_coefficients(2 * half_width)
+        alpha = Fraction(str(alpha))
+        # the decimal representation of alpha is used
+        # as `generate_compact` does.
+
+        weights = np.array(
+            [
+                float(b + c * alpha)
+                for b, c in zip(base[half_width:], slope[half_width:])
+            ]
+        )
+    weights.flags.writeable = False
+    # the cached array is shared by all calls.
+
+    return weights
@@ -35,3 +35,24 @@ class InconsistentDataSetError(LinearAlgebraError):
 
     def __str__(self) -> str:
         return self.message
+
+
+class SingularMatrixError(LinearAlgebraError):
+    """
+    Exception raised for errors
+    that a system of linear equations can not be solved uniquely.
+
+    Attributes:
+        matrix (list of list): coefficient matrix which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, matrix) -> None:
+        self.matrix = matrix
+        self.message = (
+            "The coefficient matrix is singular. "
+            + "Confirm that the conditions imposed on the system are independent."
+        )
+
+    def __str__(self) -> str:
+        return self.message
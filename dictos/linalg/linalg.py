@@ -1,11 +1,10 @@
-import sympy as sp
+import numpy as np
+from fractions import Fraction
 from typing import List, Callable
 from operator import add as add_op, mul as mul_op
-import sympy as sp
 
-from dictos.core.expr import Expr
 from dictos.utilities.spec import are_different_length
-from dictos.linalg.exceptions import InconsistentDataSetError
+from dictos.linalg.exceptions import InconsistentDataSetError, SingularMatrixError
 
 
 def dot_product(vec1, vec2, evaluate: bool = True):
@@ -27,6 +26,8 @@ def dot_product(vec1, vec2, evaluate: bool = True):
     Returns:
         sympy Expr: dot product of the passed two lists.
     """
+    import sympy as sp
+
     if are_different_length(vec1, vec2):
         raise InconsistentDataSetError(vec1, vec2)
         # raise error if
@@ -57,6 +58,8 @@ def div(numer, denom):
     Returns:
         sympy Expr: result of division eq/denom.
     """
+    import sympy as sp
+
     return sp.Mul(numer, 1 / denom)
     # calculate Mul with evaluate=True,
     # because the result with evaluate=False will be like
@@ -107,6 +110,180 @@ def add(a: List, b: List) -> List:
     return _list_op(add_op, a, b)
 
 
+def solve(matrix: List[List], rhs: List) -> List:
+    """
+    solve a system of linear equations exactly.
+
+    Args:
+        matrix (List of List): square coefficient matrix
+            containing sympy numbers.
+        rhs (List): right-hand side. Elements may contain sympy symbols.
+
+    Raises:
+        SingularMatrixError: if the matrix is singular.
+
+    Returns:
+        List: solution of the system.
+
+    Examples:
+        >>> solve([[1, 1], [1, -1]], [3, 1])
+        [2, 1]
+    """
+    import sympy as sp
+
+    a = sp.Matrix(matrix)
+    if not a.is_square or a.det() == 0:
+        raise SingularMatrixError(matrix)
+        # raise error if
+        # - the system can not be solved uniquely.
+
+    return list(a.LUsolve(sp.Matrix(rhs)))
+
+
+def solve_fraction(matrix: List[List], rhs: List) -> List:
+    """
+    solve a system of linear equations of rational numbers exactly
+    by Gauss-Jordan elimination using Fraction,
+    so that numeric paths derive their weights without importing sympy.
+
+    Args:
+        matrix (List of List): square coefficient matrix
+            containing int or Fraction.
+        rhs (List): right-hand side containing int or Fraction.
+
+    Raises:
+        SingularMatrixError: if the matrix is singular.
+
+    Returns:
+        List of Fraction: solution of the system.
+
+    Examples:
+        >>> solve_fraction([[1, 1], [1, -1]], [3, 1])
+        [Fraction(2, 1), Fraction(1, 1)]
+    """
+    n = len(matrix)
+    if any(len(row) != n for row in matrix):
+        raise SingularMatrixError(matrix)
+        # raise error if
+        # - the system can not be solved uniquely.
+
+    a = [[Fraction(v) for v in row] + [Fraction(b)] for row, b in zip(matrix, rhs)]
+    # augmented matrix [A | b]
+
+    for col in range(n):
+        pivot = next((row for row in range(col, n) if a[row][col] != 0), None)
+        if pivot is None:
+            raise SingularMatrixError(matrix)
+            # raise error if
+            # - the system can not be solved uniquely.
+
+        a[col], a[pivot] = a[pivot], a[col]
+        a[col] = [v / a[col][col] for v in a[col]]
+        for row in range(n):
+            if row != col and a[row][col] != 0:
+                factor = a[row][col]
+                a[row] = [v - factor * w for v, w in zip(a[row], a[col])]
+
+    return [row[n] for row in a]
+
+
+def solve_tridiagonal(lower, diag, upper, rhs, periodic: bool = False):
+    """
+    solve tridiagonal systems sharing the same matrix
+    for a batch of right-hand sides.
+    The first axis of `rhs` corresponds to the rows of the matrix,
+    and the systems are solved simultaneously for the other axes.
+
+    Args:
+        lower (array_like): sub-diagonal of length n.
+            `lower[0]` is the upper-right corner element when periodic,
+            otherwise it is not used.
+        diag (array_like): diagonal of length n.
+        upper (array_like): super-diagonal of length n.
+            `upper[-1]` is the lower-left corner element when periodic,
+            otherwise it is not used.
+        rhs (numpy.ndarray): right-hand sides in float.
+            It is overwritten by the solution.
+        periodic (bool, optional): If True, solve cyclic tridiagonal systems.
+            Defaults to False.
+
+    Raises:
+        ValueError: if periodic and the number of rows is less than 3.
+
+    Returns:
+        numpy.ndarray: `rhs` overwritten by the solution.
+
+    Examples:
+        >>> import numpy as np
+        >>> solve_tridiagonal([0, 1, 1], [2, 2, 2], [1, 1, 0], np.array([3.0, 4.0, 3.0]))
+        array([1., 1., 1.])
+    """
+    lower = np.array(lower, dtype=np.float64)
+    diag = np.array(diag, dtype=np.float64)
+    upper = np.array(upper, dtype=np.float64)
+
+    if not periodic:
+        _thomas(lower, diag, upper, rhs)
+        return rhs
+
+    n = len(diag)
+    if n < 3:
+        raise ValueError(f"cyclic tridiagonal system requires 3 or more rows, got {n}.")
+
+    beta = lower[0]
+    alpha = upper[-1]
+    gamma = -diag[0]
+    lower[0] = 0.0
+    upper[-1] = 0.0
+    diag[0] -= gamma
+    diag[-1] -= alpha * beta / gamma
+    # the corner elements are removed by the Sherman-Morrison formula.
+    # A = A' + u v^T, u = [gamma, 0, ..., 0, alpha], v = [1, 0, ..., 0, beta/gamma]
+
+    u = np.zeros(n)
+    u[0] = gamma
+    u[-1] = alpha
+
+    _thomas(lower, diag, upper, rhs)
+    _thomas(lower, diag, upper, u)
+
+    factor = (rhs[0] + beta * rhs[-1] / gamma) / (1.0 + u[0] + beta * u[-1] / gamma)
+    rhs -= u.reshape((n,) + (1,) * (rhs.ndim - 1)) * factor
+
+    return rhs
+
+
+def _thomas(lower, diag, upper, rhs):
+    """
+    solve tridiagonal systems by the Thomas algorithm.
+    Each step of elimination is vectorized over the axes of `rhs`
+    except the first one.
+
+    Args:
+        lower (numpy.ndarray): sub-diagonal. `lower[0]` is not used.
+        diag (numpy.ndarray): diagonal.
+        upper (numpy.ndarray): super-diagonal. `upper[-1]` is not used.
+        rhs (numpy.ndarray): right-hand sides overwritten by the solution.
+    """
+    n = len(diag)
+    upper_ = np.empty(n)
+    inv_pivot = np.empty(n)
+    inv_pivot[0] = 1.0 / diag[0]
+    upper_[0] = upper[0] * inv_pivot[0]
+    for i in range(1, n):
+        inv_pivot[i] = 1.0 / (diag[i] - lower[i] * upper_[i - 1])
+        upper_[i] = upper[i] * inv_pivot[i]
+    # factorization depends only on the matrix,
+    # and is shared among all right-hand sides.
+
+    rhs[0] *= inv_pivot[0]
+    for i in range(1, n):
+        rhs[i] -= lower[i] * rhs[i - 1]
+        rhs[i] *= inv_pivot[i]
+    for i in range(n - 2, -1, -1):
+        rhs[i] -= upper_[i] * rhs[i + 1]
+
+
 def _list_op(op: Callable, *lists: List) -> List:
     """
     apply element-wise operation to multiple lists
@@ -0,0 +1,222 @@
+import numpy as np
+
+from dictos.poly.exceptions import InconsistentDataSetError
+from dictos.discrete.exceptions import DuplicatedPointError, TooNarrowError
+from dictos.utilities.spec import (
+    has_duplicated_points,
+    narrower_than_minimum_width,
+)
+
+
+class BarycentricInterpolator:
+    """
+    A numerical Lagrangian interpolant on a fixed set of nodes
+    evaluated by the barycentric formula.
+
+    The barycentric weights are calculated once when the instance is created,
+    in O(n**2) operations for n nodes.
+    Evaluating the interpolant at a target costs O(n) operations,
+    and all targets are evaluated at once using NumPy.
+    Since the weights do not depend on the function values,
+    an instance can be reused for many data sets sharing the same nodes.
+
+    Attributes:
+        nodes (ndarray): coordinates of nodes.
+        weights (ndarray): barycentric weights
+            w_i = 1/prod_{j != i}(x_i - x_j).
+
+    Examples:
+        >>> from dictos.poly.barycentric import BarycentricInterpolator
+        >>> import numpy as np
+        >>> interp = BarycentricInterpolator([-1, 0, 1])
+        >>> interp([1, 0, 1], np.array([-0.5, 0.5, 2.0]))
+        array([0.25, 0.25, 4.  ])
+        >>> interp.derivative([1, 0, 1], np.array([-0.5, 0.5, 2.0]))
+        array([-1.,  1.,  4.])
+    """
+
+    __slots__ = ("nodes", "weights")
+
+    def __init__(self, nodes):
+        """
+        Create a new BarycentricInterpolator instance.
+
+        Args:
+            nodes (list of int or float, or ndarray): coordinates of nodes.
+
+        Raises:
+            TooNarrowError: if nodes are too narrow.
+            DuplicatedPointError: if at least a node appears more than once.
+        """
+        if narrower_than_minimum_width(nodes):
+            raise TooNarrowError(nodes)
+            # raise error if
+            # - nodes are too narrow
+        if has_duplicated_points(list(nodes)):
+            raise DuplicatedPointError(nodes)
+            # raise error if
+            # - at least a node appears more than once.
+
+        self.nodes = np.asarray(nodes, dtype=np.float64)
+        self.weights = _weights(self.nodes)
+
+    def __len__(self) -> int:
+        return self.nodes.size
+
+    def __call__(self, values, targets):
+        """
+        evaluate the interpolant at targets.
+
+        Args:
+            values (array_like): function values at nodes.
+                The first axis corresponds to nodes,
+                and the trailing axes are evaluated independently.
+            targets (array_like): coordinates where the interpolant is evaluated.
+
+        Raises:
+            InconsistentDataSetError: if nodes and values are inconsistent.
+
+        Returns:
+            ndarray: interpolated values of shape
+                targets.shape + values.shape[1:].
+        """
+        return self._contract(self.basis(targets), values, targets)
+
+    def derivative(self, values, targets):
+        """
+        evaluate the first derivative of the interpolant at targets.
+
+        Args:
+            values (array_like): function values at nodes.
+                The first axis corresponds to nodes,
+                and the trailing axes are evaluated independently.
+            targets (array_like): coordinates where the derivative is evaluated.
+
+        Raises:
+            InconsistentDataSetError: if nodes and values are inconsistent.
+
+        Returns:
+            ndarray: derivatives of shape targets.shape + values.shape[1:].
+        """
+        return self._contract(self.derivative_basis(targets), values, targets)
+
+    def basis(self, targets):
+        """
+        evaluate all Lagrangian basis polynomials at targets.
+
+        Args:
+            targets (array_like): coordinates where the basis is evaluated.
+
+        Returns:
+            ndarray: basis values l_j(x) of shape (m, n)
+                for m targets and n nodes.
+        """
+        x = np.asarray(targets, dtype=np.float64).reshape(-1)
+        diff = x[:, np.newaxis] - self.nodes[np.newaxis, :]
+
+        exact = diff == 0
+        # targets coinciding with nodes.
+        on_node = exact.any(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = self.weights / diff
+            basis = c / c.sum(axis=1, keepdims=True)
+            # the second (true) form of the barycentric formula,
+            # l_j(x) = (w_j/(x - x_j)) / sum_k w_k/(x - x_k).
+
+        basis[on_node] = exact[on_node]
+        # the basis is the Kronecker delta at nodes.
+
+        return basis
+
+    def derivative_basis(self, targets):
+        """
+        evaluate the first derivative of all Lagrangian basis polynomials
+        at targets.
+
+        Args:
+            targets (array_like): coordinates where the derivative is evaluated.
+
+        Returns:
+            ndarray: derivatives l'_j(x) of shape (m, n)
+                for m targets and n nodes.
+        """
+        x = np.asarray(targets, dtype=np.float64).reshape(-1)
+        diff = x[:, np.newaxis] - self.nodes[np.newaxis, :]
+
+        exact = diff == 0
+        on_node = exact.any(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = self.weights / diff
+            s = c.sum(axis=1, keepdims=True)
+            t = (c / diff).sum(axis=1, keepdims=True) / s
+            deriv = c / s * (t - 1 / diff)
+            # l'_j(x) = l_j(x) * (sum_k c_k/(x - x_k) / sum_k c_k - 1/(x - x_j)),
+            # where c_k = w_k/(x - x_k).
+
+        if on_node.any():
+            deriv[on_node] = self.differentiation_matrix()[
+                exact[on_node].argmax(axis=1)
+            ]
+            # use rows of the differentiation matrix at nodes.
+
+        return deriv
+
+    def differentiation_matrix(self):
+        """
+        calculate the differentiation matrix D_ij = l'_j(x_i).
+
+        Returns:
+            ndarray: differentiation matrix of shape (n, n).
+        """
+        diff = self.nodes[:, np.newaxis] - self.nodes[np.newaxis, :]
+        np.fill_diagonal(diff, 1)
+
+        d = self.weights[np.newaxis, :] / self.weights[:, np.newaxis] / diff
+        np.fill_diagonal(d, 0)
+        np.fill_diagonal(d, -d.sum(axis=1))
+        # D_ij = (w_j/w_i)/(x_i - x_j) for i != j, and
+        # D_ii = -sum_{j != i} D_ij since derivative of a constant is 0.
+
+        return d
+
+    def _contract(self, basis, values, targets):
+        """
+        contract basis with values along nodes.
+
+        Args:
+            basis (ndarray): basis values of shape (m, n).
+            values (array_like): function values at nodes.
+            targets (array_like): coordinates used to restore the shape.
+
+        Raises:
+            InconsistentDataSetError: if nodes and values are inconsistent.
+
+        Returns:
+            ndarray: contracted values.
+        """
+        values = np.asarray(values)
+        if values.ndim == 0 or values.shape[0] != self.nodes.size:
+            raise InconsistentDataSetError(self.nodes, np.atleast_1d(values))
+            # raise error if
+            # nodes and values are inconsistent.
+
+        result = np.tensordot(basis, values, axes=(1, 0))
+        return result.reshape(np.shape(targets) + values.shape[1:])
+
+
+def _weights(nodes):
+    """
+    calculate barycentric weights w_i = 1/prod_{j != i}(x_i - x_j).
+
+    Args:
+        nodes (ndarray): coordinates of nodes.
+
+    Returns:
+        ndarray: barycentric weights.
+    """
+    diff = nodes[:, np.newaxis] - nodes[np.newaxis, :]
+    np.fill_diagonal(diff, 1)
+
+    return 1 / diff.prod(axis=1)
@@ -79,3 +79,24 @@ class InconsistentDataSetAndDegreeOfPolynomialError(LagrangianPolynomialError):
 
     def __str__(self) -> str:
         return self.message
+
+
+class UnsupportedOrderOfKnownDerivativeError(LagrangianPolynomialError):
+    """
+    Exception raised for errors
+    that the order of known derivative is not a non-negative integer.
+
+    Attributes:
+        order (int): order of derivative which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, order) -> None:
+        self.order = order
+        self.message = (
+            f"The order of known derivative ({order}) is not supported. "
+            + "Specify a non-negative integer, 0 for the function value."
+        )
+
+    def __str__(self) -> str:
+        return self.message
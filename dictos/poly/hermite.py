@@ -0,0 +1,148 @@
+import sympy as sp
+from functools import lru_cache
+
+from dictos.utilities.spec import (
+    are_different_length,
+    has_duplicated_points,
+    is_positive_integer,
+)
+from dictos.utilities.utils import simplify_coefficients
+from dictos.linalg.linalg import solve
+from dictos.poly.exceptions import (
+    InconsistentDataSetError,
+    UnsupportedOrderOfKnownDerivativeError,
+)
+from dictos.discrete.exceptions import DuplicatedPointError
+
+
+def coefficients(
+    stencil: list,
+    known: list = None,
+    deriv: int = 0,
+    as_numer_denom: bool = False,
+):
+    """
+    derive Hermite coefficients based on given stencil
+    and derivatives known at each point.
+    The coefficients approximate the deriv-th derivative at 0 as
+    f^(deriv)(0) = sum c_{s,k} h**(k-deriv) f^(k)(s*h),
+    where k runs over the orders of derivatives known at the point s.
+    The coefficients are obtained by solving the moment system exactly,
+    so that polynomials up to degree (number of coefficients - 1) are exact.
+
+    Args:
+        stencil (list of int or float): relative point numbers
+            used for discretization.
+        known (list of list of int, optional): orders of derivatives
+            known at each point in the stencil. 0 means the function value.
+            Defaults to None, which means the function value and
+            the first derivative are known at every point.
+        deriv (int, optional): order of derivative to be approximated.
+            Defaults to 0, i.e. interpolation.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        InconsistentDataSetError: if stencil and known are inconsistent.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+        UnsupportedOrderOfKnownDerivativeError: if an order of derivative
+            is not a non-negative integer.
+        SingularMatrixError: if the coefficients are not determined uniquely.
+
+    Returns:
+        dict of (point, order) and sympy Rational: coefficients
+            keyed by the point in the stencil and the order of known derivative.
+            or
+        dict of (point, order) and sympy numbers, int:
+            numerators and the denominator of coefficients.
+
+    Examples:
+        >>> from dictos.poly import hermite
+        >>> hermite.coefficients([-1, 1])
+        {(-1, 0): 1/2, (-1, 1): 1/4, (1, 0): 1/2, (1, 1): -1/4}
+        >>> hermite.coefficients([-1, 1], deriv=1, as_numer_denom=True)
+        ({(-1, 0): -3, (-1, 1): -1, (1, 0): 3, (1, 1): -1}, 4)
+    """
+    if known is None:
+        known = [[0, 1]] * len(stencil)
+
+    if are_different_length(stencil, known):
+        raise InconsistentDataSetError(stencil, known)
+        # raise error if
+        # stencil and known are inconsistent.
+    if has_duplicated_points(stencil):
+        raise DuplicatedPointError(stencil)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+    for orders in known:
+        for k in orders:
+            if not is_positive_integer(k, include_zero=True):
+                raise UnsupportedOrderOfKnownDerivativeError(k)
+                # raise error if
+                # - an order of derivative is negative or not an integer.
+    if not is_positive_integer(deriv, include_zero=True):
+        raise UnsupportedOrderOfKnownDerivativeError(deriv)
+
+    keys = [
+        (s, k)
+        for s, orders in sorted(zip(stencil, known), key=lambda pair: pair[0])
+        for k in sorted(set(orders))
+    ]
+    # pairs of point and order of derivative
+    # arranged in the order of the sorted stencil.
+
+    coef = _hermite_coefficients(
+        tuple((sp.nsimplify(s, rational=True), k) for s, k in keys), deriv
+    )
+
+    if not as_numer_denom:
+        return dict(zip(keys, coef))
+
+    numer, denom = simplify_coefficients(list(coef), as_numer_denom=True)
+    return dict(zip(keys, numer)), denom
+
+
+@lru_cache(maxsize=None)
+def _hermite_coefficients(keys: tuple, deriv: int) -> tuple:
+    """
+    solve the moment system for Hermite coefficients.
+    Results are cached for each pair of keys and order of derivative.
+
+    Args:
+        keys (tuple of tuple of sympy Rational and int):
+            pairs of point and order of known derivative.
+        deriv (int): order of derivative to be approximated.
+
+    Returns:
+        tuple of sympy Rational: coefficients.
+    """
+    num_coef = len(keys)
+
+    matrix = [
+        [_derivative_of_monomial(m, k, s) for s, k in keys] for m in range(num_coef)
+    ]
+    rhs = [_derivative_of_monomial(m, deriv, sp.Integer(0)) for m in range(num_coef)]
+    # the approximation is exact for monomials x**m, m = 0, 1, ..., num_coef-1:
+    # sum c_{s,k} d^k/dx^k (x**m)|_{x=s} = d^deriv/dx^deriv (x**m)|_{x=0}
+
+    return tuple(solve(matrix, rhs))
+
+
+def _derivative_of_monomial(m: int, k: int, x):
+    """
+    calculate the k-th derivative of x**m at x.
+
+    Args:
+        m (int): degree of the monomial.
+        k (int): order of derivative.
+        x (sympy Rational): point where the derivative is evaluated.
+
+    Returns:
+        sympy Rational: m!/(m-k)! x**(m-k), or 0 if k > m.
+    """
+    if k > m:
+        return sp.Integer(0)
+
+    return sp.ff(m, k) * x ** (m - k)
@@ -1,28 +1,38 @@
-import sympy as sp
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
 
+from dictos.utilities.profiling import profiled
 from dictos.defaults import (
     DEFAULT_INTERVAL,
     DEFAULT_DIFFERENTIAND,
     DEFAULT_INDEPENDENT_VARIABLE,
 )
-from dictos.utilities.spec import has_zero
-from dictos.discrete.stencil import (
-    create_coordinate_symbols,
-    create_differentiand_symbols,
+from dictos.utilities.array import normalize_axes
+from dictos.utilities.spec import (
+    has_zero,
+    has_duplicated_points,
+    is_not_natural_number,
+    narrower_than_minimum_width,
+    is_valid_accuracy_order_for_generating_central_form,
 )
-from dictos.utilities.utils import (
-    simplify_coefficients,
-    extract_coefficients_as_numer_denom,
-    sort_by_subscript,
+from dictos.poly.barycentric import BarycentricInterpolator
+from dictos.poly.weights import lagrange_weights
+from dictos.discrete.exceptions import (
+    ContainsZeroError,
+    DuplicatedPointError,
+    TooNarrowError,
 )
-from dictos.linalg.linalg import dot_product
-from dictos.poly.lagrangian_polynomial import lagrangian_poly
-from dictos.series.taylor_expansion import taylor_series
-from dictos.discrete.exceptions import ContainsZeroError
-from dictos.core.expr import Expr
+from dictos.calculus.exceptions import InvalidOrderOfAccuracyForCentralFormError
 
+# weights for arrays are derived in exact rational arithmetic
+# using Fraction, so that `fill_ghost_cells`, `to_cell_centers` and `to_nodes`
+# run without importing sympy.
+# sympy is imported by the functions returning sympy objects.
 
-def equation(stencil: list, sort: bool = True) -> Expr:
+
+@profiled("interpolation.equation", "stencil")
+def equation(stencil: list, sort: bool = True):
     """
     derive interpolation equation based on given stencil.
     The equation compute interpolation at stencil = 0
@@ -41,6 +51,13 @@ def equation(stencil: list, sort: bool = True) -> Expr:
         >>> intp.equation([-1.5, -0.5, 0.5, 1.5])
         (-f_{-1.5} + 9*f_{-0.5} + 9*f_{0.5} - f_{1.5})/16
     """
+    from dictos.discrete.stencil import (
+        create_coordinate_symbols,
+        create_differentiand_symbols,
+    )
+    from dictos.utilities.utils import sort_by_subscript
+    from dictos.linalg.linalg import dot_product
+    from dictos.core.expr import Expr
 
     x_set = create_coordinate_symbols(stencil, DEFAULT_INTERVAL)
     f_set = create_differentiand_symbols(x_set, DEFAULT_DIFFERENTIAND)
@@ -61,6 +78,7 @@ def equation(stencil: list, sort: bool = True) -> Expr:
     return Expr(eq)
 
 
+@profiled("interpolation.coefficients", "stencil")
 def coefficients(stencil: list, as_numer_denom: bool = False):
     """
     derive interpolation coefficients based on given stencil.
@@ -92,10 +110,29 @@ def coefficients(stencil: list, as_numer_denom: bool = False):
         >>> intp.coefficients([-1.5, -0.5, 0.5, 1.5], as_numer_denom=True)
         ([-1, 9, 9, -1], 16)
     """
+    import sympy as sp
+    from dictos.discrete.stencil import (
+        Stencil,
+        create_coordinate_symbols,
+        create_differentiand_symbols,
+        has_exact_points,
+    )
+    from dictos.utilities.utils import (
+        simplify_coefficients,
+        extract_coefficients_as_numer_denom,
+    )
+    from dictos.poly.lagrangian_polynomial import lagrangian_poly, fornberg_weights
+
     if has_zero(stencil):
         raise ContainsZeroError
         # raise error if stencil contains 0
 
+    if has_exact_points(stencil):
+        coef = fornberg_weights(Stencil(stencil).offsets)
+        return simplify_coefficients(coef, as_numer_denom)
+        # a stencil of int or Fraction is processed in exact rational arithmetic
+        # without constructing the Lagrangian polynomial symbolically.
+
     x_set = create_coordinate_symbols(stencil, DEFAULT_INTERVAL)
     f_set = create_differentiand_symbols(x_set, DEFAULT_DIFFERENTIAND)
     # create set of coordinate and differentiand symbols from stencil.
@@ -119,6 +156,130 @@ def coefficients(stencil: list, as_numer_denom: bool = False):
     # simplify floating-point number coefficients to ratioanl numbers
 
 
+def coefficients_at(stencil: list, targets, as_polynomial: bool = False):
+    """
+    derive interpolation coefficients based on given stencil
+    at arbitrary target positions.
+
+    Args:
+        stencil (list of int or float): relative point numbers
+            used for discretization.
+        targets (number, list of numbers, or ndarray): target positions
+            in units of the interval.
+            Coefficients are derived exactly for a number or a list,
+            and are evaluated in float64 for an ndarray.
+        as_polynomial (bool, optional): flag to also return
+            the coefficients as polynomials in the target position.
+            Defaults to False.
+
+    Raises:
+        TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        list of list of sympy Rational: coefficients for each target,
+            when targets is a number or a list.
+            or
+        ndarray: coefficients of shape targets.shape + (len(stencil),),
+            when targets is an ndarray.
+            Coefficients are arranged in the order of the sorted stencil.
+            When `as_polynomial` is True,
+            a list of sympy Expr in the independent variable is also returned.
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> import numpy as np
+        >>> intp.coefficients_at([0, 1], [0.25, 0.5])
+        [[3/4, 1/4], [1/2, 1/2]]
+        >>> intp.coefficients_at([0, 1], np.array([0.25, 0.5]))
+        array([[0.75, 0.25],
+               [0.5 , 0.5 ]])
+        >>> intp.coefficients_at([-1, 0, 1], 0.5, as_polynomial=True)
+        ([[-1/8, 3/4, 3/8]], [x**2/2 - x/2, 1 - x**2, x**2/2 + x/2])
+    """
+    if narrower_than_minimum_width(stencil):
+        raise TooNarrowError(stencil)
+        # raise error if
+        # - stencil is too narrow
+    if has_duplicated_points(stencil):
+        raise DuplicatedPointError(stencil)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+
+    sorted_stencil = sorted(stencil)
+    # coefficients are arranged in the order of the sorted stencil.
+
+    if isinstance(targets, np.ndarray):
+        coef = BarycentricInterpolator(sorted_stencil).basis(targets)
+        coef = coef.reshape(targets.shape + (len(sorted_stencil),))
+        # evaluate basis polynomials at all targets at once.
+    else:
+        from dictos.poly.lagrangian_polynomial import basis_values
+
+        if np.ndim(targets) == 0:
+            targets = [targets]
+        coef = [basis_values(sorted_stencil, t) for t in targets]
+        # evaluate basis polynomials exactly.
+
+    if not as_polynomial:
+        return coef
+
+    import sympy as sp
+    from dictos.poly.lagrangian_polynomial import lagrangian_basis
+
+    x = sp.symbols(DEFAULT_INDEPENDENT_VARIABLE)
+    x_set = [sp.nsimplify(s) for s in sorted_stencil]
+    degree = len(x_set) - 1
+    poly = [sp.expand(lagrangian_basis(x, degree, i, x_set)) for i in range(len(x_set))]
+    # Lagrangian basis polynomials in the target position.
+
+    return coef, poly
+
+
+def hermite_coefficients(
+    stencil: list, known: list = None, as_numer_denom: bool = False
+):
+    """
+    derive interpolation coefficients based on given stencil
+    using function values and derivatives known at each point.
+    The coefficients c_{s,k} interpolate the value at 0 as
+    f(0) = sum c_{s,k} h**k f^(k)(s*h).
+
+    Args:
+        stencil (list of int or float): relative point numbers
+            used for discretization.
+        known (list of list of int, optional): orders of derivatives
+            known at each point in the stencil. 0 means the function value.
+            Defaults to None, which means the function value and
+            the first derivative are known at every point.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        SingularMatrixError: if the coefficients are not determined uniquely.
+
+    Returns:
+        dict of (point, order) and sympy Rational: coefficients
+            keyed by the point in the stencil and the order of known derivative.
+            or
+        dict of (point, order) and sympy numbers, int:
+            numerators and the denominator of coefficients.
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> intp.hermite_coefficients([-1, 1])
+        {(-1, 0): 1/2, (-1, 1): 1/4, (1, 0): 1/2, (1, 1): -1/4}
+        >>> intp.hermite_coefficients([-1.5, -0.5, 0.5, 1.5], [[0], [0, 1], [0, 1], [0]])
+        {(-1.5, 0): 1/128, (-0.5, 0): 63/128, (-0.5, 1): 9/64, (0.5, 0): 63/128, (0.5, 1): -9/64, (1.5, 0): 1/128}
+    """
+    from dictos.poly import hermite
+
+    return hermite.coefficients(stencil, known, 0, as_numer_denom)
+
+
+@profiled("interpolation.truncation_error", "stencil")
 def truncation_error(stencil: list, interval: str = DEFAULT_INTERVAL):
     """
     derive the leading-order of error term
@@ -140,32 +301,417 @@ def truncation_error(stencil: list, interval: str = DEFAULT_INTERVAL):
         >>> intp.truncation_error([-1.5, -0.5, 0.5, 1.5])
         3*f^(4)*h**4/128
     """
+    import sympy as sp
+    from dictos.discrete.stencil import exact_points
+    from dictos.series.taylor_expansion import derivative_symbol
+    from dictos.series.power_series import PowerSeries, to_rational
 
     coef = coefficients(stencil)
     # derive interpolation coefficients based on given stencil
 
-    x_set = create_coordinate_symbols(stencil, interval=interval)
-    # create set of coordinate symbols from stencil.
-    # [-2, -1, 1, 2] -> [-2*h, -h, h, 2*h]
+    sorted_stencil = exact_points(stencil)
+    # coefficients are arranged in the order of the sorted stencil.
+    # points are converted to rational numbers consistently with coefficients.
 
-    num_term = len(x_set)
-    f_te = [taylor_series(x, num_term) for x in x_set]
-    # calculate Taylor series around points in x_set.
+    num_term = len(sorted_stencil)
+    f_te = [PowerSeries.taylor(s, num_term) for s in sorted_stencil]
+    # calculate Taylor series around points in the stencil.
 
-    intp_eq = dot_product(coef, f_te)
+    intp_eq = PowerSeries.dot(coef, f_te)
     # calculate weighted sum of Taylor series.
     # for instance, 2nd-order 2-point interpolation is
     # intp_eq [= f(h)/2 + f(-h)/2)] = f(0) + f^(2)*h**2/2 + ...
 
+    order, error = (PowerSeries.unit(0) - intp_eq).leading_term()
+    if order is None:
+        return sp.Integer(0)
+
     h = sp.symbols(interval)
-    return sp.expand(
-        sp.simplify(
-            sp.symbols(DEFAULT_DIFFERENTIAND)
-            - sp.nsimplify(intp_eq, rational=True, tolerance=1e-10)
-        )
-    ).as_leading_term(h)
+    return (
+        to_rational(error)
+        * derivative_symbol(DEFAULT_DIFFERENTIAND, order)
+        * h**order
+    )
     # extract the leading-order of errer term.
     # A interpolation formulation with error term is, for instance,
     # f(0) = (f(h) + f(-h))/2 - f^(2)*h**2/2 - ...
     # to extract error terms, reformulate intp_eq as
     # f(0) - intp_eq = - f^(2)*h**2/2 - ...
+
+
+def extrapolation_coefficients(stencil: list, target, as_numer_denom: bool = False):
+    """
+    derive extrapolation coefficients based on given stencil
+    to estimate a value at the target position.
+    The target can be outside the stencil, e.g. a ghost cell.
+
+    Args:
+        stencil (list of int or float): relative point numbers
+            used for discretization.
+        target (int, float, or sympy Rational): relative position
+            where the value is estimated.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        list of sympy Rational: simplified coefficients.
+            or
+        list of sympy numbers, int:
+            numerator and denominator of coefficients.
+            coefficients are commutative
+            with the least common multiple of the denominator.
+            Coefficients are arranged in the order of the sorted stencil.
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> intp.extrapolation_coefficients([1, 2, 3, 4], -1)
+        [10, -20, 15, -4]
+        >>> intp.extrapolation_coefficients([0.5, 1.5], -0.5, as_numer_denom=True)
+        ([2, -1], 1)
+    """
+    from dictos.utilities.utils import simplify_coefficients
+    from dictos.series.power_series import to_fraction, to_rational
+
+    if narrower_than_minimum_width(stencil):
+        raise TooNarrowError(stencil)
+        # raise error if
+        # - stencil is too narrow
+    if has_duplicated_points(stencil):
+        raise DuplicatedPointError(stencil)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+
+    coef = lagrange_weights(
+        tuple(sorted(to_fraction(s) for s in stencil)), to_fraction(target)
+    )
+
+    return simplify_coefficients([to_rational(c) for c in coef], as_numer_denom)
+
+
+def extrapolation_error(stencil: list, target, interval: str = DEFAULT_INTERVAL):
+    """
+    derive the leading-order of error term
+    in the extrapolation equation based on the given stencil.
+    Derivatives in the error term are evaluated at the target position.
+
+    Args:
+        stencil (list of int or float): relative point numbers
+            used for discretization.
+        target (int, float, or sympy Rational): relative position
+            where the value is estimated.
+        interval (str, optional): an interval symbol like `dx`.
+            Defaults to DEFAULT_INTERVAL.
+
+    Raises:
+        TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        sympy Expr: the leading-order of error term
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> intp.extrapolation_error([1, 2], 0)
+        f^(2)*h**2
+        >>> intp.extrapolation_error([1, 2, 3, 4], -1)
+        5*f^(4)*h**4
+    """
+    import sympy as sp
+    from dictos.series.taylor_expansion import derivative_symbol
+    from dictos.series.power_series import PowerSeries, to_fraction, to_rational
+
+    if narrower_than_minimum_width(stencil):
+        raise TooNarrowError(stencil)
+        # raise error if
+        # - stencil is too narrow
+    if has_duplicated_points(stencil):
+        raise DuplicatedPointError(stencil)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+
+    sorted_stencil = tuple(sorted(to_fraction(s) for s in stencil))
+    t = to_fraction(target)
+    coef = lagrange_weights(sorted_stencil, t)
+
+    num_term = len(sorted_stencil)
+    f_te = [PowerSeries.taylor(s - t, num_term) for s in sorted_stencil]
+    # calculate Taylor series around the target.
+    # the stencil is shifted so that the target is placed at 0.
+
+    order, error = (PowerSeries.unit(0) - PowerSeries.dot(coef, f_te)).leading_term()
+    if order is None:
+        return sp.Integer(0)
+
+    h = sp.symbols(interval)
+    return (
+        to_rational(error)
+        * derivative_symbol(DEFAULT_DIFFERENTIAND, order)
+        * h**order
+    )
+
+
+def fill_ghost_cells(array, n_ghost: int, order: int, axis: int = -1):
+    """
+    fill ghost cells at both ends of an array along an axis
+    by polynomial extrapolation from interior points.
+    A ghost cell at distance g from the first interior point
+    is extrapolated from `order` interior points nearest to the boundary,
+    and the other end is filled symmetrically.
+
+    Args:
+        array (array_like): an array including `n_ghost` ghost cells
+            at both ends along `axis`. An ndarray is modified in place.
+        n_ghost (int): number of ghost cells at each end.
+        order (int): number of interior points used for extrapolation,
+            i.e. order of accuracy of extrapolation.
+        axis (int, optional): axis along which ghost cells are filled.
+            Defaults to -1.
+
+    Raises:
+        ValueError: if `n_ghost` or `order` is not the natural number,
+            if `axis` is out of range,
+            or if number of interior points is less than `order`.
+
+    Returns:
+        ndarray: the array with filled ghost cells.
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> import numpy as np
+        >>> a = np.array([0.0, 0.0, 1.0, 4.0, 9.0, 16.0, 0.0, 0.0])
+        >>> intp.fill_ghost_cells(a, n_ghost=2, order=3)
+        array([ 1.,  0.,  1.,  4.,  9., 16., 25., 36.])
+    """
+    if is_not_natural_number(n_ghost) or is_not_natural_number(order):
+        raise ValueError(
+            f"`n_ghost` ({n_ghost}) and `order` ({order}) must be the natural number."
+        )
+    array = np.asarray(array)
+    (axis,) = normalize_axes(axis, array.ndim)
+
+    view = np.moveaxis(array, axis, -1)
+    n = view.shape[-1]
+    if n - 2 * n_ghost < order:
+        raise ValueError(
+            f"extrapolation of order {order} requires {order} or more interior points, "
+            + f"got {n - 2 * n_ghost}."
+        )
+
+    for g in range(1, n_ghost + 1):
+        weights = _extrapolation_weights(g, order)
+        lower = view[..., n_ghost : n_ghost + order]
+        upper = view[..., n - n_ghost - 1 : n - n_ghost - 1 - order : -1]
+        view[..., n_ghost - g] = lower @ weights
+        view[..., n - n_ghost - 1 + g] = upper @ weights
+        # the ghost cell at -g is extrapolated from interior points
+        # at 0, 1, ..., order-1.
+        # the other end uses the same weights on the reversed points.
+
+    return array
+
+
+def to_cell_centers(array, acc: int, axis: int = -1, out=None, periodic: bool = False):
+    """
+    interpolate values at nodes to cell centers along an axis.
+    The cell center k is placed between the nodes k and k+1.
+
+    Args:
+        array (ndarray): values at nodes.
+        acc (int): order of accuracy, i.e. number of points used for interpolation.
+            It must be a positive even number.
+        axis (int, optional): axis along which values are interpolated.
+            Defaults to -1.
+        out (ndarray, optional): an array to store the result.
+            Defaults to None.
+        periodic (bool, optional): flag to treat the axis as periodic.
+            When False, stencils are shifted into the array near the ends.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not positive and even.
+        ValueError: if `axis` is out of range,
+            if the length of `array` along `axis` is less than `acc`,
+            or if the shape of `out` is inconsistent.
+
+    Returns:
+        ndarray: values at cell centers.
+            The length along `axis` is n-1 for n nodes, or n if periodic.
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> import numpy as np
+        >>> intp.to_cell_centers(np.arange(5.0) ** 2, acc=2)
+        array([ 0.5,  2.5,  6.5, 12.5])
+        >>> intp.to_cell_centers(np.arange(5.0) ** 2, acc=4)
+        array([ 0.25,  2.25,  6.25, 12.25])
+    """
+    return _transfer(array, acc, axis, out, periodic, to_center=True)
+
+
+def to_nodes(array, acc: int, axis: int = -1, out=None, periodic: bool = False):
+    """
+    interpolate values at cell centers to nodes along an axis.
+    The node k is placed between the cell centers k-1 and k.
+
+    Args:
+        array (ndarray): values at cell centers.
+        acc (int): order of accuracy, i.e. number of points used for interpolation.
+            It must be a positive even number.
+        axis (int, optional): axis along which values are interpolated.
+            Defaults to -1.
+        out (ndarray, optional): an array to store the result.
+            Defaults to None.
+        periodic (bool, optional): flag to treat the axis as periodic.
+            When False, stencils are shifted into the array near the ends
+            and values at end nodes are extrapolated.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not positive and even.
+        ValueError: if `axis` is out of range,
+            if the length of `array` along `axis` is less than `acc`,
+            or if the shape of `out` is inconsistent.
+
+    Returns:
+        ndarray: values at nodes.
+            The length along `axis` is m+1 for m cells, or m if periodic.
+
+    Examples:
+        >>> from dictos import interpolation as intp
+        >>> import numpy as np
+        >>> intp.to_nodes(np.arange(4.0) + 0.5, acc=2)
+        array([0., 1., 2., 3., 4.])
+    """
+    return _transfer(array, acc, axis, out, periodic, to_center=False)
+
+
+def _transfer(array, acc: int, axis: int, out, periodic: bool, to_center: bool):
+    """
+    interpolate values between nodes and cell centers along an axis.
+
+    Args:
+        array (ndarray): values to be interpolated.
+        acc (int): order of accuracy.
+        axis (int): axis along which values are interpolated.
+        out (ndarray or None): an array to store the result.
+        periodic (bool): flag to treat the axis as periodic.
+        to_center (bool): True to interpolate to the position +1/2,
+            False to interpolate to the position -1/2.
+
+    Returns:
+        ndarray: interpolated values.
+    """
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    array = np.asarray(array)
+    (axis,) = normalize_axes(axis, array.ndim)
+
+    src = np.moveaxis(array, axis, -1)
+    n_in = src.shape[-1]
+    if n_in < acc:
+        raise ValueError(
+            f"interpolation of order {acc} requires {acc} or more points "
+            + f"along axis {axis}, got {n_in}."
+        )
+
+    if periodic:
+        n_out = n_in
+    else:
+        n_out = n_in - 1 if to_center else n_in + 1
+
+    shape = list(array.shape)
+    shape[axis] = n_out
+    shape = tuple(shape)
+    if out is None:
+        out = np.empty(shape, dtype=np.result_type(array.dtype, np.float64))
+    elif out.shape != shape:
+        raise ValueError(f"shape of `out` {out.shape} must be {shape} for the result.")
+    dst = np.moveaxis(out, axis, -1)
+
+    half_width = acc // 2
+    offset = (1 if to_center else 0) - half_width
+    # the central stencil for the output k starts at the input k + offset.
+    # [k+1-h, ..., k+h] for the cell center k+1/2, and
+    # [k-h, ..., k+h-1] for the node k-1/2 in units of cell index.
+
+    lo = max(0, -offset)
+    hi = min(n_out, n_in - acc - offset + 1)
+    # range of outputs whose central stencil is inside the array.
+
+    weights = _transfer_weights(acc, 0, to_center)
+    if lo < hi:
+        dst[..., lo:hi] = weights[0] * src[..., lo + offset : hi + offset]
+        for j in range(1, acc):
+            dst[..., lo:hi] += weights[j] * src[..., lo + offset + j : hi + offset + j]
+        # apply the central weights to the interior using sliced views.
+
+    for k in list(range(0, min(lo, n_out))) + list(range(max(hi, lo), n_out)):
+        start = k + offset
+        if periodic:
+            index = np.arange(start, start + acc) % n_in
+            w = weights
+        else:
+            shift = min(max(start, 0), n_in - acc) - start
+            index = np.arange(start + shift, start + shift + acc)
+            w = _transfer_weights(acc, shift, to_center)
+            # the stencil is shifted into the array.
+        dst[..., k] = src[..., index] @ w
+
+    return out
+
+
+@lru_cache(maxsize=None)
+def _transfer_weights(acc: int, shift: int, to_center: bool):
+    """
+    calculate float weights to interpolate to the position +1/2 or -1/2
+    from the central stencil shifted by `shift` points.
+
+    Args:
+        acc (int): number of points of the stencil.
+        shift (int): number of points the stencil is shifted.
+        to_center (bool): True for the position +1/2, False for -1/2.
+
+    Returns:
+        ndarray: weights.
+    """
+    half_width = acc // 2
+    start = (1 if to_center else 0) - half_width + shift
+    target = Fraction(1, 2) if to_center else Fraction(-1, 2)
+    stencil = tuple(Fraction(s) - target for s in range(start, start + acc))
+    coef = lagrange_weights(stencil, Fraction(0))
+    weights = np.array([float(c) for c in coef])
+    weights.flags.writeable = False
+
+    return weights
+
+
+@lru_cache(maxsize=None)
+def _extrapolation_weights(distance: int, order: int):
+    """
+    calculate float extrapolation weights from interior points
+    0, 1, ..., order-1 to the ghost cell at -distance.
+
+    Args:
+        distance (int): distance between the ghost cell and
+            the first interior point.
+        order (int): number of interior points.
+
+    Returns:
+        ndarray: weights.
+    """
+    stencil = tuple(Fraction(s) for s in range(order))
+    coef = lagrange_weights(stencil, Fraction(-distance))
+    weights = np.array([float(c) for c in coef])
+    weights.flags.writeable = False
+
+    return weights
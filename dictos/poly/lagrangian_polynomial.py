@@ -1,5 +1,8 @@
 import sympy as sp
+from fractions import Fraction
+from functools import lru_cache
 
+from dictos.utilities.profiling import profiled
 from dictos.poly.exceptions import (
     DegreeOfPolynomialIsNotNaturalNumberError,
     InconsistentDataSetAndDegreeOfPolynomialError,
@@ -13,6 +16,7 @@ from dictos.utilities.spec import (
     are_different_length,
     narrower_than_minimum_width,
 )
+from dictos.series.power_series import to_fraction, to_rational
 
 
 def lagrangian_basis(x, degree: int, point_at: int, x_set: list = None):
@@ -67,8 +71,48 @@ def lagrangian_basis(x, degree: int, point_at: int, x_set: list = None):
         raise ValueError(f"point_at must be between 0 and {num_set-1}")
 
     if x_set is None:
-        x_set = sp.symbols(f"x0:{num_set}")
-        # create set of coordinate values like `(x0, x1, x2, ...)`
+        return _generic_basis(x, degree, point_at)
+        # the basis defined on generic coordinate symbols `(x0, x1, x2, ...)`
+        # depends only on x, degree, and point_at, so it is cached.
+
+    return _basis(x, x_set, point_at)
+
+
+@lru_cache(maxsize=None)
+def _generic_basis(x, degree: int, point_at: int):
+    """
+    create Lagrangian basis on generic coordinate symbols `(x0, x1, x2, ...)`.
+    Results are cached since the basis is identical for the same arguments.
+
+    Args:
+        x (sympy symbol): symbol representing independent variable.
+        degree (int): degree of polynomial.
+        point_at (int): a index indicating the point
+            where Lagrangian basis polynomial is defined.
+
+    Returns:
+        sympy Expr: a Lagrange basis polynomial $l(x)|_{x_set[point_at]}$.
+    """
+    x_set = sp.symbols(f"x0:{degree + 1}")
+    # create set of coordinate values like `(x0, x1, x2, ...)`
+
+    return _basis(x, x_set, point_at)
+
+
+def _basis(x, x_set, point_at: int):
+    """
+    create Lagrangian basis from given coordinates without validation.
+
+    Args:
+        x (sympy symbol): symbol representing independent variable.
+        x_set (list or tuple of sympy symbols): set of coordinate values.
+        point_at (int): a index indicating the point
+            where Lagrangian basis polynomial is defined in x_set.
+
+    Returns:
+        sympy Expr: a Lagrange basis polynomial $l(x)|_{x_set[point_at]}$.
+    """
+    num_set = len(x_set)
 
     index = list(range(num_set))
     index.remove(point_at)
@@ -85,6 +129,7 @@ def lagrangian_basis(x, degree: int, point_at: int, x_set: list = None):
     # `i` is used as an index to indicate those points, so `j` is used here.
 
 
+@profiled("lagrangian_poly", "x_set")
 def lagrangian_poly(x, x_set, f_set):
     """calculate symbolically a lagrangian interpolation polynomial
     from ginve set of coordinates and functions.
@@ -100,6 +145,8 @@ def lagrangian_poly(x, x_set, f_set):
     Raises:
         InconsistentDataSetError: if x_set and f_set are inconsistent.
         TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
 
     Returns:
         sympy Expr: a Lagrangian polynomial.
@@ -124,17 +171,226 @@ def lagrangian_poly(x, x_set, f_set):
         # - stencil is too narrow
 
     num_set = len(x_set)
-    degree = num_set - 1
-    # define an degree of polynomial.
-    # (n-1)-th degree polynomial can be constrcuted using n points.
 
-    return sum(
-        [lagrangian_basis(x, degree, i, x_set) * f_set[i] for i in range(num_set)]
-    )
+    weights = barycentric_weights(x_set)
+    nodal = _nodal_products(x, x_set)
+    # l_i(x) = w_i * prod_{j != i} (x - x_j)
+    # the products excluding the i-th factor are built from
+    # the prefix and suffix products in O(n) multiplications,
+    # instead of expanding n products of n-1 fractions.
+
+    return sum([weights[i] * nodal[i] * f_set[i] for i in range(num_set)])
     # calculate the linear combination of set of functions
     # at coordinates and the Lagrangian basis polynomials.
 
 
+def barycentric_weights(x_set):
+    """
+    calculate barycentric weights w_i = 1/prod_{j != i}(x_i - x_j)
+    of the Lagrangian basis polynomials.
+
+    Args:
+        x_set (list or tuple of numbers or sympy symbols):
+            set of coordinate values.
+
+    Raises:
+        TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        list of sympy Expr: barycentric weights.
+
+    Examples:
+        >>> from dictos import lagrangian_polynomial as lp
+        >>> lp.barycentric_weights([-1, 0, 1])
+        [1/2, -1, 1/2]
+    """
+    if narrower_than_minimum_width(x_set):
+        raise TooNarrowError(x_set)
+        # raise error if
+        # - stencil is too narrow
+    if has_duplicated_points(x_set):
+        raise DuplicatedPointError(x_set)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+
+    return [
+        sp.Integer(1) / sp.prod([x_i - x_j for j, x_j in enumerate(x_set) if j != i])
+        for i, x_i in enumerate(x_set)
+    ]
+
+
+def basis_values(x_set, at):
+    """
+    evaluate all Lagrangian basis polynomials at a point
+    using the barycentric weights.
+
+    Args:
+        x_set (list or tuple of numbers or sympy symbols):
+            set of coordinate values.
+        at (number or sympy Expr): a point where basis polynomials are evaluated.
+
+    Raises:
+        TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        list of sympy Expr: values of basis polynomials $l_i(at)$.
+
+    Examples:
+        >>> from dictos import lagrangian_polynomial as lp
+        >>> lp.basis_values([-1.5, -0.5, 0.5, 1.5], 0)
+        [-1/16, 9/16, 9/16, -1/16]
+    """
+    x_set = tuple(sp.nsimplify(x_j) for x_j in x_set)
+    at = sp.nsimplify(at)
+    # convert floating-point numbers to rational numbers
+    # to evaluate the basis polynomials exactly.
+
+    weights = _barycentric_weights(x_set)
+    nodal = _nodal_products(at, x_set)
+    # the products are formed without division,
+    # so that `at` coinciding with a point is handled naturally.
+
+    return [sp.expand(w * l) for w, l in zip(weights, nodal)]
+
+
+@lru_cache(maxsize=None)
+def _barycentric_weights(x_set: tuple) -> tuple:
+    """
+    calculate barycentric weights.
+    Results are cached for each set of coordinates,
+    so that evaluating basis polynomials at many points
+    does not recompute the weights.
+
+    Args:
+        x_set (tuple of sympy Expr): set of coordinate values.
+
+    Returns:
+        tuple of sympy Expr: barycentric weights.
+    """
+    return tuple(barycentric_weights(x_set))
+
+
+@profiled("fornberg_weights", "x_set")
+def fornberg_weights(x_set, deriv: int = 0, at=0):
+    """
+    calculate weights of the derivative of the Lagrangian interpolant
+    at a point by Fornberg's recursion in exact rational arithmetic.
+    The weights are identical to the derivatives of the basis polynomials
+    $l_i^{(deriv)}(at)$, but no symbolic expression is constructed.
+
+    Args:
+        x_set (list or tuple of int, Fraction, or sympy Rational):
+            set of coordinate values.
+        deriv (int, optional): order of derivative. Defaults to 0.
+        at (int, Fraction, or sympy Rational, optional):
+            a point where the derivative is evaluated. Defaults to 0.
+
+    Raises:
+        TooNarrowError: if stencil is too narrow.
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+
+    Returns:
+        list of sympy Rational: weights.
+
+    Examples:
+        >>> from dictos import lagrangian_polynomial as lp
+        >>> lp.fornberg_weights([-1, 0, 1], deriv=2)
+        [1, -2, 1]
+        >>> lp.fornberg_weights([-1, 1], deriv=0)
+        [1/2, 1/2]
+    """
+    if narrower_than_minimum_width(x_set):
+        raise TooNarrowError(x_set)
+        # raise error if
+        # - stencil is too narrow
+    if has_duplicated_points(x_set):
+        raise DuplicatedPointError(x_set)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+
+    weights = _fornberg_weights(
+        tuple(to_fraction(x_j) for x_j in x_set), deriv, to_fraction(at)
+    )
+    return [to_rational(w) for w in weights]
+
+
+@lru_cache(maxsize=None)
+def _fornberg_weights(x_set: tuple, deriv: int, at: Fraction) -> tuple:
+    """
+    calculate weights by Fornberg's recursion.
+    Results are cached for each set of coordinates, order and point.
+
+    Args:
+        x_set (tuple of Fraction): set of coordinate values.
+        deriv (int): order of derivative.
+        at (Fraction): a point where the derivative is evaluated.
+
+    Returns:
+        tuple of Fraction: weights.
+    """
+    num_points = len(x_set)
+    c = [[Fraction(0)] * num_points for _ in range(deriv + 1)]
+    c[0][0] = Fraction(1)
+    # c[k][j] is the weight of the k-th derivative at the point j
+    # for the interpolant through the points 0, 1, ..., i.
+
+    c1 = Fraction(1)
+    c4 = x_set[0] - at
+    for i in range(1, num_points):
+        mn = min(i, deriv)
+        c2 = Fraction(1)
+        c5 = c4
+        c4 = x_set[i] - at
+        for j in range(i):
+            c3 = x_set[i] - x_set[j]
+            c2 *= c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    c[k][i] = c1 * (k * c[k - 1][i - 1] - c5 * c[k][i - 1]) / c2
+                c[0][i] = -c1 * c5 * c[0][i - 1] / c2
+                # weights of the newly added point.
+            for k in range(mn, 0, -1):
+                c[k][j] = (c4 * c[k][j] - k * c[k - 1][j]) / c3
+            c[0][j] = c4 * c[0][j] / c3
+            # update weights of the existing points.
+        c1 = c2
+
+    return tuple(c[deriv])
+
+
+def _nodal_products(x, x_set):
+    """
+    calculate products prod_{j != i}(x - x_j) for all i
+    using prefix and suffix products.
+
+    Args:
+        x (sympy symbol or number): independent variable.
+        x_set (list or tuple of sympy symbols): set of coordinate values.
+
+    Returns:
+        list of sympy Expr: products excluding the i-th factor.
+    """
+    num_set = len(x_set)
+
+    prefix = [sp.Integer(1)] * (num_set + 1)
+    for i in range(num_set):
+        prefix[i + 1] = prefix[i] * (x - x_set[i])
+    # prefix[i] = (x - x_0)*...*(x - x_{i-1})
+
+    suffix = [sp.Integer(1)] * (num_set + 1)
+    for i in reversed(range(num_set)):
+        suffix[i] = suffix[i + 1] * (x - x_set[i])
+    # suffix[i] = (x - x_i)*...*(x - x_{n-1})
+
+    return [prefix[i] * suffix[i + 1] for i in range(num_set)]
+
+
+@profiled("derivative")
 def derivative(expr, x, deriv: int = 1):
     """calculate symbolically a derivative at x=0.
 
@@ -0,0 +1,288 @@
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
+
+from dictos.utilities.spec import is_valid_accuracy_order_for_generating_central_form
+from dictos.utilities.array import normalize_axes
+from dictos.poly.interpolation import to_cell_centers
+from dictos.poly.weights import lagrange_weights
+from dictos.calculus.exceptions import InvalidOrderOfAccuracyForCentralFormError
+
+# midpoint weights are derived in exact rational arithmetic
+# using Fraction, so that `prolong` and `restrict` run without importing sympy.
+
+
+def prolongation_weights(acc: int, as_numer_denom: bool = False):
+    """
+    derive weights to interpolate a fine-grid value
+    at the midpoint of two coarse-grid points.
+    Fine-grid values at coarse-grid points are injected.
+
+    Args:
+        acc (int): order of accuracy. It must be a positive even number.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not positive and even.
+
+    Returns:
+        list of sympy Rational: weights for coarse-grid points
+            at -acc/2+1/2, ..., acc/2-1/2 in units of the coarse-grid interval.
+            or
+        list of sympy numbers, int:
+            numerator and denominator of weights.
+
+    Examples:
+        >>> from dictos.poly import multigrid as mg
+        >>> mg.prolongation_weights(2)
+        [1/2, 1/2]
+        >>> mg.prolongation_weights(4, as_numer_denom=True)
+        ([-1, 9, 9, -1], 16)
+    """
+    from dictos.poly.interpolation import coefficients
+
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    return coefficients(_midpoint_stencil(acc), as_numer_denom)
+
+
+def restriction_weights(acc: int, as_numer_denom: bool = False):
+    """
+    derive full-weighting restriction weights,
+    which are the transpose of the prolongation scaled by 1/2.
+
+    Args:
+        acc (int): order of accuracy. It must be a positive even number.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not positive and even.
+
+    Returns:
+        list of sympy Rational: weights for fine-grid points
+            at -(acc-1), ..., acc-1 in units of the fine-grid interval.
+            or
+        list of sympy numbers, int:
+            numerator and denominator of weights.
+
+    Examples:
+        >>> from dictos.poly import multigrid as mg
+        >>> mg.restriction_weights(2)
+        [1/4, 1/2, 1/4]
+        >>> mg.restriction_weights(4, as_numer_denom=True)
+        ([-1, 0, 9, 16, 9, 0, -1], 32)
+    """
+    import sympy as sp
+    from dictos.utilities.utils import simplify_coefficients
+
+    weights = [w / 2 for w in prolongation_weights(acc)]
+    # the midpoint weights are placed at odd fine-grid points.
+
+    restriction = [sp.Integer(0)] * (2 * acc - 1)
+    restriction[0::2] = weights
+    restriction[acc - 1] = sp.Rational(1, 2)
+    # the center point has the weight 1/2, and
+    # the other even fine-grid points have the weight 0.
+
+    return simplify_coefficients(restriction, as_numer_denom)
+
+
+def prolong(array, acc: int, axis=None, periodic: bool = False):
+    """
+    interpolate values on a coarse grid to a fine grid
+    having twice the resolution.
+    The operator is applied separably along each axis.
+
+    Args:
+        array (ndarray): values on a coarse grid.
+        acc (int): order of accuracy. It must be a positive even number.
+        axis (int or tuple of int, optional): axes along which
+            the grid is refined. Defaults to None, which refines all axes.
+        periodic (bool, optional): flag to treat axes as periodic.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not positive and even.
+        ValueError: if `axis` is out of range,
+            or if the number of coarse-grid points is less than `acc`.
+
+    Returns:
+        ndarray: values on a fine grid.
+            n coarse-grid points are refined to 2n-1 points, or 2n if periodic.
+
+    Examples:
+        >>> from dictos.poly import multigrid as mg
+        >>> import numpy as np
+        >>> mg.prolong(np.array([0.0, 1.0, 4.0, 9.0]), acc=4)
+        array([0.  , 0.25, 1.  , 2.25, 4.  , 6.25, 9.  ])
+    """
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    array = np.asarray(array)
+    for ax in normalize_axes(axis, array.ndim):
+        coarse = np.moveaxis(array, ax, -1)
+        n = coarse.shape[-1]
+
+        fine = np.empty(
+            coarse.shape[:-1] + (2 * n if periodic else 2 * n - 1,),
+            dtype=np.result_type(array.dtype, np.float64),
+        )
+        fine[..., 0::2] = coarse
+        to_cell_centers(coarse, acc, out=fine[..., 1::2], periodic=periodic)
+        # inject values at coarse-grid points and
+        # interpolate values at midpoints.
+
+        array = np.moveaxis(fine, -1, ax)
+
+    return array
+
+
+def restrict(array, acc: int, axis=None, periodic: bool = False):
+    """
+    restrict values on a fine grid to a coarse grid
+    having half the resolution by full weighting.
+    The operator is applied separably along each axis.
+    Near non-periodic ends, the order of accuracy is reduced
+    so that the weights fit in the grid, and end points are injected.
+
+    Args:
+        array (ndarray): values on a fine grid.
+        acc (int): order of accuracy. It must be a positive even number.
+        axis (int or tuple of int, optional): axes along which
+            the grid is coarsened. Defaults to None, which coarsens all axes.
+        periodic (bool, optional): flag to treat axes as periodic.
+            Defaults to False.
+
+    Raises:
+        InvalidOrderOfAccuracyForCentralFormError: if acc is not positive and even.
+        ValueError: if `axis` is out of range,
+            if the number of fine-grid points is not odd (even if periodic),
+            or if the number of points is less than 3.
+
+    Returns:
+        ndarray: values on a coarse grid.
+            2n-1 fine-grid points are coarsened to n points,
+            or 2n to n if periodic.
+
+    Examples:
+        >>> from dictos.poly import multigrid as mg
+        >>> import numpy as np
+        >>> mg.restrict(np.array([0.0, 1.0, 2.0, 3.0, 4.0]), acc=2)
+        array([0., 2., 4.])
+    """
+    if not is_valid_accuracy_order_for_generating_central_form(acc):
+        raise InvalidOrderOfAccuracyForCentralFormError(acc)
+        # raise error
+        # - if acc is not positive and even
+
+    array = np.asarray(array)
+    for ax in normalize_axes(axis, array.ndim):
+        fine = np.moveaxis(array, ax, -1)
+        n = fine.shape[-1]
+        if n < 3 or (n % 2 == 1) == periodic:
+            raise ValueError(
+                f"{'periodic' if periodic else 'non-periodic'} restriction requires "
+                + f"{'an even' if periodic else 'an odd'} number (>= 3) of points "
+                + f"along axis {ax}, got {n}."
+            )
+
+        even = fine[..., 0::2]
+        odd = fine[..., 1::2]
+        coarse = 0.5 * even + 0.5 * _odd_to_even(odd, acc, even.shape[-1], periodic)
+        # the center has the weight 1/2 and
+        # the odd points have the midpoint weights scaled by 1/2.
+
+        if not periodic:
+            coarse[..., 0] = even[..., 0]
+            coarse[..., -1] = even[..., -1]
+            # inject values at end points.
+
+        array = np.moveaxis(coarse, -1, ax)
+
+    return array
+
+
+def _odd_to_even(odd, acc: int, n_coarse: int, periodic: bool):
+    """
+    interpolate values at odd fine-grid points to even fine-grid points
+    by the midpoint weights, reducing the order of accuracy near the ends.
+
+    Args:
+        odd (ndarray): values at odd fine-grid points along the last axis.
+        acc (int): order of accuracy.
+        n_coarse (int): number of coarse-grid points.
+        periodic (bool): flag to treat the last axis as periodic.
+
+    Returns:
+        ndarray: interpolated values at even fine-grid points.
+            Values at non-periodic end points are undefined.
+    """
+    half_width = acc // 2
+    mid = np.zeros(odd.shape[:-1] + (n_coarse,), dtype=np.float64)
+
+    if periodic:
+        weights = _midpoint_weights(acc)
+        for j, w in enumerate(weights):
+            mid += w * np.roll(odd, half_width - j, axis=-1)
+        # the point i is placed between the odd points i-1 and i.
+        return mid
+
+    lo, hi = half_width, n_coarse - half_width
+    if lo < hi:
+        weights = _midpoint_weights(acc)
+        for j, w in enumerate(weights):
+            mid[..., lo:hi] += w * odd[..., j : j + hi - lo]
+        # apply the weights to points having enough neighbors.
+
+    for i in list(range(1, min(lo, n_coarse - 1))) + list(
+        range(max(hi, lo), n_coarse - 1)
+    ):
+        h = min(i, n_coarse - 1 - i, half_width)
+        mid[..., i] = odd[..., i - h : i + h] @ _midpoint_weights(2 * h)
+        # reduce the order of accuracy near the ends.
+
+    return mid
+
+
+@lru_cache(maxsize=None)
+def _midpoint_weights(acc: int):
+    """
+    calculate float midpoint weights of the order of accuracy acc.
+
+    Args:
+        acc (int): order of accuracy.
+
+    Returns:
+        ndarray: weights.
+    """
+    half_width = acc // 2
+    stencil = tuple(Fraction(2 * s + 1, 2) for s in range(-half_width, half_width))
+    weights = np.array([float(w) for w in lagrange_weights(stencil, Fraction(0))])
+    # Lagrangian basis polynomials on the midpoint stencil evaluated at 0.
+    weights.flags.writeable = False
+
+    return weights
+
+
+def _midpoint_stencil(acc: int) -> list:
+    """
+    create a stencil [-acc/2+1/2, ..., acc/2-1/2] for the midpoint interpolation.
+
+    Args:
+        acc (int): order of accuracy.
+
+    Returns:
+        list of float: stencil.
+    """
+    half_width = acc // 2
+    return [s + 0.5 for s in range(-half_width, half_width)]
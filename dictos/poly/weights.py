@@ -0,0 +1,41 @@
+"""
+Provide exact weights of Lagrangian interpolation in rational arithmetic.
+These helpers use Fraction only,
+so that numeric paths of interpolation and multigrid run without importing sympy.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def lagrange_weights(stencil: tuple, target: Fraction) -> tuple:
+    """
+    calculate exact weights l_i(target) of the Lagrangian interpolant
+    through the stencil, i.e. the Lagrangian basis polynomials
+    evaluated at the target.
+    The target can be outside the stencil, e.g. a ghost cell.
+    Results are cached for each pair of stencil and target.
+
+    Args:
+        stencil (tuple of Fraction): distinct relative point numbers.
+        target (Fraction): relative position where the value is estimated.
+
+    Returns:
+        tuple of Fraction: weights in the order of the stencil.
+
+    Examples:
+        >>> from fractions import Fraction
+        >>> from dictos.poly.weights import lagrange_weights
+        >>> lagrange_weights((Fraction(-1, 2), Fraction(1, 2)), Fraction(0))
+        (Fraction(1, 2), Fraction(1, 2))
+    """
+    weights = []
+    for i, s_i in enumerate(stencil):
+        w = Fraction(1)
+        for j, s_j in enumerate(stencil):
+            if j != i:
+                w *= (target - s_j) / (s_i - s_j)
+        weights.append(w)
+
+    return tuple(weights)
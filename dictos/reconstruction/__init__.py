@@ -0,0 +1 @@
+from dictos.reconstruction.reconstruction import coefficients, table
@@ -0,0 +1,94 @@
+"""
+Custom exceptions for errors related to Reconstruction.
+"""
+
+
+class ReconstructionError(Exception):
+    """
+    Base class for error related to Reconstruction.
+    """
+
+    pass
+
+
+class OrderOfReconstructionIsNotNaturalNumberError(ReconstructionError):
+    """
+    Exception raised for errors
+    that the order of reconstruction is not the natural number.
+
+    Attributes:
+        order (int): order of reconstruction which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, order) -> None:
+        self.order = order
+        self.message = (
+            f"The order of reconstruction ({order}) is not the natural number. "
+            + "Specify the order of reconstruction greater than 0."
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class UnsupportedOrderOfDerivativeError(ReconstructionError):
+    """
+    Exception raised for errors
+    that the order of derivative is not a non-negative integer.
+
+    Attributes:
+        deriv (int): order of derivative which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, deriv) -> None:
+        self.deriv = deriv
+        self.message = (
+            f"The order of derivative ({deriv}) is not supported. "
+            + "Specify a non-negative integer, 0 for the point value."
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class UnsupportedOrderOfWENOError(ReconstructionError):
+    """
+    Exception raised for errors
+    that the order of WENO reconstruction is not supported.
+
+    Attributes:
+        order (int): order of WENO reconstruction which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, order) -> None:
+        self.order = order
+        self.message = (
+            f"WENO reconstruction of order {order} is not supported. "
+            + "Specify one of 3, 5, 7, 9, and 11."
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class UnsupportedWENOVariantError(ReconstructionError):
+    """
+    Exception raised for errors
+    that the variant of WENO reconstruction is not supported.
+
+    Attributes:
+        variant (str): variant which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, variant) -> None:
+        self.variant = variant
+        self.message = (
+            f'WENO variant "{variant}" is not supported. ' + 'Specify "js" or "z".'
+        )
+
+    def __str__(self) -> str:
+        return self.message
@@ -0,0 +1,198 @@
+from fractions import Fraction
+from functools import lru_cache
+from math import perm
+
+from dictos.utilities.spec import (
+    has_duplicated_points,
+    is_natural_number,
+    is_positive_integer,
+)
+from dictos.linalg.linalg import solve_fraction
+from dictos.discrete.exceptions import DuplicatedPointError
+from dictos.reconstruction.exceptions import (
+    OrderOfReconstructionIsNotNaturalNumberError,
+    UnsupportedOrderOfDerivativeError,
+)
+
+# reconstruction coefficients are derived in exact rational arithmetic
+# using Fraction, so that importing `dictos.reconstruction` does not import sympy.
+# sympy is imported by the functions returning sympy objects.
+
+
+def coefficients(
+    cell_stencil: list, at_face=0.5, deriv: int = 0, as_numer_denom: bool = False
+):
+    """
+    derive reconstruction coefficients that map cell averages
+    to a point value or a derivative at a face.
+    The cell j covers [(j-1/2)*h, (j+1/2)*h],
+    and the coefficients c_j approximate
+    h**deriv * f^(deriv)(at_face*h) = sum c_j fbar_j,
+    where fbar_j is the average of f over the cell j.
+
+    Args:
+        cell_stencil (list of int): relative cell numbers
+            used for reconstruction.
+        at_face (int, float, or sympy Rational, optional):
+            relative position where the value is reconstructed.
+            Defaults to 0.5, the right face of the cell 0.
+        deriv (int, optional): order of derivative.
+            Defaults to 0, i.e. the point value.
+        as_numer_denom (bool, optional): flag to return the numerator
+            and denominator separately.
+            Defaults to False.
+
+    Raises:
+        DuplicatedPointError: if at least a number in the stencil
+            appears more than once.
+        UnsupportedOrderOfDerivativeError: if deriv is not a non-negative integer.
+
+    Returns:
+        list of sympy Rational: simplified coefficients.
+            or
+        list of sympy numbers, int:
+            numerator and denominator of coefficients.
+            coefficients are commutative
+            with the least common multiple of the denominator.
+            Coefficients are arranged in the order of the sorted stencil.
+
+    Examples:
+        >>> from dictos import reconstruction as rc
+        >>> rc.coefficients([-1, 0, 1], 0.5)
+        [-1/6, 5/6, 1/3]
+        >>> rc.coefficients([-2, -1, 0], 0.5, as_numer_denom=True)
+        ([2, -7, 11], 6)
+        >>> rc.coefficients([0, 1], 0.5, deriv=1)
+        [-1, 1]
+    """
+    import sympy as sp
+    from dictos.utilities.utils import simplify_coefficients
+    from dictos.series.power_series import to_fraction, to_rational
+
+    if has_duplicated_points(cell_stencil):
+        raise DuplicatedPointError(cell_stencil)
+        # raise error if
+        # - at least a number in the stencil appears more than once.
+    if not is_positive_integer(deriv, include_zero=True):
+        raise UnsupportedOrderOfDerivativeError(deriv)
+        # raise error if
+        # - deriv is negative or not an integer.
+
+    coef = _reconstruction_coefficients(
+        tuple(
+            sorted(to_fraction(sp.nsimplify(j, rational=True)) for j in cell_stencil)
+        ),
+        to_fraction(sp.nsimplify(at_face, rational=True)),
+        deriv,
+    )
+
+    return simplify_coefficients([to_rational(c) for c in coef], as_numer_denom)
+
+
+def table(order: int, at_face=0.5, deriv: int = 0):
+    """
+    derive reconstruction coefficients for all candidate stencils
+    of `order` cells containing the cell 0.
+    The k-th candidate stencil is [k-order+1, ..., k] for k = 0, 1, ..., order-1,
+    i.e. candidates are arranged from the leftmost to the rightmost.
+
+    Args:
+        order (int): number of cells in a candidate stencil,
+            i.e. order of accuracy of reconstruction.
+        at_face (int, float, or sympy Rational, optional):
+            relative position where the value is reconstructed.
+            Defaults to 0.5, the right face of the cell 0.
+        deriv (int, optional): order of derivative.
+            Defaults to 0, i.e. the point value.
+
+    Raises:
+        OrderOfReconstructionIsNotNaturalNumberError:
+            if order is not the natural number.
+        UnsupportedOrderOfDerivativeError: if deriv is not a non-negative integer.
+
+    Returns:
+        list of list of sympy Rational: coefficients for each candidate stencil.
+
+    Examples:
+        >>> from dictos import reconstruction as rc
+        >>> rc.table(2)
+        [[-1/2, 3/2], [1/2, 1/2]]
+        >>> rc.table(3, at_face=-0.5)
+        [[-1/6, 5/6, 1/3], [1/3, 5/6, -1/6], [11/6, -7/6, 1/3]]
+    """
+    import sympy as sp
+    from dictos.series.power_series import to_fraction, to_rational
+
+    if not is_natural_number(order):
+        raise OrderOfReconstructionIsNotNaturalNumberError(order)
+        # raise error if
+        # - order is not the natural number.
+    if not is_positive_integer(deriv, include_zero=True):
+        raise UnsupportedOrderOfDerivativeError(deriv)
+        # raise error if
+        # - deriv is negative or not an integer.
+
+    return [
+        [to_rational(c) for c in coef]
+        for coef in _table(
+            order, to_fraction(sp.nsimplify(at_face, rational=True)), deriv
+        )
+    ]
+
+
+@lru_cache(maxsize=None)
+def _table(order: int, at_face, deriv: int) -> tuple:
+    """
+    derive reconstruction coefficients for all candidate stencils.
+    Results are cached for each set of arguments.
+
+    Args:
+        order (int): number of cells in a candidate stencil.
+        at_face (Fraction): relative position.
+        deriv (int): order of derivative.
+
+    Returns:
+        tuple of tuple of Fraction: coefficients for each candidate stencil.
+    """
+    return tuple(
+        _reconstruction_coefficients(
+            tuple(Fraction(j) for j in range(k - order + 1, k + 1)),
+            at_face,
+            deriv,
+        )
+        for k in range(order)
+    )
+
+
+@lru_cache(maxsize=None)
+def _reconstruction_coefficients(cell_stencil: tuple, at_face, deriv: int) -> tuple:
+    """
+    solve the moment system for reconstruction coefficients.
+    Results are cached for each set of arguments.
+
+    Args:
+        cell_stencil (tuple of Fraction): sorted relative cell numbers.
+        at_face (Fraction): relative position.
+        deriv (int): order of derivative.
+
+    Returns:
+        tuple of Fraction: coefficients.
+    """
+    num_coef = len(cell_stencil)
+    half = Fraction(1, 2)
+
+    matrix = [
+        [
+            ((j + half) ** (m + 1) - (j - half) ** (m + 1)) / (m + 1)
+            for j in cell_stencil
+        ]
+        for m in range(num_coef)
+    ]
+    rhs = [
+        perm(m, deriv) * at_face ** (m - deriv) if m >= deriv else 0
+        for m in range(num_coef)
+    ]
+    # the reconstruction is exact for monomials x**m, m = 0, 1, ..., num_coef-1:
+    # sum c_j (average of x**m over the cell j) = d^deriv/dx^deriv x**m at at_face
+
+    return tuple(solve_fraction(matrix, rhs))
@@ -0,0 +1,446 @@
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
+from math import factorial
+
+from dictos.defaults import DEFAULT_INTERVAL, DEFAULT_DIFFERENTIAND
+from dictos.utilities.array import normalize_axes
+from dictos.reconstruction.reconstruction import _table, _reconstruction_coefficients
+from dictos.reconstruction.exceptions import (
+    UnsupportedOrderOfWENOError,
+    UnsupportedWENOVariantError,
+)
+
+SUPPORTED_ORDERS = (3, 5, 7, 9, 11)
+# orders of WENO reconstruction 2r-1 with r = 2, 3, ..., 6.
+
+_TAU_COEFFICIENTS = {
+    3: (1, -1),
+    5: (1, 0, -1),
+    7: (1, 3, -3, -1),
+    9: (1, 2, -6, 2, 1),
+    11: (1, 36, 135, -135, -36, -1),
+}
+# global smoothness indicator of WENO-Z, tau = |sum a_k beta_k|.
+
+# tables of WENO reconstruction are built on the reconstruction coefficients
+# of the candidate and whole stencils, which are derived in exact rational arithmetic
+# using Fraction, so that `reconstruct` runs without importing sympy.
+
+
+def linear_weights(order: int):
+    """
+    derive linear (optimal) weights of WENO reconstruction
+    at the right face of the cell 0.
+    The weighted sum of candidate reconstructions with the linear weights
+    equals the reconstruction of the order on the whole stencil.
+
+    Args:
+        order (int): order of WENO reconstruction, one of 3, 5, 7, 9, and 11.
+
+    Raises:
+        UnsupportedOrderOfWENOError: if order is not supported.
+
+    Returns:
+        list of sympy Rational: linear weights for candidate stencils
+            arranged from the leftmost to the rightmost.
+
+    Examples:
+        >>> from dictos.reconstruction import weno
+        >>> weno.linear_weights(3)
+        [1/3, 2/3]
+        >>> weno.linear_weights(5)
+        [1/10, 3/5, 3/10]
+    """
+    import sympy as sp
+
+    _validate_order(order)
+
+    return [sp.Rational(w.numerator, w.denominator) for w in _linear_weights(order)]
+
+
+def smoothness_indicators(order: int, differentiand: str = DEFAULT_DIFFERENTIAND):
+    """
+    derive smoothness indicators of candidate stencils
+    as quadratic forms of cell averages.
+    The indicator of a candidate is
+    sum_{l=1}^{r-1} int_{-1/2}^{1/2} (d^l p/dx^l)**2 dx
+    in units of the cell width, where p is the reconstruction polynomial
+    of degree r-1 on the candidate stencil.
+
+    Args:
+        order (int): order of WENO reconstruction, one of 3, 5, 7, 9, and 11.
+        differentiand (str, optional): symbol of cell averages.
+            Defaults to DEFAULT_DIFFERENTIAND.
+
+    Raises:
+        UnsupportedOrderOfWENOError: if order is not supported.
+
+    Returns:
+        list of sympy Expr: smoothness indicators for candidate stencils
+            arranged from the leftmost to the rightmost.
+
+    Examples:
+        >>> from dictos.reconstruction import weno
+        >>> weno.smoothness_indicators(3)
+        [(f_{-1} - f_{0})**2, (f_{0} - f_{1})**2]
+    """
+    import sympy as sp
+    from dictos.discrete.stencil import (
+        create_coordinate_symbols,
+        create_differentiand_symbols,
+    )
+
+    _validate_order(order)
+
+    r = (order + 1) // 2
+    f_set = create_differentiand_symbols(
+        create_coordinate_symbols(list(range(1 - r, r)), DEFAULT_INTERVAL),
+        differentiand,
+    )
+    # cell averages on the whole stencil [-(r-1), ..., r-1].
+
+    return [
+        sp.factor(sp.expand((sp.Matrix(f_set).T * sp.Matrix(q) * sp.Matrix(f_set))[0]))
+        for q in _smoothness_quadratic_forms(order)
+    ]
+
+
+def reconstruct(
+    array,
+    order: int = 5,
+    axis: int = -1,
+    variant: str = "js",
+    face: str = "right",
+    eps: float = 1e-6,
+    p: int = 2,
+    backend: str = "numpy",
+):
+    """
+    reconstruct values at faces from cell averages by WENO.
+    Every cell having r-1 neighbors on both sides is reconstructed,
+    where r = (order+1)/2, so the length along `axis` decreases by 2(r-1).
+
+    Args:
+        array (ndarray): cell averages.
+        order (int, optional): order of WENO reconstruction,
+            one of 3, 5, 7, 9, and 11. Defaults to 5.
+        axis (int, optional): axis along which values are reconstructed.
+            Defaults to -1.
+        variant (str, optional): "js" for WENO-JS (Jiang and Shu),
+            "z" for WENO-Z (Borges et al.). Defaults to "js".
+        face (str, optional): "right" to reconstruct at the right face
+            of each cell, or "left" to reconstruct at the left face.
+            Defaults to "right".
+        eps (float, optional): small number to avoid division by zero.
+            Defaults to 1e-6.
+        p (int, optional): power parameter of nonlinear weights.
+            Defaults to 2.
+        backend (str, optional): "numpy" for vectorized NumPy evaluation,
+            or "numba" for a compiled loop which requires numba.
+            Defaults to "numpy".
+
+    Raises:
+        UnsupportedOrderOfWENOError: if order is not supported.
+        UnsupportedWENOVariantError: if variant is not supported.
+        ValueError: if `face` or `backend` is invalid,
+            if `axis` is out of range,
+            or if the length of `array` along `axis` is less than `order`.
+        ImportError: if backend is "numba" and numba is not installed.
+
+    Returns:
+        ndarray: reconstructed values at faces.
+
+    Examples:
+        >>> from dictos.reconstruction import weno
+        >>> import numpy as np
+        >>> a = np.array([1.0, 1.0, 1.0, 0.0, 0.0, 0.0])
+        >>> np.round(weno.reconstruct(a, order=3), 6) + 0.0
+        array([1., 1., 0., 0.])
+    """
+    _validate_order(order)
+    if variant not in ("js", "z"):
+        raise UnsupportedWENOVariantError(variant)
+    if face not in ("right", "left"):
+        raise ValueError(f'`face` must be "right" or "left", got "{face}".')
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f'`backend` must be "numpy" or "numba", got "{backend}".')
+
+    array = np.asarray(array, dtype=np.float64)
+    (axis,) = normalize_axes(axis, array.ndim)
+
+    values = np.moveaxis(array, axis, -1)
+    if values.shape[-1] < order:
+        raise ValueError(
+            f"WENO reconstruction of order {order} requires {order} or more cells "
+            + f"along axis {axis}, got {values.shape[-1]}."
+        )
+
+    if face == "left":
+        values = values[..., ::-1]
+        # the left face is the mirror image of the right face.
+
+    if backend == "numpy":
+        result = _reconstruct_numpy(values, order, variant == "z", eps, p)
+    else:
+        result = _reconstruct_numba(values, order, variant == "z", eps, p)
+
+    if face == "left":
+        result = result[..., ::-1]
+
+    return np.moveaxis(result, -1, axis)
+
+
+def _reconstruct_numpy(values, order: int, z: bool, eps: float, p: int):
+    """
+    evaluate WENO reconstruction with vectorized NumPy operations.
+
+    Args:
+        values (ndarray): cell averages along the last axis.
+        order (int): order of WENO reconstruction.
+        z (bool): True for WENO-Z, False for WENO-JS.
+        eps (float): small number to avoid division by zero.
+        p (int): power parameter of nonlinear weights.
+
+    Returns:
+        ndarray: reconstructed values at right faces.
+    """
+    candidates, quadratic_forms, weights, tau = _float_tables(order)
+
+    window = np.lib.stride_tricks.sliding_window_view(values, order, axis=-1)
+    # cell averages on the whole stencil of each cell, without copying.
+
+    q = window @ candidates.T
+    # candidate reconstructions of shape (..., m, r).
+    beta = np.einsum("...i,kij,...j->...k", window, quadratic_forms, window)
+    # smoothness indicators of shape (..., m, r).
+
+    if z:
+        t = np.abs(beta @ tau)[..., np.newaxis]
+        alpha = weights * (1 + (t / (beta + eps)) ** p)
+    else:
+        alpha = weights / (beta + eps) ** p
+
+    return (alpha * q).sum(axis=-1) / alpha.sum(axis=-1)
+
+
+def _reconstruct_numba(values, order: int, z: bool, eps: float, p: int):
+    """
+    evaluate WENO reconstruction with a compiled loop over cells.
+
+    Args:
+        values (ndarray): cell averages along the last axis.
+        order (int): order of WENO reconstruction.
+        z (bool): True for WENO-Z, False for WENO-JS.
+        eps (float): small number to avoid division by zero.
+        p (int): power parameter of nonlinear weights.
+
+    Raises:
+        ImportError: if numba is not installed.
+
+    Returns:
+        ndarray: reconstructed values at right faces.
+    """
+    kernel = _numba_kernel()
+    candidates, quadratic_forms, weights, tau = _float_tables(order)
+
+    lines = np.ascontiguousarray(values.reshape(-1, values.shape[-1]))
+    result = kernel(lines, candidates, quadratic_forms, weights, tau, z, eps, p)
+
+    return result.reshape(values.shape[:-1] + (result.shape[-1],))
+
+
+@lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    compile the loop kernel of WENO reconstruction by numba.
+
+    Raises:
+        ImportError: if numba is not installed.
+
+    Returns:
+        function: compiled kernel.
+    """
+    try:
+        import numba
+    except ImportError as e:
+        raise ImportError(
+            'backend="numba" requires numba. Install it by `pip install numba`.'
+        ) from e
+
+    @numba.njit
+    def kernel(lines, candidates, quadratic_forms, weights, tau, z, eps, p):
+        num_line, n = lines.shape
+        r, order = candidates.shape
+        m = n - order + 1
+        result = np.empty((num_line, m))
+        q = np.empty(r)
+        beta = np.empty(r)
+        for line in range(num_line):
+            for i in range(m):
+                v = lines[line, i : i + order]
+                t = 0.0
+                for k in range(r):
+                    q[k] = 0.0
+                    beta[k] = 0.0
+                    for a in range(order):
+                        q[k] += candidates[k, a] * v[a]
+                        for b in range(order):
+                            beta[k] += quadratic_forms[k, a, b] * v[a] * v[b]
+                    t += tau[k] * beta[k]
+                t = abs(t)
+                numer = 0.0
+                denom = 0.0
+                for k in range(r):
+                    if z:
+                        alpha = weights[k] * (1.0 + (t / (beta[k] + eps)) ** p)
+                    else:
+                        alpha = weights[k] / (beta[k] + eps) ** p
+                    numer += alpha * q[k]
+                    denom += alpha
+                result[line, i] = numer / denom
+        return result
+
+    return kernel
+
+
+@lru_cache(maxsize=None)
+def _float_tables(order: int):
+    """
+    convert exact tables of WENO reconstruction to float arrays.
+    Candidate coefficients and quadratic forms are embedded
+    in the whole stencil of `order` cells.
+
+    Args:
+        order (int): order of WENO reconstruction.
+
+    Returns:
+        tuple of ndarray: candidate coefficients (r, order),
+            quadratic forms of smoothness indicators (r, order, order),
+            linear weights (r,), and coefficients of tau (r,).
+    """
+    r = (order + 1) // 2
+
+    candidates = np.zeros((r, order))
+    for k, coef in enumerate(_table(r, Fraction(1, 2), 0)):
+        candidates[k, k : k + r] = [float(c) for c in coef]
+
+    quadratic_forms = np.array(_smoothness_quadratic_forms(order), dtype=np.float64)
+    weights = np.array([float(d) for d in _linear_weights(order)])
+    tau = np.array(_TAU_COEFFICIENTS[order], dtype=np.float64)
+
+    for a in (candidates, quadratic_forms, weights, tau):
+        a.flags.writeable = False
+
+    return candidates, quadratic_forms, weights, tau
+
+
+@lru_cache(maxsize=None)
+def _linear_weights(order: int) -> tuple:
+    """
+    solve linear weights of WENO reconstruction.
+
+    Args:
+        order (int): order of WENO reconstruction.
+
+    Returns:
+        tuple of Fraction: linear weights.
+    """
+    r = (order + 1) // 2
+    half = Fraction(1, 2)
+    candidates = _table(r, half, 0)
+    whole = _reconstruction_coefficients(
+        tuple(Fraction(j) for j in range(1 - r, r)), half, 0
+    )
+    # reconstruction on the whole stencil [-(r-1), ..., r-1].
+
+    weights = []
+    for i in range(r):
+        weights.append(
+            (whole[i] - sum(candidates[k][i - k] * weights[k] for k in range(i)))
+            / candidates[i][0]
+        )
+    # the k-th candidate covers cells k, ..., k+r-1 of the whole stencil,
+    # so the first r cells give a lower triangular system
+    # solved by forward substitution.
+
+    return tuple(weights)
+
+
+@lru_cache(maxsize=None)
+def _smoothness_quadratic_forms(order: int) -> tuple:
+    """
+    derive matrices Q_k of smoothness indicators beta_k = f^T Q_k f,
+    where f is the cell averages on the whole stencil.
+
+    Args:
+        order (int): order of WENO reconstruction.
+
+    Returns:
+        tuple of tuple of tuple of Fraction:
+            symmetric matrices of shape (order, order).
+    """
+    r = (order + 1) // 2
+
+    forms = []
+    for k in range(r):
+        cells = tuple(Fraction(j) for j in range(k - r + 1, k + 1))
+        derivatives = [
+            _reconstruction_coefficients(cells, Fraction(0), m) for m in range(r)
+        ]
+        # derivatives[m][a] is the m-th derivative at the center of the cell 0
+        # of the polynomial whose cell averages are
+        # the Kronecker delta on the candidate stencil,
+        # i.e. the polynomial is sum_m derivatives[m][a] x**m/m!.
+
+        q = [[Fraction(0)] * order for _ in range(order)]
+        for a in range(r):
+            for b in range(a, r):
+                value = sum(
+                    derivatives[m][a]
+                    * derivatives[n][b]
+                    / (factorial(m - l) * factorial(n - l))
+                    * _integral_of_monomial(m + n - 2 * l)
+                    for l in range(1, r)
+                    for m in range(l, r)
+                    for n in range(l, r)
+                )
+                # int_{-1/2}^{1/2} (d^l/dx^l x**m/m!)(d^l/dx^l x**n/n!) dx
+                # = int_{-1/2}^{1/2} x**(m+n-2l) dx / ((m-l)! (n-l)!)
+                q[k + a][k + b] = value
+                q[k + b][k + a] = value
+        forms.append(tuple(tuple(row) for row in q))
+
+    return tuple(forms)
+
+
+def _integral_of_monomial(n: int) -> Fraction:
+    """
+    calculate int_{-1/2}^{1/2} x**n dx.
+
+    Args:
+        n (int): degree of the monomial.
+
+    Returns:
+        Fraction: the integral, 0 for odd n.
+    """
+    if n % 2 == 1:
+        return Fraction(0)
+
+    return Fraction(1, 2**n * (n + 1))
+
+
+def _validate_order(order: int):
+    """
+    validate the order of WENO reconstruction.
+
+    Args:
+        order (int): order of WENO reconstruction.
+
+    Raises:
+        UnsupportedOrderOfWENOError: if order is not supported.
+    """
+    if order not in SUPPORTED_ORDERS:
+        raise UnsupportedOrderOfWENOError(order)
+        # raise error if
+        # - order is not one of 3, 5, 7, 9, and 11.
@@ -0,0 +1,228 @@
+import sympy as sp
+from fractions import Fraction
+from math import factorial
+
+from dictos.defaults import DEFAULT_DIFFERENTIAND, DEFAULT_INTERVAL
+from dictos.utilities.spec import is_not_natural_number, are_different_length
+from dictos.linalg.exceptions import InconsistentDataSetError
+from dictos.series.taylor_expansion import derivative_symbol
+from dictos.series.exceptions import NumberOfExpansionTermsIsNotNaturalNumberError
+
+
+class PowerSeries:
+    """
+    A truncated power series sum_i c_i f^(i) h**i
+    represented by exact rational coefficients c_i
+    indexed by the order of derivative i.
+
+    This class is a lightweight alternative to the sympy expression
+    returned from `taylor_expansion.taylor_series`.
+    Additions and scalings are performed on a tuple of Fraction,
+    and the series is converted to sympy Expr only when required.
+
+    Attributes:
+        coefficients (tuple of Fraction): coefficients c_0, c_1, ...
+
+    Examples:
+        >>> from dictos.series.power_series import PowerSeries
+        >>> PowerSeries.taylor(2, 4).to_expr()
+        f + 2*f^(1)*h + 2*f^(2)*h**2 + 4*f^(3)*h**3/3 + 2*f^(4)*h**4/3
+    """
+
+    __slots__ = ("coefficients",)
+
+    def __init__(self, coefficients):
+        """
+        Create a new PowerSeries instance.
+
+        Args:
+            coefficients (iterable of int, Fraction, or sympy Rational):
+                coefficients c_0, c_1, ... of the series.
+        """
+        self.coefficients = tuple(to_fraction(c) for c in coefficients)
+
+    @classmethod
+    def taylor(cls, around, up_to: int):
+        """
+        calculate Taylor series of f(x) around `around`*h.
+
+        Args:
+            around (int, float, Fraction, or sympy Rational):
+                a relative position in units of the interval h.
+            up_to (int): number of terms in the Taylor series
+                excluding the first term
+
+        Raises:
+            NumberOfExpansionTermsIsNotNaturalNumberError: if
+                number of series expansion terms including the first term
+                is not the natural number.
+
+        Returns:
+            PowerSeries: Taylor series [1, s, s**2/2, ..., s**up_to/up_to!].
+        """
+        num_term = up_to + 1
+        # number of series expansion terms including the first term.
+        if is_not_natural_number(num_term):
+            raise NumberOfExpansionTermsIsNotNaturalNumberError(num_term)
+            # raise error if
+            # - number of series expansion terms is not the natural number.
+
+        s = to_fraction(around)
+        return cls(s**i / factorial(i) for i in range(num_term))
+
+    @classmethod
+    def unit(cls, deriv: int):
+        """
+        create a series having only a term f^(deriv)*h**deriv.
+
+        Args:
+            deriv (int): order of derivative.
+
+        Returns:
+            PowerSeries: series [0, ..., 0, 1].
+        """
+        return cls([0] * deriv + [1])
+
+    @staticmethod
+    def dot(weights, series):
+        """
+        calculate weighted sum of series.
+
+        Args:
+            weights (list of int, Fraction, or sympy Rational): weights.
+            series (list of PowerSeries): series to be summed.
+
+        Raises:
+            InconsistentDataSetError: if two lists are inconsistent.
+
+        Returns:
+            PowerSeries: weighted sum of series.
+        """
+        if are_different_length(weights, series):
+            raise InconsistentDataSetError(weights, series)
+            # raise error if
+            # two lists are inconsistent.
+
+        length = max((len(s) for s in series), default=0)
+        coef = [Fraction(0)] * length
+        for w, s in zip(weights, series):
+            w = to_fraction(w)
+            if w == 0:
+                continue
+            for i, c in enumerate(s.coefficients):
+                coef[i] += w * c
+
+        return PowerSeries(coef)
+
+    def scale(self, factor):
+        """
+        multiply each coefficient by a scalar value.
+
+        Args:
+            factor (int, Fraction, or sympy Rational): scalar multiplier.
+
+        Returns:
+            PowerSeries: scaled series.
+        """
+        factor = to_fraction(factor)
+        return PowerSeries(c * factor for c in self.coefficients)
+
+    def leading_term(self):
+        """
+        find the term with the lowest order of derivative
+        having a non-zero coefficient.
+
+        Returns:
+            tuple of int and Fraction: order of derivative and its coefficient.
+                (None, Fraction(0)) if all coefficients are 0.
+        """
+        for i, c in enumerate(self.coefficients):
+            if c != 0:
+                return i, c
+
+        return None, Fraction(0)
+
+    def to_expr(
+        self,
+        differentiand: str = DEFAULT_DIFFERENTIAND,
+        interval: str = DEFAULT_INTERVAL,
+    ) -> sp.Expr:
+        """
+        convert the series to sympy Expr.
+
+        Args:
+            differentiand (str, optional): differentiand symbol.
+                Defaults to DEFAULT_DIFFERENTIAND.
+            interval (str, optional): an interval symbol like `dx`.
+                Defaults to DEFAULT_INTERVAL.
+
+        Returns:
+            sympy Expr: series like f + f^(1)*h + f^(2)*h**2/2 + ...
+        """
+        h = sp.symbols(interval)
+        return sp.Add(
+            *[
+                to_rational(c) * derivative_symbol(differentiand, i) * h**i
+                for i, c in enumerate(self.coefficients)
+            ]
+        )
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
+
+    def __add__(self, other):
+        length = max(len(self), len(other))
+        a = self.coefficients + (Fraction(0),) * (length - len(self))
+        b = other.coefficients + (Fraction(0),) * (length - len(other))
+        return PowerSeries(x + y for x, y in zip(a, b))
+
+    def __neg__(self):
+        return self.scale(-1)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __mul__(self, factor):
+        return self.scale(factor)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PowerSeries):
+            return NotImplemented
+        return self.coefficients == other.coefficients
+
+    def __repr__(self) -> str:
+        return f"PowerSeries({[str(c) for c in self.coefficients]})"
+
+
+def to_fraction(number) -> Fraction:
+    """
+    convert a number to Fraction exactly.
+    A float is converted through its shortest decimal representation,
+    so that 0.1 becomes 1/10.
+
+    Args:
+        number (int, float, Fraction, or sympy Number): a number to be converted.
+
+    Returns:
+        Fraction: converted number.
+    """
+    if isinstance(number, (int, Fraction)):
+        return Fraction(number)
+    if isinstance(number, sp.Rational):
+        return Fraction(int(number.p), int(number.q))
+    return Fraction(str(number))
+
+
+def to_rational(number) -> sp.Rational:
+    """
+    convert a Fraction to sympy Rational.
+
+    Args:
+        number (Fraction): a number to be converted.
+
+    Returns:
+        sympy Rational: converted number.
+    """
+    return sp.Rational(number.numerator, number.denominator)
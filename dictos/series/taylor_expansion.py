@@ -1,5 +1,6 @@
 import sympy as sp
 
+from dictos.utilities.profiling import profiled
 from dictos.defaults import DEFAULT_DIFFERENTIAND
 from dictos.utilities.spec import (
     is_not_natural_number,
@@ -12,6 +13,7 @@ from dictos.series.exceptions import (
 )
 
 
+@profiled("taylor_series")
 def taylor_series(around, up_to: int):
     """
     calculate Taylor series of f(x) around h
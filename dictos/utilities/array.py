@@ -0,0 +1,38 @@
+"""
+Provide helper functions for NumPy arrays.
+"""
+
+import numpy as np
+
+
+def normalize_axes(axis, ndim: int) -> tuple:
+    """
+    convert an axis or axes to a tuple of non-negative axes.
+
+    Args:
+        axis (int, tuple of int, or None): axis or axes.
+            None means all axes.
+        ndim (int): number of dimensions of the array.
+
+    Raises:
+        ValueError: if an axis is out of range.
+
+    Returns:
+        tuple of int: non-negative axes.
+
+    Examples:
+        >>> from dictos.utilities.array import normalize_axes
+        >>> normalize_axes(-1, 3)
+        (2,)
+        >>> normalize_axes(None, 2)
+        (0, 1)
+    """
+    if axis is None:
+        return tuple(range(ndim))
+
+    axes = (axis,) if np.ndim(axis) == 0 else tuple(axis)
+    for ax in axes:
+        if not -ndim <= ax < ndim:
+            raise ValueError(f"axis {ax} is out of range for {ndim}-d array.")
+
+    return tuple(ax % ndim for ax in axes)
@@ -0,0 +1,197 @@
+"""
+Provide opt-in instrumentation of the coefficient derivation pipeline.
+"""
+
+import os
+import json
+import time
+import inspect
+import threading
+from contextvars import ContextVar
+from contextlib import contextmanager
+from functools import wraps
+
+_PROFILES = ContextVar("dictos_profiles", default=())
+# active profiles in the current context.
+# stages are recorded only while this is not empty.
+# each thread has its own context,
+# so that a profile does not record stages executed in other threads.
+# the tuple is replaced instead of modified,
+# so that iterating over it is not affected by other contexts.
+
+
+class Profile:
+    """
+    A record of stages executed while profiling is active.
+
+    Each stage records the wall time, and the stencil size when
+    the stage has a stencil-like argument.
+    Only stages executed in the thread that opened the profile are recorded.
+    Times of nested stages are inclusive, e.g. the time of
+    `finite_difference.coefficients` contains the time of `lagrangian_poly`.
+
+    Attributes:
+        events (list of tuple): recorded stages as tuples of
+            name, start and end times in nanoseconds, stencil size, and thread id.
+        origin (int): time in nanoseconds when profiling started.
+
+    Examples:
+        >>> import dictos
+        >>> from dictos import finite_difference as fd
+        >>> with dictos.profile() as prof:
+        ...     _ = fd.coefficients([-1.5, -0.5, 0.5, 1.5])
+        >>> prof.as_dict()["finite_difference.coefficients"]["calls"]
+        1
+    """
+
+    __slots__ = ("events", "origin")
+
+    def __init__(self):
+        """
+        Create a new Profile instance.
+        """
+        self.events = []
+        self.origin = time.perf_counter_ns()
+
+    def record(self, name: str, start: int, end: int, size=None):
+        """
+        record a stage.
+
+        Args:
+            name (str): name of the stage.
+            start (int): start time in nanoseconds.
+            end (int): end time in nanoseconds.
+            size (int, optional): stencil size. Defaults to None.
+        """
+        self.events.append((name, start, end, size, threading.get_ident()))
+
+    def as_dict(self) -> dict:
+        """
+        summarize recorded stages.
+
+        Returns:
+            dict: statistics for each stage like
+                {"lagrangian_poly": {"calls": 2, "total": 0.01, "mean": 0.005,
+                "max": 0.006, "sizes": {3: 1, 5: 1}}}.
+                Times are in seconds.
+                `sizes` maps each stencil size to the number of calls.
+        """
+        stats = {}
+        for name, start, end, size, _ in self.events:
+            stage = stats.setdefault(
+                name, {"calls": 0, "total": 0.0, "mean": 0.0, "max": 0.0, "sizes": {}}
+            )
+            elapsed = (end - start) * 1e-9
+            stage["calls"] += 1
+            stage["total"] += elapsed
+            stage["max"] = max(stage["max"], elapsed)
+            if size is not None:
+                stage["sizes"][size] = stage["sizes"].get(size, 0) + 1
+
+        for stage in stats.values():
+            stage["mean"] = stage["total"] / stage["calls"]
+
+        return stats
+
+    def to_chrome_trace(self) -> dict:
+        """
+        convert recorded stages to the Chrome trace event format,
+        which can be loaded in chrome://tracing or Perfetto.
+
+        Returns:
+            dict: trace with complete ("X") events in microseconds.
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": "dictos",
+                    "ph": "X",
+                    "ts": (start - self.origin) * 1e-3,
+                    "dur": (end - start) * 1e-3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {} if size is None else {"stencil_size": size},
+                }
+                for name, start, end, size, tid in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save_chrome_trace(self, path: str):
+        """
+        write recorded stages to a file in the Chrome trace event format.
+
+        Args:
+            path (str): path to the output JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+@contextmanager
+def profile():
+    """
+    record stages of the coefficient derivation pipeline
+    executed in the context.
+
+    Yields:
+        Profile: a record of executed stages.
+
+    Examples:
+        >>> import dictos
+        >>> from dictos import finite_difference as fd
+        >>> with dictos.profile() as prof:
+        ...     _ = fd.equation([-1, 0, 1], deriv=2)
+        >>> sorted(prof.as_dict())[:2]
+        ['create_coordinate_symbols', 'finite_difference.coefficients']
+    """
+    prof = Profile()
+    token = _PROFILES.set(_PROFILES.get() + (prof,))
+    try:
+        yield prof
+    finally:
+        _PROFILES.reset(token)
+
+
+def profiled(name: str, size_arg: str = None):
+    """
+    decorate a function as a stage recorded while profiling is active.
+    When profiling is not active, the function is called
+    with only a check of active profiles.
+
+    Args:
+        name (str): name of the stage.
+        size_arg (str, optional): name of the argument whose length
+            is recorded as the stencil size. Defaults to None.
+
+    Returns:
+        Callable: decorator.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func) if size_arg is not None else None
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profiles = _PROFILES.get()
+            if not profiles:
+                return func(*args, **kwargs)
+
+            size = None
+            if signature is not None:
+                arg = signature.bind_partial(*args, **kwargs).arguments.get(size_arg)
+                size = len(arg) if hasattr(arg, "__len__") else None
+
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter_ns()
+                for prof in profiles:
+                    prof.record(name, start, end, size)
+
+        return wrapper
+
+    return decorator
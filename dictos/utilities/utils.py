@@ -1,11 +1,15 @@
 import sympy as sp
-import numpy as np
+from math import gcd
+from functools import reduce
+from numbers import Rational
 
+from dictos.utilities.profiling import profiled
 from dictos.linalg.linalg import div
-from dictos.discrete.stencil import get_subscript
+from dictos.discrete.stencil import get_offset
 from dictos.utilities.exceptions.internal import UnexpectedDenominatorError
 
 
+@profiled("simplify_coefficients", "coef")
 def simplify_coefficients(coef, as_numer_denom: bool = False):
     """
     simplify coefficients in floating-point number
@@ -38,19 +42,29 @@ def simplify_coefficients(coef, as_numer_denom: bool = False):
         >>> utl.simplify_coefficients(expr, as_numer_denom=True)
         ([1, -8, 8, -1], 12)
     """
-    coef_num = [c if c.is_number else sp.poly(c).coeffs()[0] for c in coef]
-    # extract numbers from list of coefficients like [1/h**2, ...].
+    if all(isinstance(c, Rational) for c in coef):
+        coef_rational = [sp.Rational(c.numerator, c.denominator) for c in coef]
+        # exact coefficients like int, Fraction and sympy Rational
+        # are converted directly without `sympy.nsimplify`.
+    else:
+        coef_num = [c if c.is_number else sp.poly(c).coeffs()[0] for c in coef]
+        # extract numbers from list of coefficients like [1/h**2, ...].
 
-    # convert each coefficient to a rational number
-    coef_rational = [sp.nsimplify(c, rational=True) for c in coef_num]
+        # convert each coefficient to a rational number
+        coef_rational = [sp.nsimplify(c, rational=True) for c in coef_num]
 
     if not as_numer_denom:
         return coef_rational
     else:
         # Find the least common multiple of all denominators
-        denom_lcm = sp.lcm([c.q for c in coef_rational])
+        denom_lcm = sp.Integer(
+            reduce(
+                lambda a, b: a * b // gcd(a, b), [int(c.q) for c in coef_rational], 1
+            )
+        )
         # extract denomenator of each coefficient
         # and calculate the least common multiple.
+        # math.lcm is not used since it is not available in Python 3.8.
 
         # Multiply each coefficient by the LCM of denominators
         numer = [c * denom_lcm for c in coef_rational]
@@ -58,6 +72,7 @@ def simplify_coefficients(coef, as_numer_denom: bool = False):
         return numer, denom_lcm
 
 
+@profiled("extract_coefficients_as_numer_denom", "f_set")
 def extract_coefficients_as_numer_denom(expr, f_set):
     """
     Extract coefficients as numerator and denominator
@@ -141,7 +156,7 @@ def decompose_addition(expr_add):
         [0*a, b, 2*c]
     """
 
-    if type(expr_add) is sp.Symbol or type(expr_add) is sp.Mul:
+    if isinstance(expr_add, sp.Symbol) or type(expr_add) is sp.Mul:
         return expr_add
         # if type of `expr_add` is Symbol or Mul, there is nothing more to do.
 
@@ -211,7 +226,7 @@ def drop_coefficient_of_1(expr: sp.Expr) -> sp.Expr:
         z
     """
 
-    if type(expr) is sp.Symbol:
+    if isinstance(expr, sp.Symbol):
         return expr
         # if type of `expr` is Symbol, it is assumed to be unary with no coefficients
         # and returned as is.
@@ -244,6 +259,7 @@ def drop_coefficient_of_1(expr: sp.Expr) -> sp.Expr:
     # each term is not evaluated (evaluate=False).
 
 
+@profiled("sort_by_subscript")
 def sort_by_subscript(expr):
     """
     sort numerator of sympy expr by subscripts of symbols in the numerator.
@@ -288,16 +304,16 @@ def sort_by_subscript(expr):
     # decompose numerator into each term and extract all terms as a list.
     # intended result is [f_{-2}, -f_{2}, 0*f_{0}, -8*f_{-1}, 8*f_{1}].
 
-    subscripts = []
-    for n in terms:
-        subscript = get_subscript(n)
-        subscripts.append(float(subscript))
-    # extract subscript from each term of the numerator.
-    # intended result is [-2.000, 2.000, 0.000, -1.000, 1.000].
+    subscripts = [get_offset(n) for n in terms]
+    # extract offset from each term of the numerator.
+    # intended result is [-2, 2, 0, -1, 1].
+    # offsets are exact rational numbers, so that sorting is correct
+    # for wide stencils and subscripts having many decimal places.
 
-    numer_sorted_terms = [terms[i] for i in np.argsort(subscripts)]
+    numer_sorted_terms = [
+        t for _, t in sorted(zip(subscripts, terms), key=lambda pair: pair[0])
+    ]
     # sort terms of the numeartor by subscript.
-    # a result of numpy.argsort(subscripts) is [0, 3, 2, 4, 1],
     # numer_sorted_terms is [terms[0], terms[3], terms[2], terms[4], terms[1]].
 
     # rearrange numerator in order of the subscripts.
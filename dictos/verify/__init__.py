@@ -0,0 +1 @@
+from dictos.verify.verify import convergence, format_report
@@ -0,0 +1,51 @@
+"""
+Custom exceptions for errors related to verification of schemes.
+"""
+
+
+class VerificationError(Exception):
+    """
+    Base class for error related to verification of schemes.
+    """
+
+    pass
+
+
+class TooFewRefinementLevelsError(VerificationError):
+    """
+    Exception raised for errors
+    that the number of grid refinement levels is too few
+    to estimate the order of convergence.
+
+    Attributes:
+        levels (int): number of levels which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, levels: int) -> None:
+        self.message = (
+            f"The number of refinement levels {levels} is too few. "
+            + "Specify 2 or more levels to estimate the order of convergence."
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class NotUnivariateFunctionError(VerificationError):
+    """
+    Exception raised for errors
+    that a test function has two or more independent variables.
+
+    Attributes:
+        func (sympy Expr): test function which caused the error.
+        message (str): Explanation of the error.
+    """
+
+    def __init__(self, func) -> None:
+        self.message = (
+            f"The test function {func} must have at most one independent variable."
+        )
+
+    def __str__(self) -> str:
+        return self.message
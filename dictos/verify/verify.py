@@ -0,0 +1,282 @@
+"""
+Verify generated schemes by numerical grid refinement studies.
+"""
+
+import itertools
+import numpy as np
+import sympy as sp
+
+from dictos.defaults import DEFAULT_INDEPENDENT_VARIABLE, DEFAULT_INTERVAL
+from dictos.calculus import finite_difference as fd
+from dictos.core.grid_type import GridType
+from dictos.discrete.stencil import Stencil
+from dictos.verify.exceptions import (
+    TooFewRefinementLevelsError,
+    NotUnivariateFunctionError,
+)
+
+DEFAULT_TEST_FUNCTION = "sin(x)"
+# str for the analytic test function
+
+ROUNDOFF_SAFETY_FACTOR = 10
+# errors must exceed the round-off bound by this factor
+# to be used for judging convergence.
+
+
+def convergence(
+    deriv=1,
+    acc=2,
+    grid_type=GridType.REGULAR,
+    func=DEFAULT_TEST_FUNCTION,
+    levels: int = 4,
+    h: float = 1.0,
+    points=None,
+    rtol: float = 0.1,
+) -> list:
+    """
+    verify the order of accuracy of finite difference schemes
+    generated by `finite_difference.generate`.
+
+    Each scheme is applied to analytic test functions
+    on successively refined grids with intervals h, h/2, h/4, ...,
+    and the observed order of convergence is compared with
+    the order predicted by `finite_difference.truncation_error`.
+    Every argument except `levels`, `h`, `points` and `rtol` accepts
+    a sequence, and all combinations of them are verified in one run.
+
+    Args:
+        deriv (int or list of int, optional): Order of derivative.
+            Defaults to 1.
+        acc (int or list of int, optional): Order of accuracy. Defaults to 2.
+        grid_type (GridType or list of GridType, optional): Type of grid system.
+            Defaults to GridType.REGULAR.
+        func (str, sympy Expr, or list of them, optional): analytic test function
+            of one independent variable. Defaults to "sin(x)".
+        levels (int, optional): Number of grid refinement levels. Defaults to 4.
+        h (float, optional): Coarsest grid interval. Defaults to 1.0.
+        points (array_like, optional): Points where schemes are evaluated.
+            Defaults to 11 points in [0, 1].
+        rtol (float, optional): Relative tolerance of the observed order
+            at the finest level above the round-off floor
+            to the predicted order. Defaults to 0.1.
+
+    Returns:
+        list of dict: results for each scheme like
+            {"deriv": 1, "acc": 2, "grid_type": GridType.REGULAR,
+            "func": sin(x), "stencil": [-1, 0, 1],
+            "h": array([1.0, 0.5, ...]), "errors": array([...]),
+            "estimates": array([...]), "observed": array([...]),
+            "resolved": array([...]), "predicted": 2, "converged": True}.
+            `errors` are maximum absolute errors at `points` for each level,
+            `estimates` are maximum absolute values of
+            the leading term of the truncation error,
+            `observed` are orders estimated from errors of two adjacent levels, and
+            `resolved` flags observed orders whose errors are
+            above the round-off floor of both levels.
+
+    Note:
+        - Observed orders are meaningless when the scheme is exact for
+        a test function, e.g. a polynomial of low degree,
+        or when errors reach the round-off level on fine grids.
+        The latter are excluded from the judgement of `converged`,
+        which is False if no observed order is above the round-off floor.
+
+    Raises:
+        TooFewRefinementLevelsError: if levels < 2.
+        NotUnivariateFunctionError: if a test function has
+            two or more independent variables.
+
+    Examples:
+        >>> from dictos import verify
+        >>> result = verify.convergence(deriv=2, acc=4)[0]
+        >>> result["predicted"], round(result["observed"][-1])
+        (4, 4)
+    """
+    if levels < 2:
+        raise TooFewRefinementLevelsError(levels)
+        # raise error if
+        # - order of convergence cannot be estimated from one level.
+
+    x = np.linspace(0.0, 1.0, 11) if points is None else np.asarray(points, float)
+    intervals = h / 2.0 ** np.arange(levels)
+    test_functions = [_to_test_function(f) for f in _as_list(func)]
+
+    results = []
+    for d, a, g in itertools.product(
+        _as_list(deriv), _as_list(acc), _as_list(grid_type)
+    ):
+        scheme = fd.generate(d, a, g, lazy=True)
+        coef = scheme.as_numpy()
+        stencil = scheme.stencil
+        order, constant = _leading_term(stencil, d)
+
+        for f, var in test_functions:
+            values = _lambdify(f, var)(
+                x[np.newaxis, :, np.newaxis]
+                + np.asarray(stencil)[np.newaxis, np.newaxis, :]
+                * intervals[:, np.newaxis, np.newaxis]
+            )
+            approx = values @ coef / intervals[:, np.newaxis] ** d
+            # evaluate the scheme at all levels and points at once.
+            # shape of approx is (levels, points).
+
+            exact = _lambdify(sp.diff(f, var, d), var)(x)
+            errors = np.max(np.abs(approx - exact), axis=1)
+
+            estimates = np.max(
+                np.abs(
+                    float(constant)
+                    * intervals[:, np.newaxis] ** order
+                    * _lambdify(sp.diff(f, var, d + order), var)(x)
+                ),
+                axis=1,
+            )
+            # leading term of the truncation error C*h^p*f^(d+p)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                observed = np.log(errors[:-1] / errors[1:]) / np.log(
+                    intervals[:-1] / intervals[1:]
+                )
+            # observed orders are nan if the scheme is exact for `f`.
+
+            roundoff = (
+                np.finfo(np.float64).eps
+                * np.max(np.abs(values), axis=(1, 2))
+                * np.sum(np.abs(coef))
+                / intervals**d
+            )
+            above = errors > ROUNDOFF_SAFETY_FACTOR * roundoff
+            resolved = above[:-1] & above[1:]
+            # bound of round-off errors in evaluating the scheme.
+            # observed orders on levels below the bound are not reliable.
+
+            results.append(
+                {
+                    "deriv": d,
+                    "acc": a,
+                    "grid_type": g,
+                    "func": f,
+                    "stencil": stencil,
+                    "h": intervals,
+                    "errors": errors,
+                    "estimates": estimates,
+                    "observed": observed,
+                    "resolved": resolved,
+                    "predicted": order,
+                    "converged": bool(
+                        resolved.any()
+                        and abs(observed[resolved][-1] - order) <= rtol * order
+                    ),
+                }
+            )
+
+    return results
+
+
+def format_report(results: list) -> str:
+    """
+    format results of `convergence` as a table.
+
+    Args:
+        results (list of dict): results of `convergence`.
+
+    Returns:
+        str: table of errors at the finest level,
+            observed orders at the finest level above the round-off floor,
+            and predicted orders for each scheme.
+    """
+    lines = [
+        f"{'grid type':<14}{'deriv':>6}{'acc':>5}  {'function':<16}"
+        + f"{'error':>11}{'observed':>10}{'predicted':>10}  converged"
+    ]
+    for r in results:
+        observed = r["observed"][r["resolved"]]
+        lines.append(
+            f"{r['grid_type'].value:<14}{r['deriv']:>6}{r['acc']:>5}  "
+            + f"{str(r['func']):<16}{r['errors'][-1]:>11.3e}"
+            + f"{observed[-1] if observed.size else np.nan:>10.3f}"
+            + f"{r['predicted']:>10}  {r['converged']}"
+        )
+
+    return "\n".join(lines)
+
+
+def _as_list(arg) -> list:
+    """
+    wrap a scalar argument in a list.
+
+    Args:
+        arg (Any): a scalar or a sequence.
+
+    Returns:
+        list: `arg` as list.
+    """
+    if isinstance(arg, (list, tuple)):
+        return list(arg)
+    return [arg]
+
+
+def _to_test_function(func):
+    """
+    convert a test function to a sympy expression and its independent variable.
+
+    Args:
+        func (str or sympy Expr): test function.
+
+    Raises:
+        NotUnivariateFunctionError: if `func` has
+            two or more independent variables.
+
+    Returns:
+        tuple of sympy Expr and sympy Symbol: test function
+            and its independent variable.
+    """
+    f = sp.sympify(func)
+    if len(f.free_symbols) > 1:
+        raise NotUnivariateFunctionError(f)
+        # raise error if
+        # - the function is multivariate.
+
+    var = (
+        f.free_symbols.pop()
+        if f.free_symbols
+        else sp.Symbol(DEFAULT_INDEPENDENT_VARIABLE)
+    )
+    return f, var
+
+
+def _lambdify(f, var):
+    """
+    convert a sympy expression to a function evaluated by NumPy.
+    The function returns an array of the same shape as the argument
+    even when `f` is a constant.
+
+    Args:
+        f (sympy Expr): expression.
+        var (sympy Symbol): independent variable.
+
+    Returns:
+        Callable: function of ndarray.
+    """
+    func = sp.lambdify(var, f, "numpy")
+    return lambda x: np.broadcast_to(func(x), np.shape(x))
+
+
+def _leading_term(stencil: list, deriv: int):
+    """
+    extract the order and constant of the leading term of the truncation error.
+
+    Args:
+        stencil (list of int or float): relative point numbers.
+        deriv (int): order of derivative.
+
+    Returns:
+        tuple of int and sympy Rational: order p and constant C of
+            the leading term C*h^p*f^(deriv+p).
+    """
+    h = sp.Symbol(DEFAULT_INTERVAL)
+    error = fd.truncation_error(Stencil(stencil), deriv, DEFAULT_INTERVAL)
+    # pass Stencil so that the error is derived in exact arithmetic
+    # even for stencils on mid points.
+    constant, order = error.as_coeff_exponent(h)
+    return int(order), constant.as_coeff_Mul()[0]
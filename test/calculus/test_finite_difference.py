@@ -14,6 +14,7 @@ from dictos.calculus.finite_difference import (
     coefficients,
     truncation_error,
     generate,
+    hermite_coefficients,
 )
 
 from dictos.core.grid_type import GridType
@@ -313,6 +314,67 @@ class FiniteDifferenceTest(unittest.TestCase):
                 actual = coefficients(stencil, 1, as_numer_denom=True)
                 self.assertEqual(expected[half_width], actual)
 
+    def test_coefficients_exact(self):
+        """
+        test suite for finite_difference.coefficients with exact stencils.
+        """
+        from fractions import Fraction
+        from dictos.discrete.stencil import Stencil
+
+        for stencil in [[-1.5, -0.5, 0.5, 1.5], [-0.5, 0.5, 1.5], [0, 0.5, 1.5, 3]]:
+            exact = [Fraction(str(s)) for s in stencil]
+            for deriv in range(1, len(stencil) + 1):
+                with self.subTest(f"{deriv}-th derivative on Fraction stencil {exact}"):
+                    expected = coefficients(stencil, deriv)
+                    self.assertEqual(expected, coefficients(exact, deriv))
+                    self.assertEqual(expected, coefficients(Stencil(stencil), deriv))
+
+    def test_generate_exact(self):
+        """
+        test suite for finite_difference.generate on wide stencils of floats.
+        """
+        with self.subTest("6th-order 2nd derivative on cell-centered grid"):
+            expected = [
+                sp.Rational(259, 11520),
+                sp.Rational(-499, 2304),
+                sp.Rational(1299, 1280),
+                sp.Rational(-1891, 2304),
+                sp.Rational(-1891, 2304),
+                sp.Rational(1299, 1280),
+                sp.Rational(-499, 2304),
+                sp.Rational(259, 11520),
+            ]
+            self.assertEqual(expected, generate(2, 6, GridType.CELL_CENTERED))
+
+        for acc in range(2, 13, 2):
+            for deriv in range(1, 7):
+                with self.subTest(f"{acc}-order {deriv}-derivative on cell-centered grid"):
+                    coef = generate(deriv, acc, GridType.CELL_CENTERED)
+                    half_width = len(coef) // 2
+                    stencil = [sp.Rational(2 * i + 1, 2) for i in range(-half_width, half_width)]
+                    self.assertEqual(sum(c * s**deriv for c, s in zip(coef, stencil)), sp.factorial(deriv))
+
+    def test_hermite_coefficients(self):
+        """
+        test suite for finite_difference.hermite_coefficients.
+        """
+
+        for stencil, deriv in [([-1, 0, 1], 1), ([-2, -1, 0, 1, 2], 2)]:
+            with self.subTest(f"function values only on {stencil}"):
+                expected = coefficients(stencil, deriv)
+                actual = hermite_coefficients(stencil, [[0]] * len(stencil), deriv)
+                self.assertEqual(expected, list(actual.values()))
+
+        with self.subTest("4th-order compact first derivative"):
+            expected = {
+                (-1, 0): sp.Rational(-3, 4),
+                (-1, 1): sp.Rational(-1, 4),
+                (1, 0): sp.Rational(3, 4),
+                (1, 1): sp.Rational(-1, 4),
+            }
+            actual = hermite_coefficients([-1, 1])
+            self.assertEqual(expected, actual)
+
     def test_truncation_error(self):
         """
         test suite for finite_difference.truncation_error.
@@ -347,6 +409,9 @@ class FiniteDifferenceTest(unittest.TestCase):
                 actual = truncation_error(stencil, 1)
                 self.assertEqual(expected[half_width], actual)
 
+        with self.subTest("truncation error on stencil of non-terminating floats"):
+            self.assertEqual(-f_3 * h**2 / 54, truncation_error([-1 / 3, 1 / 3], 1))
+
     def test_generate(self):
         """
         test suite for finite_difference.generate.
@@ -1054,6 +1119,25 @@ class FiniteDifferenceTest(unittest.TestCase):
                     )
                     self.assertEqual(expected, actual)
 
+    def test_generate_lazy(self):
+        """
+        test suite for finite_difference.generate with lazy flag.
+        """
+        for grid_type in GridType:
+            for deriv in range(1, 5):
+                for acc in range(2, 9, 2):
+                    with self.subTest(
+                        f"generate {acc}-order lazy result for {deriv}-derivative on {grid_type.value} grid"
+                    ):
+                        result = generate(deriv, acc, grid_type, lazy=True)
+                        expected = generate(deriv, acc, grid_type)
+                        self.assertEqual(result.coefficients, list(expected))
+                        self.assertEqual(result.deriv, deriv)
+                        self.assertEqual(
+                            sum(c * sp.Rational(str(s)) ** deriv for c, s in zip(expected, result.stencil)),
+                            sp.factorial(deriv),
+                        )
+
 
 if __name__ == "__main__":
     unittest.main()
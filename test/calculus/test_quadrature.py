@@ -0,0 +1,113 @@
+"""Tests for distos.calculus.quadrature
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+import numpy as np
+
+from dictos.calculus.quadrature import coefficients, integrate
+from dictos.discrete.exceptions import DuplicatedPointError
+
+
+class QuadratureTest(unittest.TestCase):
+    def test_coefficients(self):
+        """
+        test suite for quadrature.coefficients.
+        """
+
+        for stencil, a, b, expected in [
+            ([0, 1], 0, 1, ([1, 1], 2)),
+            ([0, 1, 2], 0, 2, ([1, 4, 1], 3)),
+            ([0, 1, 2, 3], 0, 3, ([3, 9, 9, 3], 8)),
+            ([0, 1, 2, 3, 4], 0, 4, ([14, 64, 24, 64, 14], 45)),
+            ([0], -0.5, 0.5, ([1], 1)),
+            ([-1, 0, 1], 0, 1, ([-1, 8, 5], 12)),
+            ([-0.5, 0.5], -1, 1, ([1, 1], 1)),
+        ]:
+            with self.subTest(f"quadrature on {stencil} from {a} to {b}"):
+                actual = coefficients(stencil, a, b, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+
+        x = sp.symbols("x")
+        for stencil, a, b in [([-2, -1, 0, 1], 0, 1), ([0.5, 1.5, 2.5], 0, 3)]:
+            with self.subTest(f"exact for polynomials on {stencil}"):
+                coef = coefficients(stencil, a, b)
+                for m in range(len(stencil)):
+                    expected = sp.integrate(x**m, (x, sp.nsimplify(a), b))
+                    actual = sum(
+                        c * sp.nsimplify(s) ** m for c, s in zip(coef, sorted(stencil))
+                    )
+                    self.assertEqual(expected, actual)
+
+        with self.subTest("duplicated points"):
+            with self.assertRaises(DuplicatedPointError):
+                coefficients([0, 1, 1], 0, 1)
+
+    def test_integrate(self):
+        """
+        test suite for quadrature.integrate.
+        """
+
+        for order in [2, 3, 4, 5, 6]:
+            with self.subTest(f"exact for polynomials by {order}-order rule"):
+                x = np.linspace(0, 2, 21)
+                for m in range(order - 1):
+                    self.assertAlmostEqual(
+                        2 ** (m + 1) / (m + 1), integrate(x**m, 0.1, order)
+                    )
+
+            with self.subTest(f"convergence of {order}-order rule"):
+                error = [
+                    abs(integrate(np.exp(np.linspace(0, 1, n + 1)), 1 / n, order))
+                    for n in [20, 40]
+                ]
+                error = [abs(e - (np.e - 1)) for e in error]
+                self.assertAlmostEqual(order, np.log2(error[0] / error[1]), delta=0.2)
+
+        with self.subTest("Newton-Cotes rule for a few points"):
+            x = np.linspace(0, 1, 5)
+            self.assertAlmostEqual(1 / 5, integrate(x**4, 0.25, order=6))
+
+        with self.subTest("integrate along an axis"):
+            rng = np.random.default_rng(0)
+            array = rng.random((3, 12, 4))
+            actual = integrate(array, 0.5, 4, axis=1)
+            self.assertEqual((3, 4), actual.shape)
+            np.testing.assert_allclose(integrate(array[1, :, 2], 0.5, 4), actual[1, 2])
+
+        with self.subTest("invalid order of accuracy"):
+            with self.assertRaises(ValueError):
+                integrate(np.zeros(10), order=1)
+
+        with self.subTest("axis out of range"):
+            with self.assertRaises(ValueError):
+                integrate(np.zeros((10, 10)), axis=2)
+
+    def test_integrate_without_sympy(self):
+        """
+        test suite for quadrature.integrate without importing sympy.
+        """
+        import subprocess
+        import os
+
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from dictos.calculus import quadrature\n"
+            "quadrature.integrate(np.linspace(0.0, 1.0, 11), h=0.1, order=6)\n"
+            "quadrature.integrate(np.linspace(0.0, 1.0, 5), h=0.25, order=6)\n"
+            "assert 'sympy' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
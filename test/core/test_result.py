@@ -0,0 +1,79 @@
+"""Tests for distos.core.result
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+import numpy as np
+
+from dictos.core.result import StencilResult
+from dictos.calculus import finite_difference as fd
+from dictos.filter import filter as flt
+
+
+class StencilResultTest(unittest.TestCase):
+    def test_stencil_result(self):
+        """
+        test suite for StencilResult.
+        """
+        result = StencilResult([-1, 0, 1], [-1, 0, 1], 2, deriv=1)
+
+        with self.subTest("coefficients"):
+            self.assertEqual(
+                result.coefficients, [sp.Rational(-1, 2), 0, sp.Rational(1, 2)]
+            )
+            self.assertEqual(result.as_floats(), [-0.5, 0.0, 0.5])
+            self.assertEqual(len(result), 3)
+
+        with self.subTest("cached read-only array"):
+            array = result.as_numpy()
+            self.assertIs(array, result.as_numpy())
+            self.assertFalse(array.flags.writeable)
+            np.testing.assert_array_equal(array, [-0.5, 0.0, 0.5])
+
+        with self.subTest("cached expression"):
+            self.assertEqual(str(result.expr), "(-f_{-1} + f_{1})/(2*h)")
+            self.assertIs(result.expr, result.expr)
+            self.assertEqual(result.latex, sp.latex(result.expr))
+
+    def test_finite_difference_equation_lazy(self):
+        """
+        test suite for finite_difference.equation with lazy flag.
+        """
+        for stencil, deriv in [
+            ([-2, -1, 0, 1, 2], 1),
+            ([-1, 0, 1], 2),
+            ([-1.5, -0.5, 0.5, 1.5], 1),
+            ([0, 1, 2, 3], 3),
+        ]:
+            with self.subTest(f"{deriv}-th derivative on {stencil}"):
+                result = fd.equation(stencil, deriv, lazy=True)
+                self.assertIsInstance(result, StencilResult)
+                self.assertEqual(
+                    (result.numerators, result.denominator),
+                    tuple(fd.coefficients(stencil, deriv, as_numer_denom=True)),
+                )
+                self.assertEqual(str(fd.equation(stencil, deriv)), str(result.expr))
+
+    def test_filter_generate_lazy(self):
+        """
+        test suite for filter.generate with lazy flag.
+        """
+        for acc in [2, 4, 6]:
+            with self.subTest(f"filter of order {acc}"):
+                result = flt.generate(acc, lazy=True)
+                self.assertEqual(result.stencil, list(range(-acc // 2, acc // 2 + 1)))
+                self.assertEqual(
+                    (result.numerators, result.denominator),
+                    flt.generate(acc, as_numer_denom=True),
+                )
+                self.assertEqual(
+                    str(flt.generate(acc, as_equation=True)), str(result.expr)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
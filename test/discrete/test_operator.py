@@ -0,0 +1,158 @@
+"""Tests for distos.discrete.operator
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+from fractions import Fraction
+
+from dictos.discrete.operator import Operator
+from dictos.calculus import finite_difference as fd
+from dictos.filter import filter as filt
+from dictos.linalg.exceptions import InconsistentDataSetError
+
+
+class OperatorTest(unittest.TestCase):
+    def test_operator_init(self):
+        """
+        test suite for Operator.__init__.
+        """
+        with self.subTest("sorted by offset"):
+            op = Operator([1, -1, 0], [1, 1, -2])
+            self.assertEqual(op.stencil, [-1, 0, 1])
+            self.assertEqual(op.coefficients(), [1, -2, 1])
+
+        with self.subTest("coefficients at the same offset are summed"):
+            op = Operator([0, 1, 0], [1, 2, 3])
+            self.assertEqual(op.stencil, [0, 1])
+            self.assertEqual(op.coefficients(), [4, 2])
+
+        with self.subTest("half-integer offsets"):
+            op = Operator([-0.5, 0.5], [-1, 1])
+            self.assertEqual(op.stencil, [-0.5, 0.5])
+            self.assertEqual(op.terms[0][0], Fraction(-1, 2))
+
+        with self.subTest("inconsistent data set"):
+            with self.assertRaises(InconsistentDataSetError):
+                Operator([-1, 0, 1], [1, -2])
+
+    def test_operator_compose(self):
+        """
+        test suite for Operator.compose.
+        """
+        d2 = Operator([-1, 0, 1], [1, -2, 1], deriv=2)
+
+        with self.subTest("second derivative composed with itself"):
+            d4 = d2 @ d2
+            self.assertEqual(d4.stencil, [-2, -1, 0, 1, 2])
+            self.assertEqual(d4.coefficients(), [1, -4, 6, -4, 1])
+            self.assertEqual(d4.coefficients(), fd.coefficients([-2, -1, 0, 1, 2], 4))
+            self.assertEqual(d4.deriv, 4)
+
+        with self.subTest("first derivatives on staggered stencil"):
+            d1 = Operator.from_finite_difference([-0.5, 0.5])
+            self.assertEqual(d1 @ d1, d2)
+
+        with self.subTest("commutative"):
+            d1 = Operator.from_finite_difference([-1, 0, 1])
+            self.assertEqual(d1 @ d2, d2 @ d1)
+
+        with self.subTest("identity and shift"):
+            self.assertEqual(d2 @ Operator.identity(), d2)
+            shifted = Operator.shift(1) @ d2
+            self.assertEqual(shifted.stencil, [0, 1, 2])
+            self.assertEqual(shifted.coefficients(), [1, -2, 1])
+
+        with self.subTest("orders of derivative are added"):
+            d1 = Operator.from_finite_difference([-1, 0, 1])
+            self.assertEqual((d1 @ d2).deriv, 3)
+            self.assertEqual((Operator.from_filter(2) @ d2).deriv, 2)
+
+        with self.subTest("power"):
+            self.assertEqual(d2**2, d2 @ d2)
+            self.assertEqual((d2**2).deriv, 4)
+            self.assertEqual(d2**0, Operator.identity())
+
+        with self.subTest("negative or non-integer power"):
+            for n in [-1, 0.5, 2.0]:
+                with self.assertRaises(ValueError):
+                    d2**n
+
+        with self.subTest("as_numer_denom"):
+            d1 = Operator.from_finite_difference([-1, 0, 1])
+            self.assertEqual(
+                (d1 @ d1).coefficients(as_numer_denom=True), ([1, 0, -2, 0, 1], 4)
+            )
+
+    def test_operator_arithmetic(self):
+        """
+        test suite for addition, subtraction and scaling of Operator.
+        """
+        d2 = Operator([-1, 0, 1], [1, -2, 1], deriv=2)
+
+        with self.subTest("addition"):
+            op = d2 + Operator([0], [2], deriv=2)
+            self.assertEqual(op.coefficients(), [1, 0, 1])
+            self.assertEqual(op.deriv, 2)
+
+        with self.subTest("different orders of derivative"):
+            d1 = Operator.from_finite_difference([-1, 0, 1])
+            for other in [d1, Operator.identity(), Operator.from_filter(2)]:
+                with self.assertRaises(ValueError):
+                    d2 + other
+                with self.assertRaises(ValueError):
+                    d2 - other
+
+        with self.subTest("subtraction"):
+            self.assertEqual(len(d2 - d2), 3)
+            self.assertEqual(len((d2 - d2).simplify()), 0)
+
+        with self.subTest("scaling"):
+            expected = [sp.Rational(1, 3), sp.Rational(-2, 3), sp.Rational(1, 3)]
+            self.assertEqual((d2 * sp.Rational(1, 3)).coefficients(), expected)
+            self.assertEqual((Fraction(1, 3) * d2).coefficients(), expected)
+            self.assertEqual((-d2).coefficients(), [-1, 2, -1])
+            self.assertEqual((d2 * 3).deriv, 2)
+
+        with self.subTest("equality ignores zero coefficients"):
+            self.assertEqual(Operator([-1, 0, 1], [1, 0, 1]), Operator([-1, 1], [1, 1]))
+            self.assertEqual(
+                hash(Operator([-1, 0, 1], [1, 0, 1])), hash(Operator([-1, 1], [1, 1]))
+            )
+
+        with self.subTest("equality compares orders of derivative"):
+            self.assertNotEqual(d2, Operator([-1, 0, 1], [1, -2, 1]))
+
+    def test_operator_constructors(self):
+        """
+        test suite for Operator.from_result, from_finite_difference and from_filter.
+        """
+        with self.subTest("finite difference"):
+            d2 = Operator.from_finite_difference([-1, 0, 1], deriv=2)
+            self.assertEqual(d2, Operator([-1, 0, 1], [1, -2, 1], deriv=2))
+
+        with self.subTest("filter"):
+            f = Operator.from_filter(2)
+            self.assertEqual(f.stencil, [-1, 0, 1])
+            self.assertEqual(f.coefficients(), filt.generate(2))
+            self.assertEqual(f.deriv, 0)
+
+        with self.subTest("lazy finite difference result"):
+            result = fd.generate(deriv=2, acc=4, lazy=True)
+            op = Operator.from_result(result)
+            self.assertEqual(op, Operator.from_finite_difference(result.stencil, 2))
+
+        with self.subTest("lazy filter result"):
+            op = Operator.from_result(filt.generate(4, lazy=True))
+            self.assertEqual(op, Operator.from_filter(4))
+
+        with self.subTest("fourth derivative as second derivatives composed"):
+            d2 = Operator.from_result(fd.generate(deriv=2, lazy=True))
+            self.assertEqual(d2 @ d2, Operator.from_finite_difference(range(-2, 3), 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,11 +12,17 @@ import random
 
 from dictos.defaults import DEFAULT_INTERVAL, DEFAULT_DIFFERENTIAND
 from dictos.discrete.stencil import (
+    Stencil,
+    DifferentiandSymbol,
     create_coordinate_symbols,
     create_differentiand_symbols,
     to_subscript,
     get_subscript,
+    get_offset,
+    has_exact_points,
+    exact_points,
 )
+from dictos.discrete.exceptions import TooNarrowError, DuplicatedPointError
 from test.utilities.gen import (
     random_string,
     random_int,
@@ -160,6 +166,64 @@ class StencilTest(unittest.TestCase):
 
                 self.assertEqual(expected, actual)
 
+    def test_to_subscript_exact(self):
+        """
+        test suite for stencil.to_subscript with more than one decimal place.
+        """
+        with self.subTest("terminating decimals"):
+            self.assertEqual(to_subscript(0.25), "0.25")
+            self.assertEqual(to_subscript(sp.Rational(-5, 8)), "-0.625")
+            self.assertNotEqual(to_subscript(0.25), to_subscript(0.2))
+
+        with self.subTest("non-terminating decimals"):
+            self.assertEqual(float(to_subscript(sp.Rational(1, 3))), 1 / 3)
+
+    def test_stencil(self):
+        """
+        test suite for stencil.Stencil.
+        """
+        with self.subTest("sorted exact offsets"):
+            stencil = Stencil([1.5, -0.5, 0.5, -1.5])
+            self.assertEqual(list(stencil), [-1.5, -0.5, 0.5, 1.5])
+            self.assertEqual(
+                stencil.rationals,
+                tuple(sp.Rational(n, 2) for n in [-3, -1, 1, 3]),
+            )
+            self.assertEqual(stencil[0], -1.5)
+            self.assertEqual(stencil[1:3], [-0.5, 0.5])
+            self.assertTrue(0.5 in stencil)
+            self.assertFalse(0 in stencil)
+
+        with self.subTest("integral offsets are int"):
+            stencil = Stencil([1, 0, -1])
+            self.assertEqual(list(stencil), [-1, 0, 1])
+            self.assertTrue(all(type(s) is int for s in stencil))
+
+        with self.subTest("hashable"):
+            self.assertEqual(Stencil([0.5, -0.5]), Stencil([-0.5, 0.5]))
+            self.assertEqual(hash(Stencil([0.5, -0.5])), hash(Stencil([-0.5, 0.5])))
+            self.assertEqual(len({Stencil([0, 1]), Stencil([1, 0])}), 1)
+
+        with self.subTest("read-only offsets"):
+            with self.assertRaises(AttributeError):
+                Stencil([0, 1]).offsets = (0, 2)
+
+        with self.subTest("invalid stencil"):
+            with self.assertRaises(TooNarrowError):
+                Stencil([0])
+            with self.assertRaises(DuplicatedPointError):
+                Stencil([0, 0.0, 1])
+
+        with self.subTest("coordinate symbols"):
+            for stencil in [[-1, 0, 1], [1.5, -0.5, 0.5, -1.5]]:
+                self.assertEqual(
+                    create_coordinate_symbols(Stencil(stencil)),
+                    [
+                        sp.nsimplify(x, rational=True)
+                        for x in create_coordinate_symbols(stencil)
+                    ],
+                )
+
     def test_get_subscript(self):
         """
         test suite for stencil.get_subscript.
@@ -182,6 +246,105 @@ class StencilTest(unittest.TestCase):
 
                 self.assertEqual(expected, actual)
 
+    def test_differentiand_symbol(self):
+        """
+        test suite for stencil.DifferentiandSymbol.
+        """
+        import pickle
+        from fractions import Fraction
+
+        stencil = [-1.5, -0.25, 0, 0.25, 100]
+        f_set = create_differentiand_symbols(create_coordinate_symbols(stencil))
+
+        with self.subTest("offsets carried by symbols"):
+            self.assertTrue(all(isinstance(f, DifferentiandSymbol) for f in f_set))
+            self.assertEqual(
+                [Fraction(str(s)) for s in stencil], [f.offset for f in f_set]
+            )
+
+        plain = [sp.Symbol(str(f)) for f in f_set]
+        with self.subTest("same as sympy Symbol of the same name"):
+            for f, p in zip(f_set, plain):
+                self.assertEqual(p, f)
+                self.assertEqual(f, p)
+                self.assertEqual(hash(p), hash(f))
+            self.assertNotEqual(sp.Symbol("g_{0}"), f_set[2])
+
+        expr = sum((i + 1) * f for i, f in enumerate(f_set))
+        with self.subTest("expression same as that of sympy Symbol"):
+            expected = sum((i + 1) * p for i, p in enumerate(plain))
+            self.assertEqual(expected, expr)
+            self.assertEqual(str(expected), str(expr))
+
+        with self.subTest("substitute sympy Symbol"):
+            self.assertEqual(0, expr.subs({p: 0 for p in plain}))
+            self.assertEqual(expr - 3 * f_set[2], expr.subs(plain[2], 0))
+
+        with self.subTest("pickle"):
+            f = pickle.loads(pickle.dumps(f_set[0]))
+            self.assertIsInstance(f, DifferentiandSymbol)
+            self.assertEqual(Fraction(-3, 2), f.offset)
+
+    def test_get_offset(self):
+        """
+        test suite for stencil.get_offset.
+        """
+        from fractions import Fraction
+
+        stencil = [-1.5, -0.25, 0, 0.25, 100]
+        f_set = create_differentiand_symbols(create_coordinate_symbols(stencil))
+
+        for s, f in zip(stencil, f_set):
+            with self.subTest(f"offset of {f}"):
+                self.assertEqual(Fraction(str(s)), get_offset(f))
+                self.assertEqual(Fraction(str(s)), get_offset(-3 * f))
+
+        with self.subTest("symbol created by sympy.Symbol"):
+            self.assertEqual(Fraction(-7, 2), get_offset(sp.Symbol("g_{-3.5}")))
+
+        with self.subTest("offset of symbol with the same subscript"):
+            f = DifferentiandSymbol("f_{0.3333333333333333}", Fraction(1, 3))
+            self.assertEqual(Fraction(1, 3), get_offset(f))
+            self.assertEqual(Fraction(1, 3), get_offset(2 * f))
+
+    def test_has_exact_points(self):
+        """
+        test suite for stencil.has_exact_points.
+        """
+        from fractions import Fraction
+
+        for stencil in [
+            [-1, 0, 1],
+            [Fraction(-1, 3), Fraction(1, 3)],
+            [sp.Rational(-1, 2), sp.Rational(1, 2)],
+            [-1.5, -0.5, 0.5, 1.5],
+            [-1, 0.25, 2.125],
+            Stencil([0.1, 0.2]),
+        ]:
+            with self.subTest(f"exact stencil {stencil}"):
+                self.assertTrue(has_exact_points(stencil))
+
+        for stencil in [[-0.1, 0.1], [0, 1 / 3], [sp.Float(0.5), 1]]:
+            with self.subTest(f"inexact stencil {stencil}"):
+                self.assertFalse(has_exact_points(stencil))
+
+    def test_exact_points(self):
+        """
+        test suite for stencil.exact_points.
+        """
+        from fractions import Fraction
+
+        with self.subTest("exact points"):
+            self.assertEqual(
+                [Fraction(-3, 2), Fraction(1, 2), Fraction(2)],
+                exact_points([0.5, 2, -1.5]),
+            )
+
+        with self.subTest("inexact points"):
+            self.assertEqual(
+                [Fraction(-2, 3), Fraction(1, 10)], exact_points([0.1, -2 / 3])
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
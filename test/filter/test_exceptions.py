@@ -0,0 +1,57 @@
+"""Tests for distos.filter.exceptions
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+
+from dictos.filter.filter import generate_compact, design
+from dictos.filter.exceptions import (
+    InvalidFilterParameterError,
+    InconsistentNumberOfConstraintsError,
+    InvalidStencilWidthError,
+)
+
+
+class ErrorFilterTest(unittest.TestCase):
+    @unittest.expectedFailure
+    def test_error_filter_InvalidFilterParameterError(self):
+        """
+        test suite for filter.exceptions.InvalidFilterParameterError.
+        """
+
+        alpha = 0.6
+        with self.subTest(alpha):
+            if alpha > 0.5:
+                raise InvalidFilterParameterError(alpha)
+
+    def test_error_generate_compact(self):
+        """
+        test suite for filter.generate_compact exceptions.
+        """
+
+        for alpha in [-1, -0.5, 0.51, 1]:
+            with self.subTest(f"generate compact filter with alpha = {alpha}"):
+                with self.assertRaises(InvalidFilterParameterError):
+                    generate_compact(acc=4, alpha=alpha)
+
+    def test_error_design(self):
+        """
+        test suite for filter.design exceptions.
+        """
+
+        for width in [-1, 1, 2, 4]:
+            with self.subTest(f"design filter with stencil width {width}"):
+                with self.assertRaises(InvalidStencilWidthError):
+                    design(width=width, acc=2)
+
+        for width, acc, cutoff in [(3, 6, None), (5, 2, 1), (5, 2, 3), (5, 6, 1)]:
+            with self.subTest(f"design ({width}, {acc}, {cutoff}) filter"):
+                with self.assertRaises(InconsistentNumberOfConstraintsError):
+                    design(width=width, acc=acc, cutoff=cutoff)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,8 +7,19 @@ sys.path.insert(1, "..")
 
 import unittest
 import sympy as sp
+import numpy as np
 
-from dictos.filter.filter import generate
+from dictos.filter.filter import (
+    _boundary_block,
+    _compact_folded_weights,
+    _folded_weights,
+    generate,
+    apply,
+    generate_compact,
+    apply_compact,
+    generate_boundary,
+    design,
+)
 from dictos.linalg.linalg import scale
 
 
@@ -111,6 +122,330 @@ class FilterTest(unittest.TestCase):
                 # so compare between sympy.Expr and converted and simplified form
                 self.assertEqual(expected, actual)
 
+    def test_apply(self):
+        """
+        test suite for filter.apply.
+        """
+
+        rng = np.random.default_rng(0)
+        for acc in [2, 4, 6, 8]:
+            numer, denom = generate(acc=acc, as_numer_denom=True)
+            weight = [float(n) / float(denom) for n in numer]
+            half_width = acc // 2
+
+            x = rng.random(32)
+            expected = sum(
+                weight[k + half_width] * np.roll(x, -k)
+                for k in range(-half_width, half_width + 1)
+            )
+            with self.subTest(f"{acc}-order filter on periodic 1-d array"):
+                actual = apply(x, acc=acc, periodic=True)
+                np.testing.assert_allclose(actual, expected, rtol=1e-14)
+
+            with self.subTest(f"{acc}-order filter on non-periodic 1-d array"):
+                actual = apply(x, acc=acc)
+                np.testing.assert_allclose(
+                    actual[half_width:-half_width],
+                    expected[half_width:-half_width],
+                    rtol=1e-14,
+                )
+                self.assertEqual(x[0], actual[0])
+                self.assertEqual(x[-1], actual[-1])
+                # the filter is not applied to the points on the edges.
+                self.assertAlmostEqual(
+                    (x[0] + 2 * x[1] + x[2]) / 4, actual[1], delta=1e-15
+                )
+                # 2nd-order filter is applied next to the edge.
+
+        x = rng.random((9, 10, 11))
+        for axis in [0, 1, 2, -1, (0, 2), (0, 1, 2)]:
+            with self.subTest(f"multi-dimensional array along axis {axis}"):
+                axes = (axis,) if isinstance(axis, int) else axis
+                expected = x
+                for ax in axes:
+                    expected = np.apply_along_axis(
+                        lambda line: apply(line, acc=4), ax, expected
+                    )
+
+                actual = apply(x, acc=4, axis=axis)
+                np.testing.assert_allclose(actual, expected, rtol=1e-14)
+
+                out = np.empty_like(x)
+                ret = apply(x, acc=4, axis=axis, out=out)
+                self.assertIs(out, ret)
+                np.testing.assert_allclose(out, expected, rtol=1e-14)
+
+                y = x.copy()
+                ret = apply(y, acc=4, axis=axis, inplace=True)
+                self.assertIs(y, ret)
+                np.testing.assert_allclose(y, expected, rtol=1e-14)
+
+        with self.subTest("constant is preserved"):
+            x = np.full((12, 13), 3.0)
+            np.testing.assert_allclose(apply(x, acc=10, axis=(0, 1)), x, rtol=1e-14)
+
+        with self.subTest("cached weights are read-only"):
+            for half_width in [0, 1, 2]:
+                with self.assertRaises(ValueError):
+                    _folded_weights(half_width)[0] = 99.0
+
+        with self.subTest("invalid arguments"):
+            x = rng.random(8)
+            with self.assertRaises(ValueError):
+                apply(x, acc=2, out=np.empty_like(x), inplace=True)
+            with self.assertRaises(ValueError):
+                apply(x, acc=2, out=np.empty(9))
+            with self.assertRaises(ValueError):
+                apply(x, acc=2, axis=1)
+
+    def test_design(self):
+        """
+        test suite for filter.design.
+        """
+
+        for acc in [2, 4, 6, 8, 10]:
+            with self.subTest(f"design {acc}-order filter with {acc + 1}-point stencil"):
+                expected = generate(acc=acc, as_numer_denom=True)
+                actual = design(width=acc + 1, acc=acc, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+                # the binomial family is reproduced.
+
+        with self.subTest("design filter with maximally flat response at pi"):
+            expected = ([1, 4, 6, 4, 1], 16)
+            actual = design(width=5, acc=2, as_numer_denom=True)
+            self.assertEqual(expected, actual)
+
+        with self.subTest("design filter with specified response"):
+            expected = [sp.Rational(c, 32) for c in [-1, 0, 9, 16, 9, 0, -1]]
+            actual = design(width=7, acc=4, response={sp.pi / 2: sp.Rational(1, 2)})
+            self.assertEqual(expected, actual)
+
+        k = sp.Symbol("k")
+        for width, acc, cutoff in [(7, 2, 3), (7, 4, 2), (9, 4, 2), (9, 6, 1)]:
+            with self.subTest(f"transfer function of ({width}, {acc}, {cutoff}) filter"):
+                response = None
+                if width // 2 + 1 > acc // 2 + cutoff:
+                    response = {sp.pi / 3: sp.Rational(3, 4)}
+                coef = design(width=width, acc=acc, cutoff=cutoff, response=response)
+
+                half_width = width // 2
+                transfer = coef[half_width] + sum(
+                    2 * coef[half_width + n] * sp.cos(n * k)
+                    for n in range(1, half_width + 1)
+                )
+                at_0 = sp.series(transfer, k, 0, acc).removeO()
+                self.assertEqual(1, sp.simplify(at_0))
+                at_pi = sp.series(transfer, k, sp.pi, 2 * cutoff).removeO()
+                self.assertEqual(0, sp.simplify(at_pi))
+                if response is not None:
+                    self.assertEqual(
+                        sp.Rational(3, 4), sp.simplify(transfer.subs(k, sp.pi / 3))
+                    )
+
+        with self.subTest("design filter as equation"):
+            f = sp.symbols("f_{-1} f_{0} f_{1}")
+            expected = (f[0] + 2 * f[1] + f[2]) / 4
+            actual = sp.simplify(design(width=3, acc=2, as_equation=True).toSympyExpr())
+            self.assertEqual(expected, actual)
+
+    def test_generate_boundary(self):
+        """
+        test suite for filter.generate_boundary.
+        """
+
+        with self.subTest("generate 6-order central boundary filters"):
+            expected = [
+                [1, 0, 0, 0, 0, 0, 0],
+                [sp.Rational(1, 4), sp.Rational(1, 2), sp.Rational(1, 4), 0, 0, 0, 0],
+                [sp.Rational(c, 16) for c in [-1, 4, 10, 4, -1]] + [0, 0],
+            ]
+            actual = generate_boundary(acc=6)
+            self.assertEqual(expected, actual)
+
+        with self.subTest("generate 4-order one-sided boundary filters"):
+            expected = [([15, 4, -6, 4, -1], 16), ([1, 12, 6, -4, 1], 16)]
+            actual = generate_boundary(acc=4, one_sided=True, as_numer_denom=True)
+            self.assertEqual(expected, actual)
+
+        for acc in [2, 4, 6, 8]:
+            with self.subTest(f"{acc}-order one-sided boundary filters"):
+                block = generate_boundary(acc=acc, one_sided=True)
+                for i, row in enumerate(block):
+                    for m in range(acc):
+                        filtered = sum(c * j**m for j, c in enumerate(row))
+                        self.assertEqual(i**m, filtered)
+                    # polynomials of degree < acc are preserved.
+                    self.assertEqual(0, sum(c * (-1) ** j for j, c in enumerate(row)))
+                    # the highest wavenumber mode is eliminated.
+
+        with self.subTest("cached boundary blocks are read-only"):
+            for one_sided in [False, True]:
+                with self.assertRaises(ValueError):
+                    _boundary_block(4, one_sided)[0, 0] = 99.0
+
+    def test_apply_boundary(self):
+        """
+        test suite for filter.apply near the edges.
+        """
+
+        rng = np.random.default_rng(0)
+        for acc in [2, 4, 6, 8]:
+            for one_sided in [False, True]:
+                block = np.array(
+                    generate_boundary(acc=acc, one_sided=one_sided), dtype=float
+                )
+                rows, cols = block.shape
+                x = rng.random((3, 16))
+                with self.subTest(f"{acc}-order filter, one_sided = {one_sided}"):
+                    actual = apply(x, acc=acc, one_sided=one_sided)
+                    np.testing.assert_allclose(
+                        actual[:, :rows], x[:, :cols] @ block.T, rtol=1e-13
+                    )
+                    np.testing.assert_allclose(
+                        actual[:, -rows:],
+                        x[:, -cols:] @ block[::-1, ::-1].T,
+                        rtol=1e-13,
+                    )
+
+        with self.subTest("short line with central boundary filters"):
+            x = rng.random(4)
+            expected = [x[0], (x[0] + 2 * x[1] + x[2]) / 4]
+            expected += [(x[1] + 2 * x[2] + x[3]) / 4, x[3]]
+            np.testing.assert_allclose(apply(x, acc=8), expected, rtol=1e-14)
+
+        with self.subTest("short line with one-sided boundary filters"):
+            with self.assertRaises(ValueError):
+                apply(rng.random(4), acc=4, one_sided=True)
+
+    def test_generate_compact(self):
+        """
+        test suite for filter.generate_compact.
+        """
+
+        alpha = sp.Symbol("alpha")
+        half = sp.Rational(1, 2)
+        EXPECTED_RHS_COEFFICIENTS = {
+            2: [half + alpha, half + alpha],
+            4: [
+                sp.Rational(5, 8) + 3 * alpha / 4,
+                half + alpha,
+                -sp.Rational(1, 8) + alpha / 4,
+            ],
+            6: [
+                sp.Rational(11, 16) + 5 * alpha / 8,
+                sp.Rational(15, 32) + 17 * alpha / 16,
+                -sp.Rational(3, 16) + 3 * alpha / 8,
+                sp.Rational(1, 32) - alpha / 16,
+            ],
+        }
+        # a_0, a_1, ..., a_N in the literature, e.g., Gaitonde & Visbal (2000)
+
+        for acc, a in EXPECTED_RHS_COEFFICIENTS.items():
+            with self.subTest(f"generate {acc}-order compact filter coefficients"):
+                side = [sp.expand(c / 2) for c in a[:0:-1]]
+                expected = ([alpha, 1, alpha], side + [a[0]] + side[::-1])
+                actual = generate_compact(acc=acc, alpha=alpha)
+                self.assertEqual(expected, actual)
+
+        with self.subTest("generate compact filter coefficients as_numer_denom"):
+            expected = (([9, 20, 9], 20), ([19, 38, 19], 40))
+            actual = generate_compact(acc=2, alpha=0.45, as_numer_denom=True)
+            self.assertEqual(expected, actual)
+
+        with self.subTest("compact filter with alpha = 0 is the explicit filter"):
+            for acc in [2, 4, 6, 8]:
+                _, actual = generate_compact(acc=acc, alpha=0)
+                self.assertEqual(generate(acc=acc), actual)
+
+    def test_apply_compact(self):
+        """
+        test suite for filter.apply_compact.
+        """
+
+        rng = np.random.default_rng(0)
+        n = 24
+        for acc in [2, 4, 6]:
+            for alpha in [-0.2, 0.0, 0.3, 0.45]:
+                lhs, rhs = generate_compact(acc=acc, alpha=alpha)
+                half_width = acc // 2
+
+                a = np.eye(n) + float(lhs[0]) * (
+                    np.eye(n, k=1) + np.eye(n, k=-1) + np.eye(n, k=n - 1)
+                    + np.eye(n, k=1 - n)
+                )
+                b = sum(
+                    float(rhs[k + half_width])
+                    * np.roll(np.eye(n), k, axis=1)
+                    for k in range(-half_width, half_width + 1)
+                )
+                x = rng.random(n)
+                expected = np.linalg.solve(a, b @ x)
+                with self.subTest(f"{acc}-order compact filter, alpha = {alpha}"):
+                    actual = apply_compact(x, acc=acc, alpha=alpha, periodic=True)
+                    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+        x = rng.random((5, n, 6))
+        with self.subTest("compact filter along an axis of 3-d array"):
+            actual = apply_compact(x, acc=4, alpha=0.4, axis=1)
+            for i in range(x.shape[0]):
+                for k in range(x.shape[2]):
+                    np.testing.assert_allclose(
+                        actual[i, :, k],
+                        apply_compact(x[i, :, k], acc=4, alpha=0.4),
+                        rtol=1e-12,
+                    )
+            np.testing.assert_array_equal(actual[:, 0, :], x[:, 0, :])
+            np.testing.assert_array_equal(actual[:, -1, :], x[:, -1, :])
+            # the filter is not applied to the points on the edges.
+
+        with self.subTest("constant is preserved"):
+            x = np.full((12, 13), 3.0)
+            actual = apply_compact(x, acc=8, alpha=0.45, axis=(0, 1), inplace=True)
+            np.testing.assert_allclose(actual, 3.0, rtol=1e-13)
+
+        with self.subTest("cached weights are read-only"):
+            for half_width in [0, 1, 2]:
+                with self.assertRaises(ValueError):
+                    _compact_folded_weights(half_width, 0.4)[0] = 99.0
+
+    def test_package(self):
+        """
+        test suite for functions exported from dictos.filter.
+        """
+        import dictos
+        import dictos.filter
+
+        self.assertIs(dictos.filter.generate, generate)
+        self.assertIs(dictos.filter.design, design)
+        self.assertIs(dictos.filter.generate_compact, generate_compact)
+        self.assertIs(dictos.filter.generate_boundary, generate_boundary)
+        self.assertIs(dictos.filter.apply, apply)
+        self.assertIs(dictos.filter.apply_compact, apply_compact)
+
+    def test_apply_without_sympy(self):
+        """
+        test suite for filter.apply and filter.apply_compact without importing sympy.
+        """
+        import subprocess
+        import os
+
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "import dictos\n"
+            "from dictos.filter import filter as flt\n"
+            "a = np.linspace(0.0, 1.0, 16) ** 2\n"
+            "flt.apply(a, acc=6)\n"
+            "flt.apply(a, acc=6, one_sided=True)\n"
+            "flt.apply_compact(a, acc=6, alpha=0.45)\n"
+            "assert 'sympy' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,10 +7,20 @@ sys.path.insert(1, "..")
 
 import unittest
 import sympy as sp
+import numpy as np
 import random
-
-from dictos.linalg.linalg import dot_product, div, add, scale
-from dictos.linalg.exceptions import InconsistentDataSetError
+from fractions import Fraction
+
+from dictos.linalg.linalg import (
+    dot_product,
+    div,
+    add,
+    scale,
+    solve,
+    solve_fraction,
+    solve_tridiagonal,
+)
+from dictos.linalg.exceptions import InconsistentDataSetError, SingularMatrixError
 from test.utilities.gen import random_int, random_string
 
 
@@ -143,6 +153,78 @@ class LinalgTest(unittest.TestCase):
             result = add(input1, input2)
             self.assertEqual(result, expected)
 
+    def test_linalg_solve(self):
+        """test suite for linalg.solve"""
+
+        with self.subTest("solve system with rational solution"):
+            expected = [sp.Rational(1, 3), sp.Rational(-2, 3)]
+            actual = solve([[1, 2], [4, -1]], [-1, 2])
+            self.assertEqual(expected, actual)
+
+        with self.subTest("solve system with symbolic right-hand side"):
+            a, b = sp.symbols("a b")
+            expected = [(a + b) / 2, (a - b) / 2]
+            actual = solve([[1, 1], [1, -1]], [a, b])
+            self.assertEqual(
+                [0, 0], [sp.simplify(e - x) for e, x in zip(expected, actual)]
+            )
+
+        with self.subTest("solve singular system"):
+            with self.assertRaises(SingularMatrixError):
+                solve([[1, 2], [2, 4]], [1, 2])
+
+    def test_linalg_solve_fraction(self):
+        """test suite for linalg.solve_fraction"""
+
+        with self.subTest("solve system with rational solution"):
+            expected = [Fraction(1, 3), Fraction(-2, 3)]
+            actual = solve_fraction([[1, 2], [4, -1]], [-1, 2])
+            self.assertEqual(expected, actual)
+
+        with self.subTest("solve system requiring row exchange"):
+            expected = [Fraction(2), Fraction(1, 2)]
+            actual = solve_fraction([[0, 2], [1, 0]], [1, 2])
+            self.assertEqual(expected, actual)
+
+        with self.subTest("solve system same as linalg.solve"):
+            matrix = [[1, 1, 1], [-1, 0, 1], [1, 0, 1]]
+            rhs = [0, 1, 0]
+            expected = [Fraction(int(v.p), int(v.q)) for v in solve(matrix, rhs)]
+            self.assertEqual(expected, solve_fraction(matrix, rhs))
+
+        with self.subTest("solve singular system"):
+            with self.assertRaises(SingularMatrixError):
+                solve_fraction([[1, 2], [2, 4]], [1, 2])
+
+    def test_linalg_solve_tridiagonal(self):
+        """test suite for linalg.solve_tridiagonal"""
+
+        rng = np.random.default_rng(0)
+        for n in [3, 4, 10]:
+            lower = rng.random(n)
+            diag = rng.random(n) + 3
+            upper = rng.random(n)
+            rhs = rng.random((n, 2, 3))
+            matrix = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+
+            with self.subTest(f"solve {n}x{n} tridiagonal systems"):
+                expected = np.linalg.solve(matrix, rhs.reshape(n, -1)).reshape(
+                    rhs.shape
+                )
+                actual = solve_tridiagonal(lower, diag, upper, rhs.copy())
+                np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+            matrix[0, -1] += lower[0]
+            matrix[-1, 0] += upper[-1]
+            with self.subTest(f"solve {n}x{n} cyclic tridiagonal systems"):
+                expected = np.linalg.solve(matrix, rhs.reshape(n, -1)).reshape(
+                    rhs.shape
+                )
+                actual = solve_tridiagonal(
+                    lower, diag, upper, rhs.copy(), periodic=True
+                )
+                np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
     def test_linalg_exception(self):
         """test suite for exception in linalg"""
         numer = [sp.Number(i) for i in range(4)]
@@ -0,0 +1,108 @@
+"""Tests for distos.poly.barycentric
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import numpy as np
+
+from dictos.poly.barycentric import BarycentricInterpolator
+from dictos.poly.exceptions import InconsistentDataSetError
+from dictos.discrete.exceptions import DuplicatedPointError, TooNarrowError
+
+
+class BarycentricTest(unittest.TestCase):
+    def test_weights(self):
+        """
+        test suite for BarycentricInterpolator.weights.
+        """
+
+        for nodes, expected in [
+            ([-1, 0, 1], [1 / 2, -1, 1 / 2]),
+            ([0, 1, 2, 3], [-1 / 6, 1 / 2, -1 / 2, 1 / 6]),
+            ([-1.5, -0.5, 0.5, 1.5], [-1 / 6, 1 / 2, -1 / 2, 1 / 6]),
+        ]:
+            with self.subTest(f"weights on {nodes}"):
+                actual = BarycentricInterpolator(nodes).weights
+                np.testing.assert_allclose(actual, expected)
+
+    def test_call(self):
+        """
+        test suite for evaluating BarycentricInterpolator.
+        """
+        rng = np.random.default_rng(0)
+
+        for nodes in [[-1, 1], [-2, -1, 0, 1, 2], [-1.5, -0.5, 0.5, 1.5, 3.0]]:
+            degree = len(nodes) - 1
+            p = rng.random(degree + 1)
+            interp = BarycentricInterpolator(nodes)
+            values = np.polyval(p, nodes)
+
+            with self.subTest(f"reproduce a polynomial on {nodes}"):
+                targets = rng.uniform(-3, 3, (4, 5))
+                np.testing.assert_allclose(
+                    np.polyval(p, targets), interp(values, targets)
+                )
+
+            with self.subTest(f"targets coinciding with nodes {nodes}"):
+                targets = np.array(nodes + [0.25])
+                np.testing.assert_allclose(
+                    np.polyval(p, targets), interp(values, targets)
+                )
+
+            with self.subTest(f"multiple data sets on {nodes}"):
+                targets = rng.uniform(-3, 3, 7)
+                data = np.stack([values, 2 * values, -values], axis=1)
+                actual = interp(data, targets)
+                self.assertEqual((7, 3), actual.shape)
+                np.testing.assert_allclose(
+                    np.polyval(p, targets)[:, np.newaxis] * [1, 2, -1], actual
+                )
+
+    def test_derivative(self):
+        """
+        test suite for BarycentricInterpolator.derivative.
+        """
+        rng = np.random.default_rng(1)
+
+        for nodes in [[-1, 1], [-2, -1, 0, 1, 2], [-1.5, -0.5, 0.5, 1.5, 3.0]]:
+            degree = len(nodes) - 1
+            p = rng.random(degree + 1)
+            interp = BarycentricInterpolator(nodes)
+            values = np.polyval(p, nodes)
+            targets = np.concatenate([rng.uniform(-3, 3, 10), nodes])
+
+            with self.subTest(f"derivative of a polynomial on {nodes}"):
+                np.testing.assert_allclose(
+                    np.polyval(np.polyder(p), targets),
+                    interp.derivative(values, targets),
+                )
+
+            with self.subTest(f"differentiation matrix on {nodes}"):
+                np.testing.assert_allclose(
+                    np.polyval(np.polyder(p), nodes),
+                    interp.differentiation_matrix() @ values,
+                )
+
+    def test_exceptions(self):
+        """
+        test suite for exceptions raised by BarycentricInterpolator.
+        """
+
+        with self.subTest("too narrow"):
+            with self.assertRaises(TooNarrowError):
+                BarycentricInterpolator([1])
+
+        with self.subTest("duplicated points"):
+            with self.assertRaises(DuplicatedPointError):
+                BarycentricInterpolator([-1, 0, 0, 1])
+
+        with self.subTest("inconsistent data set"):
+            with self.assertRaises(InconsistentDataSetError):
+                BarycentricInterpolator([-1, 0, 1])([1, 2], [0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,9 +12,11 @@ from dictos.poly.exceptions import (
     InconsistentDataSetError,
     DegreeOfPolynomialIsNotNaturalNumberError,
     InconsistentDataSetAndDegreeOfPolynomialError,
+    UnsupportedOrderOfKnownDerivativeError,
 )
 from dictos.discrete.exceptions import DuplicatedPointError, TooNarrowError
 from dictos.poly.lagrangian_polynomial import lagrangian_basis, lagrangian_poly
+from dictos.poly.hermite import coefficients as hermite_coefficients
 
 
 class ErrorLagrangianPolynomialTest(unittest.TestCase):
@@ -73,6 +75,17 @@ class ErrorLagrangianPolynomialTest(unittest.TestCase):
             if degree != len(x_set) + 1:
                 raise InconsistentDataSetAndDegreeOfPolynomialError(degree, x_set)
 
+    @unittest.expectedFailure
+    def test_error_lagrangian_polynomial_UnsupportedOrderOfKnownDerivativeError(self):
+        """
+        test suite for poly.exceptions.UnsupportedOrderOfKnownDerivativeError.
+        """
+
+        for order in [0, -1]:
+            with self.subTest(order):
+                if order < 0:
+                    raise UnsupportedOrderOfKnownDerivativeError(order)
+
     def test_error_lagrangian_polynomial_exception(
         self,
     ):
@@ -129,6 +142,10 @@ class ErrorLagrangianPolynomialTest(unittest.TestCase):
             with self.assertRaises(TooNarrowError):
                 lagrangian_poly(x, x_set, f_set)
 
+        with self.subTest("hermite coefficients with negative order of derivative"):
+            with self.assertRaises(UnsupportedOrderOfKnownDerivativeError):
+                hermite_coefficients([-1, 1], [[0, -1], [0]])
+
 
 if __name__ == "__main__":
     unittest.main()
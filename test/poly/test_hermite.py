@@ -0,0 +1,88 @@
+"""Tests for distos.poly.hermite
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+
+from dictos.poly.hermite import coefficients
+from dictos.poly.interpolation import coefficients as interpolation_coefficients
+from dictos.poly.exceptions import (
+    InconsistentDataSetError,
+    UnsupportedOrderOfKnownDerivativeError,
+)
+from dictos.discrete.exceptions import DuplicatedPointError
+from dictos.linalg.exceptions import SingularMatrixError
+
+
+class HermiteTest(unittest.TestCase):
+    def test_coefficients(self):
+        """
+        test suite for hermite.coefficients.
+        """
+
+        for stencil in [[-1, 1], [-2, -1, 1, 2], [-1.5, -0.5, 0.5, 1.5]]:
+            with self.subTest(f"function values only on {stencil}"):
+                expected = interpolation_coefficients(stencil)
+                actual = coefficients(stencil, [[0]] * len(stencil))
+                self.assertEqual(expected, list(actual.values()))
+
+        with self.subTest("cubic Hermite interpolation at midpoint"):
+            expected = {
+                (-1, 0): sp.Rational(1, 2),
+                (-1, 1): sp.Rational(1, 4),
+                (1, 0): sp.Rational(1, 2),
+                (1, 1): sp.Rational(-1, 4),
+            }
+            actual = coefficients([1, -1])
+            self.assertEqual(expected, actual)
+
+        with self.subTest("4th-order compact first derivative"):
+            expected = ({(-1, 0): -3, (-1, 1): -1, (1, 0): 3, (1, 1): -1}, 4)
+            actual = coefficients([-1, 1], deriv=1, as_numer_denom=True)
+            self.assertEqual(expected, actual)
+
+        x = sp.symbols("x")
+        for stencil, known, deriv in [
+            ([-1, 0, 1], [[0, 1], [0], [0, 1]], 1),
+            ([-1, 0, 1], [[0, 1, 2], [0], [0, 1, 2]], 2),
+            ([-1.5, -0.5, 0.5, 1.5], [[0], [0, 1], [0, 1], [0]], 0),
+            ([0, 1, 2], [[0, 1], [0], [0]], 1),
+        ]:
+            with self.subTest(f"exact for polynomials on {stencil} with {known}"):
+                coef = coefficients(stencil, known, deriv)
+                for m in range(len(coef)):
+                    expected = sp.diff(x**m, x, deriv).subs(x, 0)
+                    actual = sum(
+                        c * sp.diff(x**m, x, k).subs(x, sp.nsimplify(s))
+                        for (s, k), c in coef.items()
+                    )
+                    self.assertEqual(expected, actual)
+
+    def test_exceptions(self):
+        """
+        test suite for exceptions raised by hermite.coefficients.
+        """
+
+        with self.subTest("inconsistent stencil and known derivatives"):
+            with self.assertRaises(InconsistentDataSetError):
+                coefficients([-1, 1], [[0]])
+
+        with self.subTest("duplicated points"):
+            with self.assertRaises(DuplicatedPointError):
+                coefficients([-1, 1, 1])
+
+        with self.subTest("negative order of derivative"):
+            with self.assertRaises(UnsupportedOrderOfKnownDerivativeError):
+                coefficients([-1, 1], [[0], [-1]])
+
+        with self.subTest("undetermined coefficients"):
+            with self.assertRaises(SingularMatrixError):
+                coefficients([-1, 0, 1], [[0], [1], [0]], deriv=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,21 @@ sys.path.insert(1, "..")
 import unittest
 import sympy as sp
 import random
+import numpy as np
 
-from dictos.poly.interpolation import equation, coefficients, truncation_error
+from dictos.calculus.exceptions import InvalidOrderOfAccuracyForCentralFormError
+from dictos.poly.interpolation import (
+    equation,
+    coefficients,
+    coefficients_at,
+    truncation_error,
+    extrapolation_coefficients,
+    extrapolation_error,
+    fill_ghost_cells,
+    to_cell_centers,
+    to_nodes,
+    hermite_coefficients,
+)
 
 
 class InterpolationTest(unittest.TestCase):
@@ -240,6 +253,49 @@ class InterpolationTest(unittest.TestCase):
                     actual = coefficients(stencil, as_numer_denom=True)
                     self.assertEqual(expected[width], actual)
 
+    def test_coefficients_at(self):
+        """
+        test suite for interplation.coefficients_at.
+        """
+
+        for stencil in [[-1, 1], [-2, -1, 1, 2], [-1.5, -0.5, 0.5, 1.5]]:
+            with self.subTest(f"coefficients at 0 on {stencil}"):
+                expected = [coefficients(stencil)]
+                actual = coefficients_at(stencil, [0])
+                self.assertEqual(expected, actual)
+
+        with self.subTest("exact coefficients at rational targets"):
+            expected = [
+                [sp.Rational(1, 2), sp.Rational(1, 2)],
+                [sp.Rational(3, 4), sp.Rational(1, 4)],
+                [sp.Rational(2, 3), sp.Rational(1, 3)],
+            ]
+            actual = coefficients_at([1, 0], [0.5, 0.25, sp.Rational(1, 3)])
+            self.assertEqual(expected, actual)
+
+        with self.subTest("targets coinciding with the stencil"):
+            expected = [[1, 0, 0], [0, 0, 1]]
+            actual = coefficients_at([-1, 0, 1], [-1, 1])
+            self.assertEqual(expected, actual)
+
+        rng = np.random.default_rng(0)
+        for stencil in [[-1, 0, 1], [-2, -1, 0, 1], [-1.5, -0.5, 0.5, 1.5]]:
+            with self.subTest(f"float64 coefficients on {stencil}"):
+                targets = rng.uniform(-1, 1, 6)
+                expected = np.array(
+                    coefficients_at(stencil, targets.tolist()), dtype=np.float64
+                )
+                actual = coefficients_at(stencil, targets)
+                self.assertEqual((6, len(stencil)), actual.shape)
+                np.testing.assert_allclose(expected, actual)
+
+        with self.subTest("coefficients as polynomials"):
+            x = sp.symbols("x")
+            coef, poly = coefficients_at([-1, 0, 1], [0.5], as_polynomial=True)
+            expected = [x**2 / 2 - x / 2, 1 - x**2, x**2 / 2 + x / 2]
+            self.assertEqual(expected, poly)
+            self.assertEqual(coef[0], [p.subs(x, sp.Rational(1, 2)) for p in poly])
+
     def test_truncation_error(self):
         """
         test suite for interplation.truncation_error.
@@ -292,6 +348,213 @@ class InterpolationTest(unittest.TestCase):
                 actual = truncation_error(stencil)
                 self.assertEqual(expected[width], actual)
 
+        with self.subTest("truncation error on stencil of non-terminating floats"):
+            self.assertEqual(-f_2 * h**2 / 9, truncation_error([-2 / 3, 1 / 3]))
+
+    def test_extrapolation_coefficients(self):
+        """
+        test suite for interplation.extrapolation_coefficients.
+        """
+
+        for stencil, target, expected in [
+            ([1, 2], 0, [2, -1]),
+            ([1, 2, 3], 0, [3, -3, 1]),
+            ([1, 2, 3, 4], -1, [10, -20, 15, -4]),
+            ([0.5, 1.5, 2.5], -0.5, [3, -3, 1]),
+            ([-1, 1], 0, [sp.Rational(1, 2), sp.Rational(1, 2)]),
+        ]:
+            with self.subTest(f"extrapolation from {stencil} to {target}"):
+                actual = extrapolation_coefficients(stencil, target)
+                self.assertEqual(expected, actual)
+
+        for stencil in [[-1, 1], [-2, -1, 1, 2], [-1.5, -0.5, 0.5, 1.5]]:
+            with self.subTest(f"extrapolation to 0 on {stencil}"):
+                expected = coefficients(stencil, as_numer_denom=True)
+                actual = extrapolation_coefficients(stencil, 0, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+
+    def test_extrapolation_error(self):
+        """
+        test suite for interplation.extrapolation_error.
+        """
+        h = sp.symbols("h")
+
+        for stencil, target, expected in [
+            ([1, 2], 0, sp.symbols("f^(2)") * h**2),
+            ([1, 2, 3], 0, -sp.symbols("f^(3)") * h**3),
+            ([1, 2, 3, 4], -1, 5 * sp.symbols("f^(4)") * h**4),
+        ]:
+            with self.subTest(f"extrapolation from {stencil} to {target}"):
+                actual = extrapolation_error(stencil, target)
+                self.assertEqual(expected, actual)
+
+        for stencil in [[-1, 1], [-2, -1, 1, 2], [-1.5, -0.5, 0.5, 1.5]]:
+            with self.subTest(f"extrapolation to 0 on {stencil}"):
+                expected = truncation_error(stencil)
+                actual = extrapolation_error(stencil, 0)
+                self.assertEqual(expected, actual)
+
+    def test_fill_ghost_cells(self):
+        """
+        test suite for interplation.fill_ghost_cells.
+        """
+        rng = np.random.default_rng(0)
+
+        for n_ghost, order in [(1, 1), (2, 2), (3, 4), (2, 5)]:
+            with self.subTest(f"{n_ghost} ghost cells with order {order}"):
+                p = rng.random(order)
+                x = np.arange(-n_ghost, 10 + n_ghost, dtype=np.float64)
+                expected = np.polyval(p, x)
+
+                array = expected.copy()
+                array[:n_ghost] = 0
+                array[-n_ghost:] = 0
+                actual = fill_ghost_cells(array, n_ghost, order)
+                self.assertIs(array, actual)
+                np.testing.assert_allclose(expected, actual)
+
+        with self.subTest("fill along an axis of a 3d array"):
+            x = np.arange(-2, 8, dtype=np.float64)
+            expected = np.broadcast_to(x[:, None, None] ** 2, (10, 3, 4)).copy()
+            expected *= rng.random((1, 3, 4))
+            array = expected.copy()
+            array[:2] = 0
+            array[-2:] = 0
+            fill_ghost_cells(array, 2, 3, axis=0)
+            np.testing.assert_allclose(expected, array)
+
+        with self.subTest("fill a list"):
+            expected = np.arange(-2, 8, dtype=np.float64) ** 2
+            actual = fill_ghost_cells(
+                [0.0, 0.0] + list(expected[2:-2]) + [0.0, 0.0], 2, 3
+            )
+            np.testing.assert_allclose(expected, actual)
+
+        with self.subTest("too few interior points"):
+            with self.assertRaises(ValueError):
+                fill_ghost_cells(np.zeros(6), 2, 3)
+
+        with self.subTest("axis out of range"):
+            with self.assertRaises(ValueError):
+                fill_ghost_cells(np.zeros((8, 8)), 2, 3, axis=2)
+
+    def test_to_cell_centers(self):
+        """
+        test suite for interplation.to_cell_centers.
+        """
+        rng = np.random.default_rng(0)
+
+        for acc in [2, 4, 6, 8]:
+            with self.subTest(f"reproduce polynomial by {acc}-order interpolation"):
+                p = rng.random(acc)
+                x = np.arange(12, dtype=np.float64)
+                expected = np.polyval(p, x[:-1] + 0.5)
+                actual = to_cell_centers(np.polyval(p, x), acc)
+                np.testing.assert_allclose(expected, actual)
+
+            with self.subTest(f"central weights of {acc}-order interpolation"):
+                stencil = [s + 0.5 for s in range(-acc // 2, acc // 2)]
+                weights = [float(c) for c in coefficients(stencil)]
+                array = rng.random(acc + 3)
+                expected = [np.dot(weights, array[k : k + acc]) for k in range(4)]
+                actual = to_cell_centers(array, acc)
+                np.testing.assert_allclose(
+                    expected, actual[acc // 2 - 1 : acc // 2 + 3]
+                )
+
+            with self.subTest(f"periodic {acc}-order interpolation"):
+                array = rng.random(10)
+                expected = to_cell_centers(np.tile(array, 3), acc)[10:20]
+                actual = to_cell_centers(array, acc, periodic=True)
+                np.testing.assert_allclose(expected, actual)
+
+        with self.subTest("interpolate along an axis into out"):
+            array = rng.random((3, 9, 2))
+            out = np.empty((3, 8, 2))
+            actual = to_cell_centers(array, 4, axis=1, out=out)
+            self.assertIs(out, actual)
+            for i in range(3):
+                for j in range(2):
+                    np.testing.assert_allclose(
+                        to_cell_centers(array[i, :, j], 4), actual[i, :, j]
+                    )
+
+        with self.subTest("invalid order of accuracy"):
+            with self.assertRaises(InvalidOrderOfAccuracyForCentralFormError):
+                to_cell_centers(np.zeros(10), 3)
+
+        with self.subTest("too few points"):
+            with self.assertRaises(ValueError):
+                to_cell_centers(np.zeros(3), 4)
+
+        with self.subTest("axis out of range"):
+            with self.assertRaises(ValueError):
+                to_cell_centers(np.zeros((8, 8)), 2, axis=-3)
+
+    def test_to_nodes(self):
+        """
+        test suite for interplation.to_nodes.
+        """
+        rng = np.random.default_rng(1)
+
+        for acc in [2, 4, 6, 8]:
+            with self.subTest(f"reproduce polynomial by {acc}-order interpolation"):
+                p = rng.random(acc)
+                x = np.arange(13, dtype=np.float64)
+                expected = np.polyval(p, x)
+                actual = to_nodes(np.polyval(p, x[:-1] + 0.5), acc)
+                np.testing.assert_allclose(expected, actual)
+
+            with self.subTest(f"periodic {acc}-order interpolation"):
+                array = rng.random(10)
+                expected = to_nodes(np.tile(array, 3), acc)[10:20]
+                actual = to_nodes(array, acc, periodic=True)
+                np.testing.assert_allclose(expected, actual)
+
+        with self.subTest("inconsistent out"):
+            with self.assertRaises(ValueError):
+                to_nodes(np.zeros(8), 2, out=np.zeros(8))
+
+    def test_hermite_coefficients(self):
+        """
+        test suite for interplation.hermite_coefficients.
+        """
+
+        for stencil in [[-1, 1], [-1.5, -0.5, 0.5, 1.5]]:
+            with self.subTest(f"function values only on {stencil}"):
+                expected = coefficients(stencil, as_numer_denom=True)
+                numer, denom = hermite_coefficients(
+                    stencil, [[0]] * len(stencil), as_numer_denom=True
+                )
+                self.assertEqual(expected, (list(numer.values()), denom))
+
+        with self.subTest("cubic Hermite interpolation at midpoint"):
+            expected = ({(-1, 0): 2, (-1, 1): 1, (1, 0): 2, (1, 1): -1}, 4)
+            actual = hermite_coefficients([-1, 1], as_numer_denom=True)
+            self.assertEqual(expected, actual)
+
+    def test_to_cell_centers_without_sympy(self):
+        """
+        test suite for interpolation of arrays without importing sympy.
+        """
+        import subprocess
+        import os
+
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from dictos.poly import interpolation as intp\n"
+            "a = np.linspace(0.0, 1.0, 9) ** 2\n"
+            "intp.to_nodes(intp.to_cell_centers(a, acc=4), acc=4)\n"
+            "intp.fill_ghost_cells(np.zeros(12), n_ghost=2, order=3)\n"
+            "assert 'sympy' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
 
 if __name__ == "__main__":
     unittest.main()
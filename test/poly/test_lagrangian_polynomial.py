@@ -12,6 +12,9 @@ from dictos.poly.lagrangian_polynomial import (
     lagrangian_basis,
     lagrangian_poly,
     derivative,
+    barycentric_weights,
+    basis_values,
+    fornberg_weights,
 )
 
 
@@ -278,6 +281,76 @@ class LagrangianPolynomialTest(unittest.TestCase):
 
                 self.assertEqual(expected[i], actual)
 
+    def test_barycentric_weights(self):
+        """
+        test suite for lagrangian_polynomial.barycentric_weights.
+        """
+        dx = sp.symbols("dx")
+
+        for x_set, expected in [
+            ([-1, 0, 1], [sp.Rational(1, 2), -1, sp.Rational(1, 2)]),
+            (
+                [0, 1, 2, 3],
+                [
+                    sp.Rational(-1, 6),
+                    sp.Rational(1, 2),
+                    sp.Rational(-1, 2),
+                    sp.Rational(1, 6),
+                ],
+            ),
+            ([-dx, 0, dx], [1 / (2 * dx**2), -1 / dx**2, 1 / (2 * dx**2)]),
+        ]:
+            with self.subTest(f"barycentric weights on {x_set}"):
+                actual = barycentric_weights(x_set)
+                self.assertEqual(expected, actual)
+
+    def test_basis_values(self):
+        """
+        test suite for lagrangian_polynomial.basis_values.
+        """
+        x = sp.symbols("x")
+
+        for x_set in [[-1, 1], [-2, -1, 1, 2], [-1.5, -0.5, 0.5, 1.5], [0, 1, 3]]:
+            for at in [0, sp.Rational(1, 3), 0.5]:
+                with self.subTest(f"basis on {x_set} at {at}"):
+                    degree = len(x_set) - 1
+                    expected = [
+                        sp.nsimplify(
+                            lagrangian_basis(
+                                x, degree, i, [sp.nsimplify(x_i) for x_i in x_set]
+                            ).subs(x, sp.nsimplify(at))
+                        )
+                        for i in range(len(x_set))
+                    ]
+                    actual = basis_values(x_set, at)
+                    self.assertEqual(expected, actual)
+
+        for i, at in enumerate([-1, 0, 2]):
+            with self.subTest(f"basis at the point {at}"):
+                expected = [1 if j == i else 0 for j in range(3)]
+                actual = basis_values([-1, 0, 2], at)
+                self.assertEqual(expected, actual)
+
+    def test_fornberg_weights(self):
+        """
+        test suite for lagrangian_polynomial.fornberg_weights.
+        """
+        x = sp.symbols("x")
+
+        for x_set in [[-1, 1], [-2, -1, 0, 1, 2], [0, 1, 3], [sp.Rational(-1, 2), 1]]:
+            for deriv in range(len(x_set) + 1):
+                for at in [0, sp.Rational(1, 3)]:
+                    with self.subTest(f"{deriv}-th derivative on {x_set} at {at}"):
+                        degree = len(x_set) - 1
+                        expected = [
+                            sp.diff(
+                                lagrangian_basis(x, degree, i, x_set), x, deriv
+                            ).subs(x, at)
+                            for i in range(len(x_set))
+                        ]
+                        actual = fornberg_weights(x_set, deriv, at)
+                        self.assertEqual(expected, actual)
+
     def test_derivative(self):
         """test suite for lagrangian.polynomial.derivative."""
         x = sp.symbols("x")
@@ -0,0 +1,153 @@
+"""Tests for distos.poly.multigrid
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import numpy as np
+
+from dictos.poly.multigrid import (
+    prolongation_weights,
+    restriction_weights,
+    prolong,
+    restrict,
+)
+from dictos.calculus.exceptions import InvalidOrderOfAccuracyForCentralFormError
+
+
+class MultigridTest(unittest.TestCase):
+    def test_prolongation_weights(self):
+        """
+        test suite for multigrid.prolongation_weights.
+        """
+
+        for acc, expected in [
+            (2, ([1, 1], 2)),
+            (4, ([-1, 9, 9, -1], 16)),
+            (6, ([3, -25, 150, 150, -25, 3], 256)),
+        ]:
+            with self.subTest(f"{acc}-order prolongation weights"):
+                actual = prolongation_weights(acc, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+
+        with self.subTest("invalid order of accuracy"):
+            with self.assertRaises(InvalidOrderOfAccuracyForCentralFormError):
+                prolongation_weights(3)
+
+    def test_restriction_weights(self):
+        """
+        test suite for multigrid.restriction_weights.
+        """
+
+        for acc, expected in [
+            (2, ([1, 2, 1], 4)),
+            (4, ([-1, 0, 9, 16, 9, 0, -1], 32)),
+        ]:
+            with self.subTest(f"{acc}-order restriction weights"):
+                actual = restriction_weights(acc, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+
+        for acc in [2, 4, 6, 8]:
+            with self.subTest(f"sum of {acc}-order restriction weights"):
+                self.assertEqual(1, sum(restriction_weights(acc)))
+
+    def test_prolong(self):
+        """
+        test suite for multigrid.prolong.
+        """
+        rng = np.random.default_rng(0)
+
+        for acc in [2, 4, 6]:
+            with self.subTest(f"reproduce polynomial by {acc}-order prolongation"):
+                p = rng.random(acc)
+                x = np.arange(9, dtype=np.float64)
+                expected = np.polyval(p, np.arange(17) / 2)
+                actual = prolong(np.polyval(p, x), acc)
+                np.testing.assert_allclose(expected, actual)
+
+            with self.subTest(f"separable {acc}-order prolongation in 3d"):
+                a, b, c = rng.random(acc), rng.random(acc), rng.random(acc)
+                x = np.arange(8, dtype=np.float64)
+                coarse = np.einsum(
+                    "i,j,k->ijk", np.polyval(a, x), np.polyval(b, x), np.polyval(c, x)
+                )
+                xf = np.arange(15) / 2
+                expected = np.einsum(
+                    "i,j,k->ijk",
+                    np.polyval(a, xf),
+                    np.polyval(b, xf),
+                    np.polyval(c, xf),
+                )
+                actual = prolong(coarse, acc)
+                np.testing.assert_allclose(expected, actual)
+
+            with self.subTest(f"periodic {acc}-order prolongation"):
+                coarse = rng.random((6, 8))
+                actual = prolong(coarse, acc, axis=1, periodic=True)
+                self.assertEqual((6, 16), actual.shape)
+                np.testing.assert_allclose(coarse, actual[:, 0::2])
+
+    def test_restrict(self):
+        """
+        test suite for multigrid.restrict.
+        """
+        rng = np.random.default_rng(1)
+
+        for acc in [2, 4, 6]:
+            with self.subTest(f"transpose of periodic {acc}-order prolongation"):
+                n = 8
+                p = np.stack([prolong(e, acc, periodic=True) for e in np.eye(n)], 1)
+                r = np.stack(
+                    [restrict(e, acc, periodic=True) for e in np.eye(2 * n)], 1
+                )
+                np.testing.assert_allclose(p.T / 2, r, atol=1e-15)
+
+            with self.subTest(f"interior weights of {acc}-order restriction"):
+                weights = [float(w) for w in restriction_weights(acc)]
+                fine = rng.random(33)
+                actual = restrict(fine, acc)
+                for i in range(acc // 2, 17 - acc // 2):
+                    expected = np.dot(weights, fine[2 * i - acc + 1 : 2 * i + acc])
+                    self.assertAlmostEqual(expected, actual[i])
+
+            with self.subTest(f"restriction of {acc}-order in 2d"):
+                fine = rng.random((17, 9))
+                expected = restrict(restrict(fine, acc, axis=0), acc, axis=1)
+                actual = restrict(fine, acc)
+                self.assertEqual((9, 5), actual.shape)
+                np.testing.assert_allclose(expected, actual)
+                self.assertEqual(fine[0, 0], actual[0, 0])
+                self.assertEqual(fine[-1, -1], actual[-1, -1])
+
+        with self.subTest("inconsistent number of points"):
+            with self.assertRaises(ValueError):
+                restrict(np.zeros(8), 2)
+            with self.assertRaises(ValueError):
+                restrict(np.zeros(9), 2, periodic=True)
+
+    def test_prolong_restrict_without_sympy(self):
+        """
+        test suite for multigrid.prolong and multigrid.restrict without importing sympy.
+        """
+        import subprocess
+        import os
+
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from dictos.poly import multigrid as mg\n"
+            "a = np.linspace(0.0, 1.0, 9) ** 2\n"
+            "mg.restrict(mg.prolong(a, acc=4), acc=4)\n"
+            "assert 'sympy' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Tests for distos.poly.weights
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+from fractions import Fraction
+
+from dictos.poly.weights import lagrange_weights
+from dictos.poly.interpolation import extrapolation_coefficients
+
+
+class WeightsTest(unittest.TestCase):
+    def test_lagrange_weights(self):
+        """
+        test suite for weights.lagrange_weights.
+        """
+        with self.subTest("interpolation at the midpoint"):
+            stencil = tuple(Fraction(s, 2) for s in [-3, -1, 1, 3])
+            expected = tuple(Fraction(c, 16) for c in [-1, 9, 9, -1])
+            self.assertEqual(expected, lagrange_weights(stencil, Fraction(0)))
+
+        with self.subTest("extrapolation to a ghost cell"):
+            stencil = tuple(Fraction(s) for s in [1, 2, 3, 4])
+            expected = tuple(
+                Fraction(int(c)) for c in extrapolation_coefficients([1, 2, 3, 4], -1)
+            )
+            self.assertEqual(expected, lagrange_weights(stencil, Fraction(-1)))
+
+        with self.subTest("target on a point of the stencil"):
+            stencil = (Fraction(0), Fraction(1), Fraction(3))
+            self.assertEqual((0, 1, 0), lagrange_weights(stencil, Fraction(1)))
+
+        for n in [2, 3, 5, 8]:
+            with self.subTest(f"polynomials of degree < {n} are reproduced"):
+                stencil = tuple(Fraction(s, 3) for s in range(-n, 2 * n, 3))
+                target = Fraction(7, 5)
+                weights = lagrange_weights(stencil, target)
+                for m in range(n):
+                    self.assertEqual(
+                        target**m, sum(w * s**m for w, s in zip(weights, stencil))
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for distos.reconstruction.exceptions
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+
+from dictos.reconstruction.reconstruction import coefficients, table
+from dictos.reconstruction.exceptions import (
+    OrderOfReconstructionIsNotNaturalNumberError,
+    UnsupportedOrderOfDerivativeError,
+    UnsupportedOrderOfWENOError,
+    UnsupportedWENOVariantError,
+)
+from dictos.discrete.exceptions import DuplicatedPointError
+
+
+class ErrorReconstructionTest(unittest.TestCase):
+    @unittest.expectedFailure
+    def test_error_reconstruction_OrderOfReconstructionIsNotNaturalNumberError(self):
+        """
+        test suite for
+        reconstruction.exceptions.OrderOfReconstructionIsNotNaturalNumberError.
+        """
+
+        for order in [1, 0]:
+            with self.subTest(order):
+                if order <= 0:
+                    raise OrderOfReconstructionIsNotNaturalNumberError(order)
+
+    @unittest.expectedFailure
+    def test_error_reconstruction_UnsupportedOrderOfDerivativeError(self):
+        """
+        test suite for reconstruction.exceptions.UnsupportedOrderOfDerivativeError.
+        """
+
+        for deriv in [0, -1]:
+            with self.subTest(deriv):
+                if deriv < 0:
+                    raise UnsupportedOrderOfDerivativeError(deriv)
+
+    @unittest.expectedFailure
+    def test_error_reconstruction_UnsupportedOrderOfWENOError(self):
+        """
+        test suite for reconstruction.exceptions.UnsupportedOrderOfWENOError.
+        """
+
+        for order in [5, 4]:
+            with self.subTest(order):
+                if order % 2 == 0:
+                    raise UnsupportedOrderOfWENOError(order)
+
+    @unittest.expectedFailure
+    def test_error_reconstruction_UnsupportedWENOVariantError(self):
+        """
+        test suite for reconstruction.exceptions.UnsupportedWENOVariantError.
+        """
+
+        for variant in ["js", "m"]:
+            with self.subTest(variant):
+                if variant not in ("js", "z"):
+                    raise UnsupportedWENOVariantError(variant)
+
+    def test_error_reconstruction(self):
+        """
+        test suite for reconstruction exceptions.
+        """
+
+        with self.subTest("coefficients with duplicated cells"):
+            with self.assertRaises(DuplicatedPointError):
+                coefficients([-1, 0, 0], 0.5)
+
+        with self.subTest("coefficients with negative order of derivative"):
+            with self.assertRaises(UnsupportedOrderOfDerivativeError):
+                coefficients([-1, 0, 1], 0.5, deriv=-1)
+
+        for order in [0, -1, 1.5]:
+            with self.subTest(f"table with order {order}"):
+                with self.assertRaises(OrderOfReconstructionIsNotNaturalNumberError):
+                    table(order)
+
+
+if __name__ == "__main__":
+    unittest.main()
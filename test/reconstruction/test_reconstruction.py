@@ -0,0 +1,92 @@
+"""Tests for distos.reconstruction.reconstruction
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+
+from dictos.reconstruction.reconstruction import coefficients, table
+
+
+class ReconstructionTest(unittest.TestCase):
+    def test_coefficients(self):
+        """
+        test suite for reconstruction.coefficients.
+        """
+
+        for cell_stencil, at_face, expected in [
+            ([0], 0.5, ([1], 1)),
+            ([-1, 0], 0.5, ([-1, 3], 2)),
+            ([0, 1], 0.5, ([1, 1], 2)),
+            ([-2, -1, 0], 0.5, ([2, -7, 11], 6)),
+            ([-1, 0, 1], 0.5, ([-1, 5, 2], 6)),
+            ([0, 1, 2], 0.5, ([2, 5, -1], 6)),
+            ([-2, -1, 0, 1, 2], 0.5, ([2, -13, 47, 27, -3], 60)),
+            ([-1, 0, 1], 0, ([-1, 26, -1], 24)),
+        ]:
+            with self.subTest(f"reconstruction on {cell_stencil} at {at_face}"):
+                actual = coefficients(cell_stencil, at_face, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+
+        for cell_stencil, at_face, deriv, expected in [
+            ([0, 1], 0.5, 1, ([-1, 1], 1)),
+            ([-1, 0, 1, 2], 0.5, 1, ([1, -15, 15, -1], 12)),
+            ([-1, 0, 1], 0, 2, ([1, -2, 1], 1)),
+        ]:
+            with self.subTest(
+                f"reconstruction of {deriv}-th derivative on {cell_stencil}"
+            ):
+                actual = coefficients(cell_stencil, at_face, deriv, as_numer_denom=True)
+                self.assertEqual(expected, actual)
+
+        x = sp.symbols("x")
+        for cell_stencil, at_face in [([-3, -1, 0, 2], 0.5), ([1, 2, 3], -0.25)]:
+            with self.subTest(f"exact for polynomials on {cell_stencil}"):
+                coef = coefficients(cell_stencil, at_face)
+                for m in range(len(cell_stencil)):
+                    expected = sp.nsimplify(at_face) ** m
+                    actual = sum(
+                        c
+                        * sp.integrate(
+                            x**m, (x, j - sp.Rational(1, 2), j + sp.Rational(1, 2))
+                        )
+                        for c, j in zip(coef, sorted(cell_stencil))
+                    )
+                    self.assertEqual(expected, actual)
+
+    def test_table(self):
+        """
+        test suite for reconstruction.table.
+        """
+
+        for order in [1, 2, 3, 4, 5, 6]:
+            for at_face in [0.5, -0.5]:
+                with self.subTest(f"table of order {order} at {at_face}"):
+                    expected = [
+                        coefficients(list(range(k - order + 1, k + 1)), at_face)
+                        for k in range(order)
+                    ]
+                    actual = table(order, at_face)
+                    self.assertEqual(expected, actual)
+
+        with self.subTest("left face is the mirror of right face"):
+            right = table(5, 0.5)
+            left = table(5, -0.5)
+            self.assertEqual([c[::-1] for c in right[::-1]], left)
+
+    def test_package(self):
+        """
+        test suite for functions exported from dictos.reconstruction.
+        """
+        import dictos
+        import dictos.reconstruction
+
+        self.assertIs(dictos.reconstruction.coefficients, coefficients)
+        self.assertIs(dictos.reconstruction.table, table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""Tests for distos.reconstruction.weno
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+import numpy as np
+
+from dictos.reconstruction.weno import (
+    _float_tables,
+    linear_weights,
+    smoothness_indicators,
+    reconstruct,
+)
+from dictos.reconstruction.reconstruction import table
+from dictos.reconstruction.exceptions import (
+    UnsupportedOrderOfWENOError,
+    UnsupportedWENOVariantError,
+)
+
+
+class WENOTest(unittest.TestCase):
+    def test_linear_weights(self):
+        """
+        test suite for weno.linear_weights.
+        """
+
+        for order, expected in [
+            (3, [sp.Rational(1, 3), sp.Rational(2, 3)]),
+            (5, [sp.Rational(1, 10), sp.Rational(3, 5), sp.Rational(3, 10)]),
+            (
+                7,
+                [
+                    sp.Rational(1, 35),
+                    sp.Rational(12, 35),
+                    sp.Rational(18, 35),
+                    sp.Rational(4, 35),
+                ],
+            ),
+        ]:
+            with self.subTest(f"linear weights of order {order}"):
+                actual = linear_weights(order)
+                self.assertEqual(expected, actual)
+
+        for order in [3, 5, 7, 9, 11]:
+            with self.subTest(f"reproduce {order}-order reconstruction"):
+                r = (order + 1) // 2
+                expected = table(order)[r - 1]
+                actual = [0] * order
+                for k, (d, coef) in enumerate(zip(linear_weights(order), table(r))):
+                    for j, c in enumerate(coef):
+                        actual[k + j] += d * c
+                self.assertEqual(expected, actual)
+
+    def test_smoothness_indicators(self):
+        """
+        test suite for weno.smoothness_indicators.
+        """
+        f = sp.symbols("f_{-2} f_{-1} f_{0} f_{1} f_{2}")
+
+        with self.subTest("smoothness indicators of order 3"):
+            expected = [(f[1] - f[2]) ** 2, (f[2] - f[3]) ** 2]
+            actual = smoothness_indicators(3)
+            self.assertEqual(expected, actual)
+
+        with self.subTest("smoothness indicators of order 5"):
+            expected = [
+                sp.Rational(13, 12) * (f[0] - 2 * f[1] + f[2]) ** 2
+                + sp.Rational(1, 4) * (f[0] - 4 * f[1] + 3 * f[2]) ** 2,
+                sp.Rational(13, 12) * (f[1] - 2 * f[2] + f[3]) ** 2
+                + sp.Rational(1, 4) * (f[1] - f[3]) ** 2,
+                sp.Rational(13, 12) * (f[2] - 2 * f[3] + f[4]) ** 2
+                + sp.Rational(1, 4) * (3 * f[2] - 4 * f[3] + f[4]) ** 2,
+            ]
+            actual = smoothness_indicators(5)
+            for e, a in zip(expected, actual):
+                self.assertEqual(0, sp.expand(e - a))
+
+    def test_reconstruct(self):
+        """
+        test suite for weno.reconstruct.
+        """
+
+        def cell_averages(n):
+            x = np.linspace(0, 1, n + 1)
+            h = 1 / n
+            return x, (np.cos(2 * np.pi * x[:-1]) - np.cos(2 * np.pi * x[1:])) / (
+                2 * np.pi * h
+            )
+
+        for order in [3, 5, 7, 9, 11]:
+            r = (order + 1) // 2
+            for variant in ["js", "z"]:
+                with self.subTest(f"convergence of {order}-order WENO-{variant}"):
+                    error = []
+                    for n in [20, 40]:
+                        x, averages = cell_averages(n)
+                        actual = reconstruct(
+                            averages, order, variant=variant, eps=1e-40
+                        )
+                        expected = np.sin(2 * np.pi * x[r : n - r + 2])
+                        error.append(np.abs(expected - actual).max())
+                    expected_order = 2 if order == 3 else order
+                    # 3rd-order WENO degenerates to 2nd order at critical points.
+                    self.assertGreater(
+                        np.log2(error[0] / error[1]), expected_order - 0.8
+                    )
+
+            with self.subTest(f"left face of {order}-order WENO"):
+                x, averages = cell_averages(40)
+                actual = reconstruct(averages, order, face="left", eps=1e-40)
+                expected = np.sin(2 * np.pi * x[r - 1 : 40 - r + 1])
+                np.testing.assert_allclose(expected, actual, atol=1e-2)
+                np.testing.assert_allclose(
+                    reconstruct(averages[::-1], order, eps=1e-40)[::-1], actual
+                )
+
+        with self.subTest("non-oscillatory near a discontinuity"):
+            step = np.where(np.arange(40) < 20, 1.0, 0.0)
+            for order in [3, 5, 7, 9, 11]:
+                for variant in ["js", "z"]:
+                    actual = reconstruct(step, order, variant=variant)
+                    self.assertLess(actual.max(), 1 + 1e-3)
+                    self.assertGreater(actual.min(), -1e-3)
+
+        with self.subTest("reconstruct along an axis"):
+            rng = np.random.default_rng(0)
+            array = rng.random((3, 12, 4))
+            actual = reconstruct(array, 5, axis=1, variant="z")
+            self.assertEqual((3, 8, 4), actual.shape)
+            np.testing.assert_allclose(
+                reconstruct(array[2, :, 1], 5, variant="z"), actual[2, :, 1]
+            )
+
+    def test_reconstruct_without_sympy(self):
+        """
+        test suite for weno.reconstruct without importing sympy.
+        """
+        import subprocess
+        import os
+
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "import dictos\n"
+            "from dictos.reconstruction import weno\n"
+            "weno.reconstruct(np.linspace(0.0, 1.0, 16), order=11)\n"
+            "assert 'sympy' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
+        for order in [3, 5, 7, 9, 11]:
+            with self.subTest(f"candidates of order {order}"):
+                r = (order + 1) // 2
+                candidates = _float_tables(order)[0]
+                for k, coef in enumerate(table(r)):
+                    expected = [float(c) for c in coef]
+                    self.assertEqual(expected, list(candidates[k, k : k + r]))
+
+    def test_exceptions(self):
+        """
+        test suite for exceptions raised in weno module.
+        """
+
+        for order in [1, 2, 4, 13]:
+            with self.subTest(f"unsupported order {order}"):
+                with self.assertRaises(UnsupportedOrderOfWENOError):
+                    linear_weights(order)
+
+        with self.subTest("unsupported variant"):
+            with self.assertRaises(UnsupportedWENOVariantError):
+                reconstruct(np.zeros(10), 5, variant="m")
+
+        with self.subTest("too few cells"):
+            with self.assertRaises(ValueError):
+                reconstruct(np.zeros(4), 5)
+
+        with self.subTest("axis out of range"):
+            with self.assertRaises(ValueError):
+                reconstruct(np.zeros((10, 10)), 5, axis=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
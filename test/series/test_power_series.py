@@ -0,0 +1,107 @@
+"""Tests for distos.series.power_series
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import sympy as sp
+from fractions import Fraction
+
+from dictos.series.power_series import PowerSeries, to_fraction, to_rational
+from dictos.series.taylor_expansion import taylor_series
+from dictos.series.exceptions import NumberOfExpansionTermsIsNotNaturalNumberError
+from dictos.linalg.exceptions import InconsistentDataSetError
+
+
+class PowerSeriesTest(unittest.TestCase):
+    def test_taylor(self):
+        """
+        test suite for PowerSeries.taylor.
+        """
+
+        h = sp.symbols("h")
+        for around in [-2, -1, 0, 1, 2, sp.Rational(1, 2), 1.5, Fraction(-3, 2)]:
+            for up_to in range(0, 8):
+                with self.subTest(f"taylor series around {around} up to {up_to}"):
+                    expected = taylor_series(
+                        to_rational(to_fraction(around)) * h, up_to
+                    )
+                    actual = PowerSeries.taylor(around, up_to).to_expr()
+                    self.assertEqual(0, sp.simplify(expected - actual))
+
+        with self.subTest("negative number of terms"):
+            with self.assertRaises(NumberOfExpansionTermsIsNotNaturalNumberError):
+                PowerSeries.taylor(1, -2)
+
+    def test_dot(self):
+        """
+        test suite for PowerSeries.dot.
+        """
+
+        with self.subTest("weighted sum of Taylor series"):
+            series = [PowerSeries.taylor(s, 4) for s in [-1, 0, 1]]
+            expected = PowerSeries([0, 0, 1, 0, Fraction(1, 12)])
+            actual = PowerSeries.dot([1, -2, 1], series)
+            self.assertEqual(expected, actual)
+
+        with self.subTest("inconsistent data set"):
+            with self.assertRaises(InconsistentDataSetError):
+                PowerSeries.dot([1, 2], [PowerSeries.taylor(0, 1)])
+
+    def test_arithmetic(self):
+        """
+        test suite for addition, subtraction and scaling of PowerSeries.
+        """
+
+        a = PowerSeries([1, 2, 3])
+        b = PowerSeries([Fraction(1, 2), sp.Rational(1, 3)])
+
+        with self.subTest("add"):
+            self.assertEqual(PowerSeries([Fraction(3, 2), Fraction(7, 3), 3]), a + b)
+
+        with self.subTest("sub"):
+            self.assertEqual(PowerSeries([Fraction(1, 2), Fraction(5, 3), 3]), a - b)
+
+        with self.subTest("scale"):
+            self.assertEqual(PowerSeries([2, 4, 6]), 2 * a)
+            self.assertEqual(PowerSeries([Fraction(1, 2), 1, Fraction(3, 2)]), a * 0.5)
+
+    def test_leading_term(self):
+        """
+        test suite for PowerSeries.leading_term.
+        """
+
+        with self.subTest("non-zero leading term"):
+            self.assertEqual(
+                (3, Fraction(-1, 6)),
+                PowerSeries([0, 0, 0, Fraction(-1, 6), 1]).leading_term(),
+            )
+
+        with self.subTest("all zero"):
+            self.assertEqual((None, Fraction(0)), PowerSeries([0, 0]).leading_term())
+
+    def test_to_fraction(self):
+        """
+        test suite for power_series.to_fraction and to_rational.
+        """
+
+        for number, expected in [
+            (3, Fraction(3)),
+            (0.1, Fraction(1, 10)),
+            (-1.5, Fraction(-3, 2)),
+            (sp.Rational(2, 3), Fraction(2, 3)),
+            (Fraction(5, 7), Fraction(5, 7)),
+        ]:
+            with self.subTest(number):
+                actual = to_fraction(number)
+                self.assertEqual(expected, actual)
+                self.assertEqual(
+                    sp.Rational(expected.numerator, expected.denominator),
+                    to_rational(actual),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
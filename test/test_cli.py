@@ -0,0 +1,244 @@
+"""Tests for distos.cli
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import io
+import os
+import json
+import argparse
+import tempfile
+import unittest
+import contextlib
+import numpy as np
+
+from dictos.cli import main, _parse_range, _parse_choices, GRIDS
+
+
+class CliTest(unittest.TestCase):
+    def run_table(self, *args) -> str:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status = main(["table", *args])
+        self.assertEqual(status, 0)
+        return stdout.getvalue()
+
+    def test_parse_range(self):
+        """
+        test suite for cli._parse_range.
+        """
+        expected = {
+            "3": [3],
+            "1:6": [1, 2, 3, 4, 5, 6],
+            "2:12:2": [2, 4, 6, 8, 10, 12],
+            "1:3,6,2": [1, 2, 3, 6],
+        }
+        for arg, values in expected.items():
+            with self.subTest(arg):
+                self.assertEqual(_parse_range(arg), values)
+
+        for arg in ["", "a", "1:2:0", "1:2:3:4"]:
+            with self.subTest(arg):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    _parse_range(arg)
+
+    def test_parse_choices(self):
+        """
+        test suite for cli._parse_choices.
+        """
+        with self.subTest("all"):
+            self.assertEqual(_parse_choices("all", GRIDS), list(GRIDS))
+
+        with self.subTest("list"):
+            self.assertEqual(
+                _parse_choices("staggered,regular", GRIDS), ["staggered", "regular"]
+            )
+
+        with self.subTest("invalid"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                _parse_choices("regular,hexagonal", GRIDS)
+
+    def test_table_json(self):
+        """
+        test suite for table command in json.
+        """
+        rows = json.loads(
+            self.run_table("--deriv", "1:2", "--acc", "2:4", "--grid", "all")
+        )
+
+        with self.subTest("number of rows"):
+            self.assertEqual(len(rows), 2 * 2 * 3)
+
+        with self.subTest("row"):
+            self.assertEqual(
+                rows[0],
+                {
+                    "kind": "fd",
+                    "grid": "regular",
+                    "deriv": 1,
+                    "acc": 2,
+                    "stencil": [-1, 0, 1],
+                    "numerators": [-1, 0, 1],
+                    "denominator": 2,
+                },
+            )
+
+        with self.subTest("cell-centered"):
+            row = rows[7]
+            self.assertEqual(row["grid"], "cell-centered")
+            self.assertEqual(row["stencil"], [-1.5, -0.5, 0.5, 1.5])
+            self.assertEqual(row["numerators"], [1, -27, 27, -1])
+            self.assertEqual(row["denominator"], 24)
+
+    def test_table_kinds(self):
+        """
+        test suite for table command of filter and interpolation in csv.
+        """
+        lines = self.run_table(
+            "--kind", "filter,interpolation", "--acc", "1:4", "--format", "csv"
+        ).splitlines()
+
+        self.assertEqual(
+            lines,
+            [
+                "kind,grid,deriv,acc,stencil,numerators,denominator",
+                "filter,regular,0,2,-1 0 1,1 2 1,4",
+                "filter,regular,0,4,-2 -1 0 1 2,-1 4 10 4 -1,16",
+                "interpolation,cell-centered,0,2,-0.5 0.5,1 1,2",
+                "interpolation,cell-centered,0,4,-1.5 -0.5 0.5 1.5,-1 9 9 -1,16",
+            ],
+        )
+
+    def test_table_fortran(self):
+        """
+        test suite for table command in fortran.
+        """
+        source = self.run_table("--deriv", "1", "--acc", "2,12", "--format", "fortran")
+
+        with self.subTest("module"):
+            self.assertIn("module dictos_coefficients", source)
+            self.assertIn(
+                "integer(int64), parameter, public :: "
+                + "fd_regular_d1_a2_numerators(3) = [-1_int64, 0_int64, 1_int64]",
+                source,
+            )
+            self.assertIn("fd_regular_d1_a2_denominator = 2_int64", source)
+
+        with self.subTest("line length"):
+            self.assertTrue(all(len(line) <= 132 for line in source.splitlines()))
+
+    def test_table_files(self):
+        """
+        test suite for table command writing files with worker processes.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            serial = os.path.join(tmpdir, "serial.json")
+            parallel = os.path.join(tmpdir, "parallel.json")
+            archive = os.path.join(tmpdir, "table.npz")
+
+            args = ["--deriv", "1:3", "--acc", "2:6", "--grid", "all"]
+            self.run_table(*args, "-o", serial)
+            self.run_table(*args, "-o", parallel, "-j", "2")
+            self.run_table(*args, "--format", "npz", "-o", archive, "-j", "2")
+
+            with self.subTest("parallel"):
+                with open(serial) as f, open(parallel) as g:
+                    self.assertEqual(f.read(), g.read())
+
+            with self.subTest("npz"):
+                with np.load(archive) as table:
+                    self.assertEqual(len(table.files), 3 * 3 * 3 * 3)
+                    np.testing.assert_array_equal(
+                        table["fd_staggered_d1_a4_stencil"], [-1.5, -0.5, 0.5, 1.5]
+                    )
+                    np.testing.assert_array_equal(
+                        table["fd_staggered_d1_a4_numerators"], [1, -27, 27, -1]
+                    )
+                    self.assertEqual(table["fd_staggered_d1_a4_denominator"], 24)
+
+    def test_table_overflow(self):
+        """
+        test suite for table command with coefficients exceeding int64.
+        """
+        args = ["--kind", "interpolation", "--acc", "40"]
+
+        with self.subTest("npz"):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                archive = os.path.join(tmpdir, "table.npz")
+                self.run_table(*args, "--format", "npz", "-o", archive)
+                with np.load(archive, allow_pickle=True) as table:
+                    numerators = table["interpolation_cell_centered_d0_a40_numerators"]
+                    denominator = table[
+                        "interpolation_cell_centered_d0_a40_denominator"
+                    ]
+                    self.assertGreaterEqual(denominator, 2**63)
+                    self.assertEqual(sum(numerators), denominator)
+
+        with self.subTest("fortran"):
+            with contextlib.redirect_stdout(io.StringIO()):
+                with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                    with self.assertRaises(SystemExit):
+                        main(["table", *args, "--format", "fortran"])
+            self.assertIn("exceed the range of int64", stderr.getvalue())
+
+        with self.subTest("fortran file"):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                source = os.path.join(tmpdir, "table.f90")
+                with open(source, "w") as f:
+                    f.write("! previous table\n")
+                with contextlib.redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit):
+                        main(
+                            ["table", "--kind", "interpolation", "--acc", "2,40"]
+                            + ["--format", "fortran", "-o", source]
+                        )
+                with open(source) as f:
+                    self.assertEqual("! previous table\n", f.read())
+                self.assertEqual(["table.f90"], os.listdir(tmpdir))
+                # the previous table is kept and no partial file is left.
+
+    def test_table_broken_pipe(self):
+        """
+        test suite for table command writing to a closed pipe.
+        """
+        import subprocess
+
+        read, write = os.pipe()
+        os.close(read)
+        # the reader exits before the table is written.
+
+        root = os.path.dirname(os.path.dirname(__file__))
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "dictos", "table", "--acc", "2:8"]
+                + ["--format", "csv"],
+                cwd=root,
+                stdout=write,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        finally:
+            os.close(write)
+        self.assertEqual(1, result.returncode)
+        self.assertEqual("", result.stderr)
+
+    def test_table_error(self):
+        """
+        test suite for errors of table command.
+        """
+        for args in [
+            ["--format", "npz"],
+            ["--deriv", "0"],
+            ["-j", "0"],
+            ["--kind", "spline"],
+        ]:
+            with self.subTest(args):
+                with contextlib.redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit):
+                        main(["table", *args])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Tests for distos.utilities.array
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import numpy as np
+
+from dictos.utilities.array import normalize_axes
+
+
+class ArrayTest(unittest.TestCase):
+    def test_normalize_axes(self):
+        """
+        test suite for array.normalize_axes.
+        """
+        for axis, ndim, expected in [
+            (0, 1, (0,)),
+            (-1, 3, (2,)),
+            (np.int64(1), 2, (1,)),
+            ((0, -1), 3, (0, 2)),
+            ([2, 0], 3, (2, 0)),
+            (None, 3, (0, 1, 2)),
+        ]:
+            with self.subTest(f"axis {axis} of {ndim}-d array"):
+                self.assertEqual(expected, normalize_axes(axis, ndim))
+
+        for axis, ndim in [(1, 1), (-2, 1), ((0, 3), 3)]:
+            with self.subTest(f"axis {axis} out of range of {ndim}-d array"):
+                with self.assertRaises(ValueError):
+                    normalize_axes(axis, ndim)
+
+
+if __name__ == "__main__":
+    unittest.main()
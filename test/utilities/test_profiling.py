@@ -0,0 +1,150 @@
+"""Tests for distos.utilities.profiling
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import json
+import os
+import tempfile
+
+import dictos
+from dictos.utilities.profiling import Profile, profile, profiled
+from dictos.calculus import finite_difference as fd
+from dictos.poly import interpolation as intp
+from dictos.filter import filter as flt
+from dictos.series.taylor_expansion import taylor_series
+
+
+class ProfilingTest(unittest.TestCase):
+    def test_profile(self):
+        """
+        test suite for profiling.profile.
+        """
+        self.assertIs(dictos.profile, profile)
+
+        with profile() as prof:
+            fd.coefficients([-0.3, -0.1, 0.1, 0.3], deriv=1)
+            fd.coefficients([-2, -1, 0, 1, 2], deriv=2)
+            intp.coefficients([-0.3, -0.1, 0.1, 0.3])
+            flt.generate(4)
+            taylor_series(1, 3)
+        stats = prof.as_dict()
+
+        with self.subTest("stages"):
+            for stage in [
+                "create_coordinate_symbols",
+                "lagrangian_poly",
+                "extract_coefficients_as_numer_denom",
+                "derivative",
+                "simplify_coefficients",
+                "fornberg_weights",
+                "finite_difference.coefficients",
+                "interpolation.coefficients",
+                "filter.generate",
+                "taylor_series",
+            ]:
+                self.assertIn(stage, stats)
+
+        with self.subTest("calls and stencil sizes"):
+            stage = stats["finite_difference.coefficients"]
+            self.assertGreaterEqual(stage["calls"], 2)
+            self.assertEqual(stage["sizes"].get(4), 1)
+            self.assertGreaterEqual(stage["total"], stage["max"])
+            self.assertAlmostEqual(stage["mean"], stage["total"] / stage["calls"])
+
+        with self.subTest("not recorded outside the context"):
+            num_events = len(prof.events)
+            fd.coefficients([-1, 0, 1])
+            self.assertEqual(num_events, len(prof.events))
+
+    def test_profile_nested(self):
+        """
+        test suite for nested profiling.profile.
+        """
+        with profile() as outer:
+            fd.coefficients([-1, 0, 1])
+            with profile() as inner:
+                fd.coefficients([-2, -1, 0, 1, 2])
+
+        self.assertEqual(2, outer.as_dict()["finite_difference.coefficients"]["calls"])
+        self.assertEqual(1, inner.as_dict()["finite_difference.coefficients"]["calls"])
+
+    def test_profile_threads(self):
+        """
+        test suite for profiling.profile with other threads.
+        """
+        import threading
+
+        opened = threading.Event()
+        done = threading.Event()
+
+        def worker():
+            opened.wait()
+            for _ in range(100):
+                fd.coefficients([-1, 0, 1])
+            done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        with profile() as prof:
+            opened.set()
+            fd.coefficients([-2, -1, 0, 1, 2])
+            done.wait()
+            # the worker calls the stage while the profile is active.
+        thread.join()
+
+        self.assertEqual(1, prof.as_dict()["finite_difference.coefficients"]["calls"])
+
+        with self.subTest("profile opened in another thread"):
+            results = []
+
+            def profiled_worker():
+                with profile() as prof:
+                    fd.coefficients([-1, 0, 1])
+                results.append(prof)
+
+            thread = threading.Thread(target=profiled_worker)
+            thread.start()
+            thread.join()
+
+            stats = results[0].as_dict()["finite_difference.coefficients"]
+            self.assertEqual({3: 1}, stats["sizes"])
+
+    def test_chrome_trace(self):
+        """
+        test suite for Profile.to_chrome_trace and Profile.save_chrome_trace.
+        """
+
+        @profiled("stage", "stencil")
+        def stage(stencil):
+            return len(stencil)
+
+        with profile() as prof:
+            stage([-1, 0, 1])
+            stage(stencil=[0, 1])
+
+        trace = prof.to_chrome_trace()
+        with self.subTest("events"):
+            self.assertEqual(2, len(trace["traceEvents"]))
+            for event, size in zip(trace["traceEvents"], [3, 2]):
+                self.assertEqual("stage", event["name"])
+                self.assertEqual("X", event["ph"])
+                self.assertGreaterEqual(event["dur"], 0)
+                self.assertEqual({"stencil_size": size}, event["args"])
+
+        with self.subTest("save"):
+            with tempfile.TemporaryDirectory() as dir:
+                path = os.path.join(dir, "trace.json")
+                prof.save_chrome_trace(path)
+                with open(path) as f:
+                    self.assertEqual(trace, json.load(f))
+
+        with self.subTest("empty profile"):
+            self.assertEqual({}, Profile().as_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -158,6 +158,26 @@ class UtilsTest(unittest.TestCase):
 
                 self.assertEqual(expected, actual)
 
+    def test_simplify_coefficients_exact(self):
+        """test suite for utils.simplify_coefficients with exact numbers.
+        it returns the same values when int, Fraction and sympy Rational are passed.
+        """
+        from fractions import Fraction
+
+        for coef in [
+            [1, -2, 1],
+            [Fraction(1, 12), Fraction(-2, 3), 0, Fraction(2, 3), Fraction(-1, 12)],
+            [sp.Rational(1, 12), sp.Rational(-2, 3), 0, sp.Rational(2, 3), sp.Rational(-1, 12)],
+        ]:
+            with self.subTest(coef):
+                expected = [sp.Rational(c) for c in coef]
+                actual = simplify_coefficients(coef)
+                self.assertEqual(expected, actual)
+
+                numer, denom = simplify_coefficients(coef, as_numer_denom=True)
+                self.assertEqual([n / denom for n in numer], expected)
+                self.assertEqual(denom, max(sp.Rational(c).q for c in coef))
+
     def test_extract_coefficients_as_numer_denom(self):
         """test suite for utils.extract_coefficients_as_numer_denom."""
 
@@ -259,6 +279,42 @@ class UtilsTest(unittest.TestCase):
                 ex_str = str(expected)
                 self.assertEqual(ex_str, ac_str)
 
+    def test_utils_sort_by_subscript_exact(self):
+        """test suite for utils.sort_by_subscript with offsets carried by symbols."""
+        from unittest import mock
+        from dictos.discrete.stencil import (
+            create_coordinate_symbols,
+            create_differentiand_symbols,
+        )
+
+        for stencil in [
+            [-0.25, -0.2, 0.2, 0.25],
+            list(range(-60, 61, 10)),
+            [-120, -1, 0, 1, 120],
+        ]:
+            with self.subTest(f"sort terms on stencil {stencil}"):
+                f_set = create_differentiand_symbols(create_coordinate_symbols(stencil))
+                expected = sp.Add(*[2 * f for f in f_set], evaluate=False)
+
+                eq = dot_product([2 for _ in f_set], f_set[::-1], evaluate=False)
+                actual = sort_by_subscript(eq)
+
+                self.assertEqual(str(expected), str(actual))
+
+        stencil = [s / 4 for s in range(-400, 401)]
+        with self.subTest("sort terms on wide stencil without parsing subscripts"):
+            f_set = create_differentiand_symbols(create_coordinate_symbols(stencil))
+            expected = sp.Add(*[2 * f for f in f_set], evaluate=False)
+
+            eq = dot_product([2 for _ in f_set], f_set[::-1], evaluate=False)
+            with mock.patch(
+                "dictos.discrete.stencil.get_subscript",
+                side_effect=AssertionError("subscript is parsed"),
+            ):
+                actual = sort_by_subscript(eq)
+
+            self.assertEqual(str(expected), str(actual))
+
     def test_utils_drop_coefficient_of_1(self):
         """test suite for utils.drop_coefficient_of_1."""
         x, y, z = sp.symbols("x, y, z")
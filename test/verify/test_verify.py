@@ -0,0 +1,129 @@
+"""Tests for distos.verify.verify
+"""
+
+import sys
+
+sys.path.insert(1, "..")
+
+import unittest
+import numpy as np
+
+from dictos.core.grid_type import GridType
+from dictos.verify import verify
+from dictos.verify.exceptions import (
+    TooFewRefinementLevelsError,
+    NotUnivariateFunctionError,
+)
+
+
+class VerifyTest(unittest.TestCase):
+    def test_convergence(self):
+        """
+        test suite for verify.convergence.
+        """
+        results = verify.convergence(
+            deriv=[1, 2, 3],
+            acc=[2, 4],
+            grid_type=list(GridType),
+            func=["sin(x)", "exp(x)"],
+        )
+
+        with self.subTest("batch"):
+            self.assertEqual(len(results), 3 * 2 * 3 * 2)
+
+        for r in results:
+            with self.subTest(
+                f"{r['grid_type'].value} deriv={r['deriv']} acc={r['acc']} {r['func']}"
+            ):
+                self.assertEqual(r["predicted"], r["acc"])
+                self.assertTrue(r["converged"])
+                self.assertAlmostEqual(r["observed"][-1], r["acc"], delta=0.05)
+                self.assertEqual(r["errors"].shape, (4,))
+                self.assertEqual(r["observed"].shape, (3,))
+                np.testing.assert_allclose(r["errors"], r["estimates"], rtol=0.3)
+
+        with self.subTest("stencil"):
+            self.assertEqual(results[0]["stencil"], [-1, 0, 1])
+            self.assertEqual(results[2]["stencil"], [-0.5, 0.5])
+            np.testing.assert_allclose(results[0]["h"], [1.0, 0.5, 0.25, 0.125])
+
+    def test_convergence_on_points(self):
+        """
+        test suite for verify.convergence with user-specified arguments.
+        """
+        results = verify.convergence(
+            deriv=2, acc=2, func="cos(t)", levels=3, h=0.1, points=[0.0, 0.5]
+        )
+        r = results[0]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(r["errors"].shape, (3,))
+        self.assertAlmostEqual(r["observed"][-1], 2, delta=0.05)
+
+    def test_convergence_roundoff(self):
+        """
+        test suite for verify.convergence with errors reaching the round-off level.
+        """
+        r = verify.convergence(deriv=2, acc=6, h=0.1)[0]
+
+        self.assertLess(r["observed"][-1], 0)
+        self.assertEqual(r["resolved"].tolist(), [True, False, False])
+        self.assertTrue(r["converged"])
+
+    def test_convergence_exception(self):
+        """
+        test suite for exceptions in verify.convergence.
+        """
+        with self.subTest("levels"):
+            with self.assertRaises(TooFewRefinementLevelsError):
+                verify.convergence(levels=1)
+
+        with self.subTest("multivariate"):
+            with self.assertRaises(NotUnivariateFunctionError):
+                verify.convergence(func="sin(x)*y")
+
+    def test_package(self):
+        """
+        test suite for functions exported from dictos.verify.
+        """
+        import dictos.verify
+
+        self.assertIs(dictos.verify.convergence, verify.convergence)
+        self.assertIs(dictos.verify.format_report, verify.format_report)
+
+    def test_lazy_attribute(self):
+        """
+        test suite for dictos.verify accessed before importing the package.
+        """
+        import subprocess
+        import os
+
+        code = (
+            "import sys\n"
+            "import dictos\n"
+            "lazy = dictos.verify\n"
+            "import dictos.verify\n"
+            "assert lazy is sys.modules['dictos.verify']\n"
+            "assert dictos.verify is lazy\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+
+    def test_format_report(self):
+        """
+        test suite for verify.format_report.
+        """
+        report = verify.format_report(verify.convergence(deriv=1, acc=[2, 4]))
+        lines = report.splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertIn("observed", lines[0])
+        self.assertTrue(lines[1].startswith("regular"))
+        self.assertTrue(lines[2].endswith("True"))
+
+
+if __name__ == "__main__":
+    unittest.main()